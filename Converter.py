@@ -1,74 +1,42 @@
-import logging
-
 # ------------------------------
-# 🔧 Configure Logging (UTF-8 Safe)
+# 🧩 Conversion Core (re-exported)
 # ------------------------------
-logging.basicConfig(
-    filename="unit_converter.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    encoding="utf-8"  # ensures Unicode like → works
+# The registry and conversion functions live in unit_core, which has no import-time side effects;
+# logging is only configured once the interactive program actually starts.
+from unit_core import (  # noqa: F401
+    CONVERSIONS,
+    FACTOR_MATRIX,
+    FROM_CELSIUS,
+    TO_CELSIUS,
+    UNIT_INDEX,
+    ConversionPlan,
+    compile_conversion,
+    convert_array,
+    convert_many,
+    convert_temperature,
+    convert_value,
+    find_category,
+    temperature_affine,
 )
 
-# ------------------------------
-# ⚙️ Conversion Dictionaries
-# ------------------------------
-CONVERSIONS = {
-    "length": {"m": 1, "cm": 0.01, "mm": 0.001, "km": 1000, "in": 0.0254, "ft": 0.3048},
-    "mass": {"kg": 1, "g": 0.001, "lb": 0.453592, "tonne": 1000},
-    "force": {"n": 1, "kn": 1000, "lbf": 4.44822},
-    "pressure": {"pa": 1, "kpa": 1000, "bar": 1e5, "psi": 6894.76},
-    "volume": {"m3": 1, "l": 0.001, "cm3": 1e-6, "in3": 1.6387e-5},
-    "energy": {"j": 1, "kj": 1000, "mj": 1e6, "wh": 3600, "kwh": 3.6e6},
-    "power": {"w": 1, "kw": 1000, "mw": 1e6, "hp": 745.7},
-    "temperature": {"c": "Celsius", "f": "Fahrenheit", "k": "Kelvin"}
-}
-
-# ------------------------------
-# 🔄 Conversion Functions
-# ------------------------------
-def convert_value(value, from_unit, to_unit, category):
-    # Case-insensitive units
-    from_unit = from_unit.lower()
-    to_unit = to_unit.lower()
-
-    if category == "temperature":
-        return convert_temperature(value, from_unit, to_unit)
-
-    units = CONVERSIONS[category]
-    if from_unit not in units or to_unit not in units:
-        raise ValueError("Invalid unit entered.")
-
-    return value * (units[from_unit] / units[to_unit])
-
-def convert_temperature(value, from_unit, to_unit):
-    if from_unit == to_unit:
-        return value
-
-    # Convert to Celsius first
-    if from_unit == "f":
-        value = (value - 32) * 5 / 9
-    elif from_unit == "k":
-        value = value - 273.15
-
-    # Convert from Celsius to target
-    if to_unit == "f":
-        return (value * 9 / 5) + 32
-    elif to_unit == "k":
-        return value + 273.15
-    else:
-        return value
-
 # ------------------------------
 # 🧠 Main Program
 # ------------------------------
 def main():
+    import logging
+
+    import registry
+    from log_setup import configure_logging, log_conversion
+
+    configure_logging()  # queue-backed: records are formatted and written off the hot path
+    registry.use_config()  # $UNIT_CONVERTER_REGISTRY, if set, replaces the built-in tables
     print("🧮 ENGINEERING UNIT CONVERTER")
     print("------------------------------------------------")
 
     while True:
+        tables = registry.current()  # one snapshot per conversion, so a reload never mixes tables
         print("\nAvailable Categories:")
-        for i, cat in enumerate(CONVERSIONS.keys(), 1):
+        for i, cat in enumerate(tables.conversions.keys(), 1):
             print(f"{i}. {cat.capitalize()}")
         print("0. Exit")
 
@@ -82,13 +50,13 @@ def main():
             print("👋 Goodbye!")
             break
 
-        categories = list(CONVERSIONS.keys())
+        categories = list(tables.conversions.keys())
         if choice < 1 or choice > len(categories):
             print("⚠️ Invalid category. Try again.")
             continue
 
         category = categories[choice - 1]
-        available_units = ", ".join(CONVERSIONS[category].keys())
+        available_units = ", ".join(tables.conversions[category].keys())
         print(f"\nAvailable units for {category}: {available_units}")
 
         try:
@@ -96,20 +64,26 @@ def main():
             from_unit = input("From unit: ").strip()
             to_unit = input("To unit: ").strip()
 
-            result = convert_value(value, from_unit, to_unit, category)
+            result = tables.compile(category, from_unit, to_unit)(value)
 
             print(f"✅ {value} {from_unit} = {result:.6f} {to_unit}")
-            logging.info(f"{category.capitalize()}: {value} {from_unit} → {result:.6f} {to_unit}")
+            log_conversion(category.capitalize(), value, from_unit, result, to_unit)
 
         except ValueError as e:
             print(f"⚠️ Error: {e}")
-            logging.warning(f"Conversion error in {category}: {e}")
+            logging.warning("Conversion error in %s: %s", category, e)
         except Exception as e:
             print(f"⚠️ Unexpected error: {e}")
-            logging.error(f"Unexpected error: {e}")
+            logging.error("Unexpected error: %s", e)
 
 # ------------------------------
 # 🚀 Run
 # ------------------------------
 if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        # Non-interactive mode, e.g. `python Converter.py convert --in data.csv --col pressure --from psi --to kpa`
+        from bulk_convert import cli
+        sys.exit(cli(sys.argv[1:]))
     main()
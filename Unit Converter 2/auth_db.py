@@ -0,0 +1,126 @@
+import hashlib
+import hmac
+import os
+import queue
+import sqlite3
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+# ---------------- SETTINGS ----------------
+POOL_SIZE = 8
+BUSY_TIMEOUT_MS = 5000  # how long a writer waits on a locked database before giving up
+HASH_NAME = "sha256"
+HASH_TARGET_SECONDS = 0.05  # work factor is calibrated so one hash takes about this long
+MIN_ITERATIONS = 100_000
+
+# Constant SQL strings, so each pooled connection's statement cache reuses the prepared statements
+SQL_SCHEMA = 'CREATE TABLE IF NOT EXISTS users(username TEXT UNIQUE, password TEXT)'
+SQL_INSERT = 'INSERT INTO users(username, password, salt, iterations) VALUES (?, ?, ?, ?)'
+SQL_LOOKUP = 'SELECT password, salt, iterations FROM users WHERE username = ?'  # UNIQUE index lookup
+SQL_REHASH = 'UPDATE users SET password = ?, salt = ?, iterations = ? WHERE username = ?'
+
+
+# ---------------- PASSWORD HASHING ----------------
+@lru_cache(maxsize=1)
+def work_factor():
+    # PBKDF2 iterations for this machine, measured once per process and then cached
+    start = time.perf_counter()
+    hashlib.pbkdf2_hmac(HASH_NAME, b"calibration", b"0" * 16, MIN_ITERATIONS)
+    elapsed = time.perf_counter() - start
+    return max(MIN_ITERATIONS, int(MIN_ITERATIONS * HASH_TARGET_SECONDS / max(elapsed, 1e-6)))
+
+
+def hash_password(password, salt=None, iterations=None):
+    salt = salt or os.urandom(16)
+    iterations = iterations or work_factor()
+    digest = hashlib.pbkdf2_hmac(HASH_NAME, password.encode("utf-8"), salt, iterations)
+    return digest.hex(), salt, iterations
+
+
+@lru_cache(maxsize=1)
+def dummy_hash():
+    # (digest, salt, iterations) of a random password: unknown usernames are checked against it,
+    # so they cost one full hash too and response time doesn't reveal which usernames exist
+    return hash_password(os.urandom(16).hex())
+
+
+def verify_password(password, stored, salt, iterations):
+    if salt is None:
+        # Row from before hashing was introduced: the password column holds plain text
+        return hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+    digest, _, _ = hash_password(password, salt, iterations)
+    return hmac.compare_digest(digest, stored)
+
+
+# ---------------- CONNECTION POOL ----------------
+class ConnectionPool:
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.idle = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self.idle.put(self._connect())
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000,
+                               check_same_thread=False, cached_statements=64)
+        conn.execute('PRAGMA journal_mode=WAL')  # readers never block the writer, or each other
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        return conn
+
+    @contextmanager
+    def connection(self):
+        conn = self.idle.get()
+        try:
+            yield conn
+        finally:
+            self.idle.put(conn)
+
+    def close(self):
+        while not self.idle.empty():
+            self.idle.get_nowait().close()
+
+
+# ---------------- USER STORE ----------------
+class UserStore:
+    def __init__(self, path='users.db', pool_size=POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as conn:
+            conn.execute(SQL_SCHEMA)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(users)')}
+            # Older databases only have (username, password)
+            if 'salt' not in columns:
+                conn.execute('ALTER TABLE users ADD COLUMN salt BLOB')
+            if 'iterations' not in columns:
+                conn.execute('ALTER TABLE users ADD COLUMN iterations INTEGER')
+            conn.commit()
+        dummy_hash()  # computed now, so the first failed login isn't slower than the rest
+
+    def add_user(self, username, password):
+        digest, salt, iterations = hash_password(password)
+        try:
+            with self.pool.connection() as conn, conn:
+                conn.execute(SQL_INSERT, (username, digest, salt, iterations))
+            return True
+        except sqlite3.IntegrityError:
+            return False
+
+    def login(self, username, password):
+        with self.pool.connection() as conn:
+            row = conn.execute(SQL_LOOKUP, (username,)).fetchone()
+        if row is None:
+            verify_password(password, *dummy_hash())
+            return None
+        if not verify_password(password, *row):
+            return None
+
+        _, salt, iterations = row
+        if salt is None or iterations < work_factor() // 2:
+            # Upgrade plain-text or clearly under-strength hashes now that we know the password
+            with self.pool.connection() as conn, conn:
+                conn.execute(SQL_REHASH, (*hash_password(password), username))
+        return (username,)
+
+    def close(self):
+        self.pool.close()
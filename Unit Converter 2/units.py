@@ -1,74 +1,82 @@
 import streamlit as st
+import hashlib
+import io
 import logging
-import sqlite3
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(APP_DIR.parent))  # repo root: shared conversion core
+from log_setup import configure_logging, log_conversion, log_conversion_batch  # noqa: E402
 
 # ---------------- DATABASE SETUP ----------------
-conn = sqlite3.connect('users.db')
-c = conn.cursor()
+# One pooled, WAL-mode user store per server process, shared by every session (loaded on first use)
+@st.cache_resource
+def get_user_store():
+    from auth_db import UserStore
+
+    return UserStore('users.db')
 
 def create_usertable():
-    c.execute('CREATE TABLE IF NOT EXISTS users(username TEXT UNIQUE, password TEXT)')
-    conn.commit()
+    get_user_store()
 
 def add_userdata(username, password):
-    try:
-        c.execute('INSERT INTO users(username, password) VALUES (?, ?)', (username, password))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        return False
+    return get_user_store().add_user(username, password)
 
 def login_user(username, password):
-    c.execute('SELECT * FROM users WHERE username = ? AND password = ?', (username, password))
-    data = c.fetchone()
-    return data
+    return get_user_store().login(username, password)
+
+@st.cache_resource
+def get_history():
+    from history_store import HistoryWriter
+
+    return HistoryWriter()
 
 # ------------------------------ Logging ------------------------------
-logging.basicConfig(
-    filename="unit_converter.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    encoding="utf-8"
-)
+configure_logging()
 
 # ------------------------------ Conversion Data ------------------------------
-CONVERSIONS = {
-    "Length": {"m": 1, "cm": 0.01, "mm": 0.001, "km": 1000, "in": 0.0254, "ft": 0.3048},
-    "Mass": {"Kg": 1, "g": 0.001, "lb": 0.453592, "tonne": 1000},
-    "Force": {"N": 1, "Kn": 1000, "lbf": 4.44822},
-    "Pressure": {"Pa": 1, "Kpa": 1000, "bar": 1e5, "Psi": 6894.76},
-    "Volume": {"M3": 1, "L": 0.001, "cm3": 1e-6, "in3": 1.6387e-5},
-    "Energy": {"J": 1, "Kj": 1000, "MJ": 1e6, "Wh": 3600, "Kwh": 3.6e6},
-    "Power": {"W": 1, "Kw": 1000, "Mw": 1e6, "Hp": 745.7},
-    "Temperature": {"C": "Celsius", "F": "Fahrenheit", "K": "Kelvin"}
-}
+# Built-in tables, or the JSON config named by $UNIT_CONVERTER_REGISTRY (reloaded when it changes)
+@st.cache_resource
+def get_registry():
+    import registry
+
+    registry.use_config()
+    return registry
 
 # ------------------------------ Conversion Functions ------------------------------
+# Every unit pair is precompiled in the current registry snapshot and shared across reruns
 def convert_value(value, from_unit, to_unit, category):
-    if category == "Temperature":
-        return convert_temperature(value, from_unit, to_unit)
-    units = CONVERSIONS[category]
-    if from_unit not in units or to_unit not in units:
-        raise ValueError("Invalid unit entered.")
-    return value * (units[from_unit] / units[to_unit])
-
-def convert_temperature(value, from_unit, to_unit):
-    if from_unit == to_unit:
-        return value
-    if from_unit == "F":
-        value = (value - 32) * 5 / 9
-    elif from_unit == "K":
-        value = value - 273.15
-    if to_unit == "F":
-        return (value * 9 / 5) + 32
-    elif to_unit == "K":
-        return value + 273.15
-    return value
+    return get_registry().current().compile(category.lower(), from_unit, to_unit)(value)
+
+def first_time_this_session(key):
+    # Streamlit reruns the whole script on every interaction (even a download click);
+    # True only the first time this session sees key, so one upload is logged once
+    seen = st.session_state.setdefault("logged_batches", set())
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
+
+@st.cache_data(max_entries=32, show_spinner="Converting…")
+def convert_csv(data, column, from_unit, to_unit, category, version):
+    # Whole column in one vectorized pass; returns CSV bytes ready for download.
+    # `version` is the registry snapshot's, so a reload invalidates results from the old tables.
+    import pandas as pd
+
+    df = pd.read_csv(io.BytesIO(data))
+    plan = get_registry().current().compile(category.lower(), from_unit, to_unit)
+    df[column] = plan.apply(pd.to_numeric(df[column], errors="coerce").to_numpy())
+    return df.to_csv(index=False).encode("utf-8"), len(df)
+
+@st.cache_data
+def load_image(name):
+    return (APP_DIR / name).read_bytes()
 
 # ------------------------------ UI Setup ------------------------------
 st.set_page_config(page_title="⚙️ Engineering Unit Converter", page_icon="🌡️", layout="centered")
 
-st.markdown("""
+APP_CSS = """
 <style>
 body {
     background: linear-gradient(to right, #89f7fe, #66a6ff);
@@ -93,7 +101,8 @@ body {
     margin-top:40px;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 create_usertable()
 
@@ -116,7 +125,7 @@ def sign_up():
         else:
             if add_userdata(username, password):
                 st.success("✅ Account created successfully! You can now log in.")
-                logging.info(f"New user registered: {username}")
+                logging.info("New user registered: %s", username)
             else:
                 st.error("⚠️ Username already exists. Try another one.")
 
@@ -133,15 +142,15 @@ def login():
             st.session_state.current_user = username
             st.success(f"✅ Welcome back, {username}!")
             st.balloons()
-            logging.info(f"{username} logged in.")
+            logging.info("%s logged in.", username)
             st.rerun()
         else:
             st.error("❌ Invalid username or password.")
-            logging.warning(f"Failed login attempt for {username}")
+            logging.warning("Failed login attempt for %s", username)
 
 # ------------------------------ Converter ------------------------------
 def unit_converter():
-    st.image("ZachTechs.jpg", width=150)
+    st.image(load_image("ZachTechs.jpg"), width=150)
     st.image("https://cdn-icons-png.flaticon.com/512/4781/4781517.png", width=100)
     st.title("⚙️ Engineering Unit Converter")
     st.write(f"👋 Hello, **{st.session_state.current_user}**! Ready to convert?")
@@ -153,8 +162,9 @@ def unit_converter():
         logging.info("User logged out.")
         st.rerun()
 
-    category = st.selectbox("Select Category:", list(CONVERSIONS.keys()))
-    available_units = list(CONVERSIONS[category].keys())
+    tables = get_registry().current()
+    category = st.selectbox("Select Category:", [name.capitalize() for name in tables.conversions])
+    available_units = list(tables.conversions[category.lower()].keys())
     from_unit = st.selectbox("From Unit:", available_units)
     to_unit = st.selectbox("To Unit:", available_units)
     value = st.number_input("Enter Value:", value=0.0)
@@ -163,13 +173,39 @@ def unit_converter():
         try:
             result = convert_value(value, from_unit, to_unit, category)
             st.success(f"✅ {value} {from_unit} = {result:.6f} {to_unit}")
-            logging.info(f"{category}: {value} {from_unit} → {result:.6f} {to_unit} by {st.session_state.current_user}")
+            log_conversion(category, value, from_unit, result, to_unit, user=st.session_state.current_user)
+            get_history().record(category, from_unit, to_unit, value, result, st.session_state.current_user)
         except ValueError as e:
             st.error(f"⚠️ Error: {e}")
-            logging.warning(f"Conversion error by {st.session_state.current_user}: {e}")
+            logging.warning("Conversion error by %s: %s", st.session_state.current_user, e)
         except Exception as e:
             st.error(f"⚠️ Unexpected error: {e}")
-            logging.error(f"Unexpected error: {e}")
+            logging.error("Unexpected error: %s", e)
+
+    batch_upload(category, from_unit, to_unit, tables.version)
+
+def batch_upload(category, from_unit, to_unit, version):
+    st.subheader("📂 Convert a CSV Column")
+    uploaded = st.file_uploader("Upload a CSV file:", type="csv")
+    if uploaded is None:
+        return
+    import pandas as pd  # only loaded once a file is uploaded
+
+    data = uploaded.getvalue()
+    columns = list(pd.read_csv(io.BytesIO(data), nrows=0).columns)
+    column = st.selectbox("Column to convert:", columns)
+    try:
+        converted, rows = convert_csv(data, column, from_unit, to_unit, category, version)
+    except ValueError as e:
+        st.error(f"⚠️ Error: {e}")
+        return
+    st.success(f"✅ Converted {rows:,} rows of '{column}' from {from_unit} to {to_unit}")
+    st.download_button("⬇️ Download converted CSV", converted,
+                       file_name=f"converted_{uploaded.name}", mime="text/csv")
+    batch = (hashlib.sha256(data).hexdigest(), column, category, from_unit, to_unit)
+    if first_time_this_session(batch):
+        log_conversion_batch(category, from_unit, to_unit, rows, user=st.session_state.current_user)
+        get_history().record(category, from_unit, to_unit, user=st.session_state.current_user, count=rows)
 
 # ------------------------------ App Flow ------------------------------
 if not st.session_state.logged_in:
@@ -1,12 +1,14 @@
 # converter.py
+from unit_core import FOOT, INCH, LBF
+from unit_engine import DERIVED_CATEGORIES
 
 def convert_length(value, from_unit, to_unit):
     length_units = {
         'm': 1,
         'cm': 0.01,
         'mm': 0.001,
-        'inch': 0.0254,
-        'ft': 0.3048
+        'inch': INCH,
+        'ft': FOOT
     }
     return value * (length_units[from_unit] / length_units[to_unit])
 
@@ -15,18 +17,13 @@ def convert_force(value, from_unit, to_unit):
     force_units = {
         'N': 1,
         'kN': 1000,
-        'lbf': 4.44822
+        'lbf': LBF
     }
     return value * (force_units[from_unit] / force_units[to_unit])
 
 
 def convert_pressure(value, from_unit, to_unit):
-    pressure_units = {
-        'Pa': 1,
-        'kPa': 1000,
-        'bar': 100000,
-        'psi': 6894.76
-    }
+    pressure_units = DERIVED_CATEGORIES['pressure']
     return value * (pressure_units[from_unit] / pressure_units[to_unit])
 
 
@@ -42,11 +39,7 @@ def convert_temperature(value, from_unit, to_unit):
 
 
 def convert_torque(value, from_unit, to_unit):
-    torque_units = {
-        'N·m': 1,
-        'kgf·m': 9.80665,
-        'lbf·ft': 1.35582
-    }
+    torque_units = DERIVED_CATEGORIES['torque']
     return value * (torque_units[from_unit] / torque_units[to_unit])
 
 
@@ -1,15 +1,20 @@
 # converter_v3.py
+import sys
+from functools import lru_cache
+
+from unit_core import CUBIC_INCH, FOOT, INCH, LBF, POUND
+from unit_engine import DERIVED_CATEGORIES
 
 def convert_length(value, from_unit, to_unit):
-    units = {'m': 1, 'cm': 0.01, 'mm': 0.001, 'inch': 0.0254, 'ft': 0.3048}
+    units = {'m': 1, 'cm': 0.01, 'mm': 0.001, 'inch': INCH, 'ft': FOOT}
     return value * (units[from_unit] / units[to_unit])
 
 def convert_force(value, from_unit, to_unit):
-    units = {'N': 1, 'kN': 1000, 'lbf': 4.44822}
+    units = {'N': 1, 'kN': 1000, 'lbf': LBF}
     return value * (units[from_unit] / units[to_unit])
 
 def convert_pressure(value, from_unit, to_unit):
-    units = {'Pa': 1, 'kPa': 1000, 'bar': 100000, 'psi': 6894.76}
+    units = DERIVED_CATEGORIES['pressure']
     return value * (units[from_unit] / units[to_unit])
 
 def convert_temperature(value, from_unit, to_unit):
@@ -23,15 +28,15 @@ def convert_temperature(value, from_unit, to_unit):
         return value - 273.15 if to_unit == 'C' else (value - 273.15) * 9/5 + 32
 
 def convert_torque(value, from_unit, to_unit):
-    units = {'N·m': 1, 'kgf·m': 9.80665, 'lbf·ft': 1.35582}
+    units = DERIVED_CATEGORIES['torque']
     return value * (units[from_unit] / units[to_unit])
 
 def convert_mass(value, from_unit, to_unit):
-    units = {'kg': 1, 'g': 0.001, 'lb': 0.453592, 'tonne': 1000}
+    units = {'kg': 1, 'g': 0.001, 'lb': POUND, 'tonne': 1000}
     return value * (units[from_unit] / units[to_unit])
 
 def convert_volume(value, from_unit, to_unit):
-    units = {'m3': 1, 'L': 0.001, 'cm3': 1e-6, 'in3': 1.6387e-5}
+    units = {'m3': 1, 'L': 0.001, 'cm3': 1e-6, 'in3': CUBIC_INCH}
     return value * (units[from_unit] / units[to_unit])
 
 def convert_power(value, from_unit, to_unit):
@@ -47,9 +52,9 @@ def convert_energy(value, from_unit, to_unit):
 UNIT_HINTS = {
     'length': ['m', 'cm', 'mm', 'inch', 'ft'],
     'force': ['N', 'kN', 'lbf'],
-    'pressure': ['Pa', 'kPa', 'bar', 'psi'],
+    'pressure': list(DERIVED_CATEGORIES['pressure']),
     'temperature': ['C', 'F', 'K'],
-    'torque': ['N·m', 'kgf·m', 'lbf·ft'],
+    'torque': list(DERIVED_CATEGORIES['torque']),
     'mass': ['kg', 'g', 'lb', 'tonne'],
     'volume': ['m3', 'L', 'cm3', 'in3'],
     'power': ['W', 'kW', 'hp'],
@@ -57,18 +62,28 @@ UNIT_HINTS = {
 }
 
 
+# Menu choices, built once instead of on every prompt
+CATEGORIES = {
+    '1': ('length', convert_length),
+    '2': ('force', convert_force),
+    '3': ('pressure', convert_pressure),
+    '4': ('temperature', convert_temperature),
+    '5': ('torque', convert_torque),
+    '6': ('mass', convert_mass),
+    '7': ('volume', convert_volume),
+    '8': ('power', convert_power),
+    '9': ('energy', convert_energy),
+}
+CONVERTERS = dict(CATEGORIES.values())
+CATEGORY_BY_UNIT = {unit: category for category, units in UNIT_HINTS.items() for unit in units}
+
+MENU = ("\nAvailable categories:\n"
+        + "".join(f"{key}. {name.capitalize()}\n" for key, (name, _) in CATEGORIES.items())
+        + "0. Exit")
+
+
 def show_categories():
-    print("\nAvailable categories:")
-    print("1. Length")
-    print("2. Force")
-    print("3. Pressure")
-    print("4. Temperature")
-    print("5. Torque")
-    print("6. Mass")
-    print("7. Volume")
-    print("8. Power")
-    print("9. Energy")
-    print("0. Exit")
+    print(MENU)
 
 
 def main():
@@ -82,23 +97,11 @@ def main():
             print("\n👋 Exiting... Goodbye!")
             break
 
-        categories = {
-            '1': ('length', convert_length),
-            '2': ('force', convert_force),
-            '3': ('pressure', convert_pressure),
-            '4': ('temperature', convert_temperature),
-            '5': ('torque', convert_torque),
-            '6': ('mass', convert_mass),
-            '7': ('volume', convert_volume),
-            '8': ('power', convert_power),
-            '9': ('energy', convert_energy),
-        }
-
-        if choice not in categories:
+        if choice not in CATEGORIES:
             print("❌ Invalid choice. Try again.")
             continue
 
-        cat_name, func = categories[choice]
+        cat_name, func = CATEGORIES[choice]
         available_units = ', '.join(UNIT_HINTS[cat_name])
         print(f"\nAvailable units for {cat_name}: {available_units}")
 
@@ -116,5 +119,74 @@ def main():
             print(f"⚠️ Error: {e}\n")
 
 
+# ---------------- EXPRESSION MODE ----------------
+# echo "12 ft to m; 300 psi in kPa" | python UnitConverter2.py --expr
+BATCH_BYTES = 1 << 20  # stdin is read and answered in blocks of about this size
+CONNECTORS = ('to', 'in', '->', '→')
+
+
+@lru_cache(maxsize=4096)
+def compile_pair(from_unit, to_unit):
+    # (scale, offset) for a unit pair, taken from the convert_* functions once per pair
+    category = CATEGORY_BY_UNIT.get(from_unit)
+    if category is None or CATEGORY_BY_UNIT.get(to_unit) != category:
+        raise ValueError(f"Can't convert {from_unit} to {to_unit}.")
+    if category == 'temperature':
+        from unit_core import temperature_affine  # exact-as-possible affine maps, not probed floats
+
+        return temperature_affine(from_unit.lower(), to_unit.lower())
+    return CONVERTERS[category](1.0, from_unit, to_unit), 0.0
+
+
+@lru_cache(maxsize=4096)
+def parse_query(query):
+    # "ft to m" → (from, to, scale, offset); repeated expressions skip the parsing entirely
+    parts = query.split()
+    if len(parts) != 3 or parts[1] not in CONNECTORS:
+        raise ValueError("expected '<value> <unit> to <unit>'.")
+    scale, offset = compile_pair(parts[0], parts[2])
+    return parts[0], parts[2], scale, offset
+
+
+def evaluate(expression):
+    value, _, query = expression.strip().partition(' ')
+    from_unit, to_unit, scale, offset = parse_query(query.strip())
+    value = float(value)
+    return f"{value:g} {from_unit} = {value * scale + offset:.6f} {to_unit}"
+
+
+def run_expressions(text, out):
+    # Expressions are separated by ';' or newlines; results come out one per line, in order.
+    # Returns the number of expressions that failed (reported on stderr).
+    lines = []
+    errors = []
+    for expression in text.replace(';', '\n').split('\n'):
+        if not expression.strip():
+            continue
+        try:
+            lines.append(evaluate(expression))
+        except (ValueError, KeyError) as e:
+            errors.append(f"⚠️ {expression.strip()}: {e}")
+            lines.append("")  # keep output lines aligned with the input expressions
+    if lines:
+        out.write("\n".join(lines) + "\n")
+    if errors:
+        print("\n".join(errors), file=sys.stderr)
+    return len(errors)
+
+
+def expr_main(args):
+    if args:
+        failed = run_expressions(" ".join(args), sys.stdout)
+    else:
+        stdin = sys.stdin.buffer
+        failed = 0
+        for block in iter(lambda: stdin.readlines(BATCH_BYTES), []):
+            failed += run_expressions(b"".join(block).decode("utf-8"), sys.stdout)
+    return 1 if failed else 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--expr":
+        sys.exit(expr_main(sys.argv[2:]))
     main()
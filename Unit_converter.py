@@ -1,62 +1,59 @@
 import streamlit as st
+import hashlib
+import io
 import logging
 
+from log_setup import configure_logging, log_conversion, log_conversion_batch
+
 # --------------------------------
 # ⚙️ Configure Logging
 # --------------------------------
-logging.basicConfig(
-    filename="unit_converter.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    encoding="utf-8"
-)
+configure_logging()
 
 # --------------------------------
 # 🧩 Conversion Data
 # --------------------------------
-CONVERSIONS = {
-    "Length": {"m": 1, "cm": 0.01, "mm": 0.001, "km": 1000, "in": 0.0254, "ft": 0.3048},
-    "Mass": {"kg": 1, "g": 0.001, "lb": 0.453592, "tonne": 1000},
-    "Force": {"n": 1, "kn": 1000, "lbf": 4.44822},
-    "Pressure": {"pa": 1, "kpa": 1000, "bar": 1e5, "psi": 6894.76},
-    "Volume": {"m3": 1, "l": 0.001, "cm3": 1e-6, "in3": 1.6387e-5},
-    "Energy": {"j": 1, "kj": 1000, "mj": 1e6, "wh": 3600, "kwh": 3.6e6},
-    "Power": {"w": 1, "kw": 1000, "mw": 1e6, "hp": 745.7},
-    "Temperature": {"c": "Celsius", "f": "Fahrenheit", "k": "Kelvin"}
-}
+@st.cache_resource
+def get_registry():
+    # Built-in tables, or the JSON config named by $UNIT_CONVERTER_REGISTRY (reloaded when it changes)
+    import registry
+
+    registry.use_config()
+    return registry
 
 # --------------------------------
 # 🔄 Conversion Functions
 # --------------------------------
 def convert_value(value, from_unit, to_unit, category):
-    from_unit = from_unit.lower()
-    to_unit = to_unit.lower()
-
-    if category == "Temperature":
-        return convert_temperature(value, from_unit, to_unit)
-
-    units = CONVERSIONS[category]
-    if from_unit not in units or to_unit not in units:
-        raise ValueError("Invalid unit entered.")
-    return value * (units[from_unit] / units[to_unit])
-
-def convert_temperature(value, from_unit, to_unit):
-    if from_unit == to_unit:
-        return value
-
-    # Convert to Celsius first
-    if from_unit == "f":
-        value = (value - 32) * 5 / 9
-    elif from_unit == "k":
-        value = value - 273.15
-
-    # Convert from Celsius to target
-    if to_unit == "f":
-        return (value * 9 / 5) + 32
-    elif to_unit == "k":
-        return value + 273.15
-    else:
-        return value
+    # Precompiled plans of the current registry snapshot: one multiply-add per conversion
+    return get_registry().current().compile(category.lower(), from_unit, to_unit)(value)
+
+@st.cache_resource
+def get_history():
+    # One buffered writer per server process; rows are committed in batches
+    from history_store import HistoryWriter
+
+    return HistoryWriter()
+
+@st.cache_data(max_entries=32, show_spinner="Converting…")
+def convert_csv(data, column, from_unit, to_unit, category, version):
+    # Whole column in one vectorized pass; cached so reruns (e.g. the download click) don't redo it.
+    # `version` is the registry snapshot's, so a reload invalidates results from the old tables.
+    import pandas as pd
+
+    df = pd.read_csv(io.BytesIO(data))
+    plan = get_registry().current().compile(category.lower(), from_unit, to_unit)
+    df[column] = plan.apply(pd.to_numeric(df[column], errors="coerce").to_numpy())
+    return df.to_csv(index=False).encode("utf-8"), len(df)
+
+def first_time_this_session(key):
+    # Streamlit reruns the whole script on every interaction (even a download click);
+    # True only the first time this session sees key, so one upload is logged once
+    seen = st.session_state.setdefault("logged_batches", set())
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
 
 # --------------------------------
 # 🌐 Streamlit UI
@@ -66,9 +63,10 @@ st.set_page_config(page_title="Engineering Unit Converter", page_icon="🧮", la
 st.title("🧮 Engineering Unit Converter")
 st.write("Convert between different engineering units — length, mass, force, pressure, temperature, and more!")
 
-category = st.selectbox("Select a category:", list(CONVERSIONS.keys()))
+tables = get_registry().current()
+category = st.selectbox("Select a category:", [name.capitalize() for name in tables.conversions])
 
-units = list(CONVERSIONS[category].keys())
+units = list(tables.conversions[category.lower()].keys())
 col1, col2 = st.columns(2)
 with col1:
     from_unit = st.selectbox("From unit:", units)
@@ -81,20 +79,62 @@ if st.button("🔁 Convert"):
     try:
         result = convert_value(value, from_unit, to_unit, category)
         st.success(f"✅ {value} {from_unit} = {result:.6f} {to_unit}")
-        logging.info(f"{category}: {value} {from_unit} → {result:.6f} {to_unit}")
+        log_conversion(category, value, from_unit, result, to_unit)
+        get_history().record(category, from_unit, to_unit, value, result)
     except Exception as e:
         st.error(f"⚠️ Error: {e}")
-        logging.warning(f"Conversion error: {e}")
+        logging.warning("Conversion error: %s", e)
+
+# --------------------------------
+# 📂 Batch CSV Conversion
+# --------------------------------
+with st.expander("📂 Convert a whole CSV column"):
+    uploaded = st.file_uploader("Upload a CSV file:", type="csv")
+    if uploaded is not None:
+        import pandas as pd  # only loaded once a file is uploaded
+
+        data = uploaded.getvalue()
+        column = st.selectbox("Column to convert:", list(pd.read_csv(io.BytesIO(data), nrows=0).columns))
+        try:
+            converted, rows = convert_csv(data, column, from_unit, to_unit, category, tables.version)
+            st.success(f"✅ Converted {rows:,} rows of '{column}' from {from_unit} to {to_unit}")
+            st.download_button("⬇️ Download converted CSV", converted,
+                               file_name=f"converted_{uploaded.name}", mime="text/csv")
+            batch = (hashlib.sha256(data).hexdigest(), column, category, from_unit, to_unit)
+            if first_time_this_session(batch):
+                log_conversion_batch(category, from_unit, to_unit, rows)
+                get_history().record(category, from_unit, to_unit, count=rows)
+        except Exception as e:
+            st.error(f"⚠️ Error: {e}")
 
 # --------------------------------
 # 📜 Optional Log Viewer
 # --------------------------------
+@st.cache_resource
+def get_log_index():
+    from log_tail import LogIndex
+
+    return LogIndex("unit_converter.log")
+
 with st.expander("📜 View Recent Conversion Logs"):
     try:
-        with open("unit_converter.log", "r", encoding="utf-8") as log_file:
-            logs = log_file.readlines()[-10:]  # show last 10 logs
-            for entry in logs:
-                st.text(entry.strip())
+        if st.checkbox("Filter and page through history"):
+            index = get_log_index()
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                log_category = st.selectbox("Category:", ["All"] + index.categories())
+            with col2:
+                log_user = st.text_input("User:")
+            with col3:
+                page = st.number_input("Page:", min_value=1, value=1, step=1) - 1
+            logs = index.query(limit=10, page=page, user=log_user or None,
+                               category=None if log_category == "All" else log_category)
+        else:
+            from log_tail import tail_lines
+
+            logs = tail_lines("unit_converter.log", 10)  # show last 10 logs
+        for entry in logs:
+            st.text(entry.strip())
     except FileNotFoundError:
         st.info("No logs available yet.")
 # Footer
@@ -0,0 +1,37 @@
+# ------------------------------
+# ⏱️ convert_array vs. looping convert_value
+# ------------------------------
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from unit_core import convert_array, convert_value  # noqa: E402
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n=10_000_000, loop_n=1_000_000):
+    values = np.random.default_rng(0).uniform(0, 1000, n)
+    out = np.empty_like(values)
+    scalars = values[:loop_n].tolist()
+
+    for category, from_unit, to_unit in [("pressure", "psi", "kpa"), ("temperature", "f", "k")]:
+        loop = best_of(lambda: [convert_value(v, from_unit, to_unit, category) for v in scalars], 1)
+        loop_full = loop * (n / loop_n)  # extrapolated to n values
+        vec = best_of(lambda: convert_array(values, from_unit, to_unit, category, out=out))
+        print(f"{category:12s} {from_unit}->{to_unit}: loop≈{loop_full:.2f}s  "
+              f"vectorized={vec:.4f}s  speedup≈{loop_full / vec:.0f}x  (n={n:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# ------------------------------
+# ⏱️ Follow mode: append → converted-output latency while a writer appends at a fixed line rate
+# ------------------------------
+# The writer stamps each line with its append time; the sink reads the stamp of the first (oldest)
+# line of every batch, so the reported latency is the worst case within each batch.
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from follow_convert import follow  # noqa: E402
+from unit_core import compile_conversion  # noqa: E402
+
+TICK = 0.01  # writer appends one block of lines every 10 ms
+
+
+class LatencySink:
+    def __init__(self):
+        self.latencies = []
+        self.written = 0
+
+    def write(self, data):
+        now = time.time()
+        first = data[:data.find(b"\n")]
+        if first.startswith(b"{"):
+            self.latencies.append(now - json.loads(first)["t"])
+        elif first and not first.startswith(b"t,"):
+            self.latencies.append(now - float(first.split(b",", 1)[0]))
+        self.written += len(data)
+
+    def flush(self):
+        pass
+
+    def tell(self):
+        raise io.UnsupportedOperation("not seekable")  # behaves like a pipe: nothing to truncate on resume
+
+
+def writer(path, fmt, rate, seconds):
+    per_tick = max(1, int(rate * TICK))
+    # Pre-rendered blocks with a stamp placeholder, so the writer itself stays cheap
+    line = '{"t": {stamp}, "pressure": %d}\n' if fmt == "jsonl" else "{stamp},%d\n"
+    block = "".join(line % (k % 500) for k in range(per_tick))
+    with open(path, "a", encoding="utf-8") as f:
+        next_tick = time.perf_counter()
+        deadline = next_tick + seconds
+        while next_tick < deadline:
+            f.write(block.replace("{stamp}", repr(time.time())))
+            f.flush()
+            next_tick += TICK
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+
+def main(rate=100_000, seconds=5.0, fmt="csv"):
+    plan = compile_conversion("pressure", "psi", "kpa")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"readings.{fmt}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("t,pressure\n" if fmt == "csv" else "")
+        thread = threading.Thread(target=writer, args=(path, fmt, rate, seconds))
+        sink = LatencySink()
+        thread.start()
+        start = time.perf_counter()
+        stats = follow(path, sink, fmt, ["pressure"], plan, os.path.join(tmp, "ckpt"),
+                       poll_interval=0.005, idle_exit=0.2)
+        elapsed = time.perf_counter() - start
+        thread.join()
+
+    latencies = sorted(sink.latencies)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"{fmt}, target {rate:,.0f} lines/s for {seconds:.0f}s: converted {stats.rows:,} lines "
+          f"({stats.rows / elapsed:,.0f} lines/s) in {stats.batches:,} batches")
+    print(f"latency p50 {p50:.1f} ms, p99 {p99:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    # python benchmarks/bench_follow.py [lines/s] [seconds] [csv|jsonl]
+    args = sys.argv[1:]
+    main(*(float(arg) for arg in args[:2]), *args[2:3])
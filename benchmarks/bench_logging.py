@@ -0,0 +1,74 @@
+# ------------------------------
+# ⏱️ Logging overhead per conversion: basicConfig + f-strings vs. queue-backed deferred logging
+# ------------------------------
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import log_setup  # noqa: E402
+from unit_core import compile_conversion  # noqa: E402
+from log_setup import configure_logging, log_conversion, log_conversion_batch, shutdown_logging  # noqa: E402
+
+
+def reset_root():
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def timed(n, body):
+    start = time.perf_counter()
+    for i in range(n):
+        body(float(i))
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main(n=200_000):
+    plan = compile_conversion("pressure", "psi", "kpa")
+    no_log = timed(n, plan)
+    print(f"conversion only           : {no_log:6.2f} µs/conversion")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_root()
+        logging.basicConfig(filename=os.path.join(tmp, "sync.log"), level=logging.INFO,
+                            format=log_setup.TEXT_FORMAT, encoding="utf-8", force=True)
+
+        def sync_body(value):
+            result = plan(value)
+            logging.info(f"Pressure: {value} psi → {result:.6f} kpa")
+        sync = timed(n, sync_body)
+        print(f"basicConfig + f-string    : {sync - no_log:6.2f} µs/conversion logging overhead")
+
+        for structured in (False, True):
+            reset_root()
+            configure_logging(os.path.join(tmp, f"async-{structured}.log"), structured=structured)
+
+            def async_body(value):
+                log_conversion("Pressure", value, "psi", plan(value), "kpa")
+            caller = timed(n, async_body)
+            start = time.perf_counter()
+            shutdown_logging()  # wait for the writer thread to drain
+            drain = time.perf_counter() - start
+            label = "queue + JSONL" if structured else "queue + text"
+            print(f"{label:26s}: {caller - no_log:6.2f} µs/conversion on the caller "
+                  f"(+{drain:.2f}s drain after the loop)")
+
+        reset_root()
+        configure_logging(os.path.join(tmp, "batch.log"))
+        start = time.perf_counter()
+        for i in range(n):
+            plan(float(i))
+        log_conversion_batch("Pressure", "psi", "kpa", n, time.perf_counter() - start)
+        batch = (time.perf_counter() - start) / n * 1e6
+        print(f"one summary per batch     : {batch - no_log:6.2f} µs/conversion")
+        reset_root()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ------------------------------
+# ⏱️ 100 simultaneous simulated logins against a local users.db
+# ------------------------------
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Unit Converter 2"))
+from auth_db import UserStore, work_factor  # noqa: E402
+
+
+def main(users=100):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = UserStore(os.path.join(tmp, "users.db"))
+        for i in range(users):
+            store.add_user(f"engineer{i}", f"secret{i}")
+        print(f"work factor: {work_factor():,} PBKDF2 iterations")
+
+        barrier = threading.Barrier(users)
+        latencies, failures, errors = [], [], []
+
+        def attempt(i):
+            barrier.wait()
+            start = time.perf_counter()
+            try:
+                # Every fifth user mistypes their password
+                password = f"secret{i}" if i % 5 else "wrong"
+                ok = store.login(f"engineer{i}", password) is not None
+                if ok != bool(i % 5):
+                    failures.append(i)
+            except Exception as e:
+                errors.append(repr(e))
+            latencies.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=attempt, args=(i,)) for i in range(users)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        store.close()
+
+    latencies.sort()
+    print(f"{users} concurrent logins in {elapsed:.2f}s ({users / elapsed:.0f} logins/s)")
+    print(f"p50 {statistics.median(latencies) * 1000:.1f} ms, p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f} ms")
+    print(f"wrong results: {len(failures)}, errors (e.g. 'database is locked'): {len(errors)}")
+    for error in errors[:5]:
+        print(f"  {error}")
+
+
+if __name__ == "__main__":
+    main()
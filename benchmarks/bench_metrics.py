@@ -0,0 +1,32 @@
+# ------------------------------
+# ⏱️ Instrumentation overhead: metrics disabled vs. enabled (all calls timed, or 1 in N)
+# ------------------------------
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import metrics  # noqa: E402
+import unit_core  # noqa: E402
+
+
+def ns_per_call(number=500_000):
+    # Every call compiles through the plan hook, so enabled runs pay for the TimedPlan wrapper too
+    timer = timeit.Timer(lambda: unit_core.convert_value(123.456, "psi", "kpa", "pressure"))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main():
+    baseline = ns_per_call()
+    print(f"disabled          : {baseline:7.1f} ns/conversion")
+    for sample_every in (1, 10, 100):
+        metrics.enable(sample_every)
+        cost = ns_per_call()
+        metrics.disable()
+        print(f"enabled, 1 in {sample_every:<4d}: {cost:7.1f} ns/conversion (+{cost - baseline:.1f} ns)")
+    again = ns_per_call()
+    print(f"disabled again    : {again:7.1f} ns/conversion")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# ------------------------------
+# ⏱️ Registry hot reload: reader throughput with and without a config rewrite every 50 ms
+# ------------------------------
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import registry  # noqa: E402
+from unit_core import CONVERSIONS  # noqa: E402
+
+PAIRS = [("length", "ft", "m"), ("pressure", "psi", "kPa"), ("temperature", "f", "c"), ("power", "hp", "kW")]
+
+
+def reader(stop, counts, slot):
+    convert = registry.convert_value
+    n = 0
+    while not stop.is_set():
+        for category, from_unit, to_unit in PAIRS:
+            convert(123.456, from_unit, to_unit, category)
+        n += len(PAIRS)
+    counts[slot] = n
+
+
+def rewriter(path, stop, every, reloads):
+    config = json.loads(json.dumps(CONVERSIONS))
+    i = 0
+    while not stop.wait(every):
+        i += 1
+        config["length"][f"unit{i % 50}"] = 1.0 + i  # a changing table forces a real rebuild each time
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        os.replace(tmp, path)
+        reloads.append(i)
+
+
+def run(readers, seconds, path=None, every=0.05):
+    stop = threading.Event()
+    counts = [0] * readers
+    reloads = []
+    watcher = registry.watch(path, interval=every / 2) if path else None
+    threads = [threading.Thread(target=reader, args=(stop, counts, i)) for i in range(readers)]
+    if path:
+        threads.append(threading.Thread(target=rewriter, args=(path, stop, every, reloads)))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if watcher:
+        watcher.stop()
+    return sum(counts) / elapsed, len(reloads), registry.current().version
+
+
+def main(readers=4, seconds=3.0):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "units.json")
+        registry.main(["export", path])
+        quiet, _, _ = run(readers, seconds)
+        busy, rewrites, version = run(readers, seconds, path)
+    print(f"{readers} readers, {os.cpu_count()} CPUs")
+    print(f"no reloads      : {quiet:>12,.0f} conversions/s")
+    print(f"reload every 50ms: {busy:>12,.0f} conversions/s ({busy / quiet:.1%}), "
+          f"{rewrites} rewrites, snapshot version {version}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
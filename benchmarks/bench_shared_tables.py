@@ -0,0 +1,80 @@
+# ------------------------------
+# ⏱️ Shared-memory tables: worker startup time and total memory across N worker processes
+# ------------------------------
+# Each worker is a fresh interpreter that either builds its own tables (unit_core + alias index)
+# or attaches to the parent's shared segment, converts a few aliased pairs, reports its startup
+# time plus RSS/PSS, and stays alive until all workers have reported so memory is measured together.
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import shared_tables  # noqa: E402
+
+PAIRS = [("length", "ft", "m"), ("force", "Newton", "kN"), ("pressure", "psi", "kPa"),
+         ("temperature", "°C", "F"), ("power", "horsepower", "kW"), ("mass", "pound", "kg")]
+
+WORKER = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+if {shared!r}:
+    import shared_tables
+    compile_conversion = shared_tables.attach().compile_conversion
+else:
+    from unit_aliases import INDEX
+    from unit_core import compile_conversion
+    INDEX.expand_prefixes()
+for pair in {pairs!r}:
+    compile_conversion(*pair)(1.0)
+ready = time.perf_counter() - start
+memory = {{}}
+with open("/proc/self/smaps_rollup") as f:
+    for line in f:
+        key, _, rest = line.partition(":")
+        if key in ("Rss", "Pss"):
+            memory[key] = int(rest.split()[0])
+print('{{"ready_ms": %f, "Rss": %d, "Pss": %d}}' % (ready * 1000, memory["Rss"], memory["Pss"]), flush=True)
+sys.stdin.read()  # stay alive until the parent has heard from every worker
+"""
+
+
+def run_workers(count, shared):
+    code = WORKER.format(root=str(ROOT), shared=shared, pairs=PAIRS)
+    workers = [subprocess.Popen([sys.executable, "-c", code], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                text=True, env=os.environ.copy()) for _ in range(count)]
+    reports = [json.loads(worker.stdout.readline()) for worker in workers]
+    for worker in workers:
+        worker.stdin.close()
+        worker.wait()
+    return reports
+
+
+def summarize(label, reports):
+    ready = sorted(report["ready_ms"] for report in reports)
+    rss = sum(report.get("Rss", 0) for report in reports) / 1024
+    pss = sum(report.get("Pss", 0) for report in reports) / 1024
+    print(f"{label:<14}: startup median {ready[len(ready) // 2]:6.2f} ms, max {ready[-1]:6.2f} ms; "
+          f"total RSS {rss:7.1f} MB, total PSS {pss:7.1f} MB")
+    return pss
+
+
+def main(count=32):
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("⚠️ Needs Linux /proc/<pid>/smaps_rollup for the memory figures.")
+        return
+    print(f"{count} workers, {os.cpu_count()} CPUs")
+    own = summarize("own tables", run_workers(count, False))
+    start = time.perf_counter()
+    with shared_tables.publish() as published:
+        print(f"published {published.size:,} bytes in {(time.perf_counter() - start) * 1000:.1f} ms")
+        shared = summarize("shared tables", run_workers(count, True))
+    print(f"PSS saved across workers: {own - shared:.1f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
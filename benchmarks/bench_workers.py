@@ -0,0 +1,53 @@
+# ------------------------------
+# ⏱️ Sharded bulk conversion: speedup curve from 1 to 16 workers
+# ------------------------------
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from bulk_convert import convert_sharded, convert_stream  # noqa: E402
+from unit_core import compile_conversion  # noqa: E402
+
+WORKER_COUNTS = (1, 2, 4, 8, 12, 16)
+
+
+def make_csv(path, rows):
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("timestamp,pressure,temperature\n")
+        for i in range(rows):
+            f.write(f"{i},{rng.uniform(0, 500):.6f},{rng.uniform(-40, 120):.3f}\n")
+
+
+def main(rows=2_000_000):
+    plan = compile_conversion("pressure", "psi", "kpa")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "readings.csv")
+        make_csv(path, rows)
+        size_mb = os.path.getsize(path) / 1e6
+        print(f"{rows:,} rows, {size_mb:.0f} MB, {os.cpu_count()} CPUs")
+
+        start = time.perf_counter()
+        with open(path, encoding="utf-8", newline="") as source:
+            convert_stream(source, io.StringIO(), "csv", ["pressure"], plan)
+        streaming = time.perf_counter() - start
+        print(f"streaming : {streaming:6.2f}s  {rows / streaming:>12,.0f} rows/s")
+
+        baseline = None
+        for workers in WORKER_COUNTS:
+            start = time.perf_counter()
+            with open(os.devnull, "wb") as sink:
+                convert_sharded(path, sink, "csv", ["pressure"], plan, workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"workers={workers:<3d}: {elapsed:6.2f}s  {rows / elapsed:>12,.0f} rows/s  "
+                  f"speedup {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,90 @@
+# ------------------------------
+# ⏱️ Load test for server.py: p50/p99 latency and requests/s
+# ------------------------------
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+PAIRS = [("psi", "kPa"), ("ft", "m"), ("F", "C"), ("kWh", "J"), ("lb", "kg"), ("hp", "kW")]
+
+
+def build_request(host, path, payload):
+    body = json.dumps(payload).encode("utf-8")
+    head = (f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def make_payload(rng, batch):
+    if batch:
+        return "/convert/batch", {"items": [
+            {"value": rng.uniform(0, 1000), "from": f, "to": t} for f, t in rng.choices(PAIRS, k=batch)
+        ]}
+    f, t = rng.choice(PAIRS)
+    return "/convert", {"value": rng.uniform(0, 1000), "from": f, "to": t}
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, requests, latencies, failures, batch, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            path, payload = make_payload(rng, batch)
+            start = time.perf_counter()
+            writer.write(build_request(host, path, payload))
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, connections, requests, batch):
+    latencies, failures = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests, latencies, failures, batch, seed)
+                           for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = len(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(total - 1, int(total * 0.99))] * 1000
+    kind = f"batch of {batch}" if batch else "single"
+    print(f"{kind:>14s}: {total:,} requests over {connections} connections in {elapsed:.2f}s")
+    print(f"{'':>14s}  {total / elapsed:,.0f} req/s"
+          + (f", {total * batch / elapsed:,.0f} conversions/s" if batch else "")
+          + f", p50 {p50:.2f} ms, p99 {p99:.2f} ms, {len(failures)} non-200")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test a running `python server.py`")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200, help="requests per connection")
+    parser.add_argument("--batch", type=int, default=1000, help="items per /convert/batch request")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.host, args.port, args.connections, args.requests, 0))
+    asyncio.run(run(args.host, args.port, args.connections, max(1, args.requests // 10), args.batch))
+
+
+if __name__ == "__main__":
+    main()
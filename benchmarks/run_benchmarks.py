@@ -0,0 +1,224 @@
+# ------------------------------
+# ⏱️ Benchmark suite for every converter implementation
+# ------------------------------
+# Times scalar calls, batch throughput, cold import time and peak memory per category and
+# implementation, writes JSON, and fails when a metric regresses past --threshold vs. --baseline.
+#
+#   python benchmarks/run_benchmarks.py --output results.json
+#   python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+#   python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --threshold 0.15
+import argparse
+import ast
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# One representative pair per category, spelled the way each implementation's own tables spell it
+CASES = {
+    "length": ("ft", "m"),
+    "mass": ("lb", "kg"),
+    "force": ("lbf", "N"),
+    "pressure": ("psi", "kPa"),
+    "volume": ("L", "m3"),
+    "energy": ("kWh", "J"),
+    "power": ("hp", "kW"),
+    "temperature": ("F", "C"),
+    "torque": ("lbf·ft", "N·m"),
+}
+IMPORT_MODULES = ("unit_core", "Converter", "UnitConverter", "UnitConverter2", "unit_engine", "unit_aliases")
+
+
+# ------------------------------
+# 🧩 Implementations
+# ------------------------------
+def load_script_functions(path, names, namespace=None):
+    # Pull conversion functions out of a Streamlit script without running its UI; `namespace`
+    # stands in for the st.cache_resource helpers they call
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    keep = [node for node in tree.body
+            if (isinstance(node, ast.ImportFrom) and node.module == "unit_core")
+            or (isinstance(node, ast.FunctionDef) and node.name in names and not node.decorator_list)
+            or (isinstance(node, ast.Assign) and isinstance(node.value, (ast.Dict, ast.Constant))
+                and all(isinstance(t, ast.Name) and t.id.isupper() for t in node.targets))]
+    namespace = dict(namespace or {})
+    exec(compile(ast.Module(body=keep, type_ignores=[]), str(path), "exec"), namespace)
+    return namespace
+
+
+def implementations():
+    # {name: function(category) -> scalar converter or None when the category isn't supported}
+    import Converter
+    import UnitConverter
+    import UnitConverter2
+    import registry
+    import unit_engine
+
+    cached = {"get_registry": lambda: registry}
+    streamlit_app = load_script_functions(ROOT / "Unit_converter.py", {"convert_value"}, cached)
+    streamlit_app2 = load_script_functions(ROOT / "Unit Converter 2" / "units.py", {"convert_value"}, cached)
+
+    def core(convert_value, capitalize=False):
+        def factory(category):
+            if category not in Converter.CONVERSIONS:
+                return None
+            from_unit, to_unit = CASES[category]
+            name = category.capitalize() if capitalize else category
+            return lambda value: convert_value(value, from_unit, to_unit, name)
+        return factory
+
+    def per_category(module):
+        def factory(category):
+            func = getattr(module, f"convert_{category}", None)
+            if func is None:
+                return None
+            from_unit, to_unit = CASES[category]
+            return lambda value: func(value, from_unit, to_unit)
+        return factory
+
+    def engine(category):
+        if category == "temperature":
+            return None  # offset scales are not dimensional units
+        from_unit, to_unit = CASES[category]
+        return lambda value: unit_engine.convert_units(value, from_unit, to_unit)
+
+    return {
+        "Converter.convert_value": core(Converter.convert_value),
+        "Unit_converter.convert_value": core(streamlit_app["convert_value"], capitalize=True),
+        "units.convert_value": core(streamlit_app2["convert_value"], capitalize=True),
+        "UnitConverter.convert_*": per_category(UnitConverter),
+        "UnitConverter2.convert_*": per_category(UnitConverter2),
+        "unit_engine.convert_units": engine,
+    }
+
+
+def batch_functions(category):
+    # Dedicated batch entry points, measured alongside the plain loops
+    import Converter
+
+    if category not in Converter.CONVERSIONS:
+        return {}
+    from_unit, to_unit = CASES[category]
+    funcs = {"Converter.convert_many": lambda values: Converter.convert_many(values, from_unit, to_unit, category)}
+    try:
+        import numpy as np
+    except ImportError:
+        return funcs
+    funcs["Converter.convert_array"] = lambda values: Converter.convert_array(
+        np.asarray(values), from_unit, to_unit, category)
+    return funcs
+
+
+# ------------------------------
+# 📏 Measurements
+# ------------------------------
+def scalar_ns(func, number):
+    timer = timeit.Timer(lambda: func(123.456))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def batch_ns_per_value(func, values, is_batch):
+    run = (lambda: func(values)) if is_batch else (lambda: [func(v) for v in values])
+    best = min(timeit.repeat(run, repeat=3, number=1))
+    return best / len(values) * 1e9
+
+
+def peak_bytes(func, values, is_batch):
+    tracemalloc.start()
+    try:
+        func(values) if is_batch else [func(v) for v in values]
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def cold_import_ms(module, repeat=5):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    best = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        best = min(best, float(out.stdout.strip().splitlines()[-1]))
+    return best * 1000
+
+
+def run_suite(scalar_calls=50_000, batch_size=200_000):
+    results = {}
+    values = [float(i) for i in range(batch_size)]
+    for impl, factory in implementations().items():
+        for category in CASES:
+            func = factory(category)
+            if func is None:
+                continue
+            results[f"{impl}/{category}/scalar_ns"] = scalar_ns(func, scalar_calls)
+            results[f"{impl}/{category}/batch_ns_per_value"] = batch_ns_per_value(func, values, False)
+            results[f"{impl}/{category}/peak_bytes"] = peak_bytes(func, values, False)
+
+    for category in CASES:
+        for name, func in batch_functions(category).items():
+            results[f"{name}/{category}/batch_ns_per_value"] = batch_ns_per_value(func, values, True)
+            results[f"{name}/{category}/peak_bytes"] = peak_bytes(func, values, True)
+
+    for module in IMPORT_MODULES:
+        results[f"import/{module}/cold_ms"] = cold_import_ms(module)
+    return results
+
+
+# ------------------------------
+# 🚦 Baseline Comparison
+# ------------------------------
+def regressions(results, baseline, threshold):
+    # Every metric is lower-is-better; returns [(metric, baseline, current, ratio)]
+    found = []
+    for metric, old in baseline.items():
+        new = results.get(metric)
+        if new is not None and old > 0 and new > old * (1 + threshold):
+            found.append((metric, old, new, new / old))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="⏱️ Engineering Unit Converter benchmark suite")
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="allowed slowdown vs. the baseline, as a fraction (default: 0.20)")
+    parser.add_argument("--save-baseline", help="write these results as the new baseline")
+    parser.add_argument("--scalar-calls", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    started = time.time()
+    results = run_suite(args.scalar_calls, args.batch_size)
+    report = {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                 "started": started, "seconds": round(time.time() - started, 2)},
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(text, encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+        found = regressions(results, baseline, args.threshold)
+        for metric, old, new, ratio in found:
+            print(f"❌ {metric}: {old:,.1f} → {new:,.1f} ({ratio:.2f}x)", file=sys.stderr)
+        if found:
+            return 1
+        print(f"✅ No regressions beyond {args.threshold:.0%} against {args.baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import mmap
+import os
+
+from registry import compile_conversion
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+BLOCK_BYTES = mmap.PAGESIZE * 256  # page-aligned block; also the most the process keeps mapped at once per file
+DTYPES = {"float32": "<f4", "f4": "<f4", "float64": "<f8", "f8": "<f8"}
+
+
+# ------------------------------
+# 🗺️ Memory-Mapped Column Conversion
+# ------------------------------
+def _map(f, start, length, writable):
+    # Window onto one block; start is a multiple of the page size, as mmap offsets must be
+    access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+    return mmap.mmap(f.fileno(), length, offset=start, access=access)
+
+
+def _convert_block(plan, dtype, src_file, dst_file, start, length):
+    import numpy as np
+
+    src = _map(src_file, start, length, writable=dst_file is None)
+    dst = src
+    block = target = None
+    try:
+        if dst_file is not None:
+            dst = _map(dst_file, start, length, writable=True)
+        count = length // dtype.itemsize
+        block = np.frombuffer(src, dtype=dtype, count=count)
+        target = block if dst is src else np.frombuffer(dst, dtype=dtype, count=count)
+        plan.apply(block, out=target)
+    finally:
+        block = target = None  # release the buffer exports before unmapping
+        if dst is not src:
+            dst.close()
+        src.close()
+
+
+def convert_binary(path, from_unit, to_unit, category, dtype="float64", out_path=None,
+                   block_bytes=BLOCK_BYTES):
+    # Convert a flat little-endian float column in place, or into out_path; returns the value count
+    import numpy as np
+
+    plan = compile_conversion(category, from_unit, to_unit)
+    dtype = np.dtype(DTYPES.get(dtype, dtype))
+    if dtype.kind != "f":
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    block_bytes -= block_bytes % mmap.PAGESIZE
+    if block_bytes <= 0:
+        raise ValueError(f"block_bytes must be at least one page ({mmap.PAGESIZE} bytes).")
+
+    size = os.path.getsize(path)
+    if size % dtype.itemsize:
+        raise ValueError(f"{path} is {size} bytes, not a multiple of the {dtype} item size.")
+
+    # Opening the source itself with "w+b" would truncate it before a single value is read
+    in_place = out_path is None or (os.path.exists(out_path) and os.path.samefile(path, out_path))
+    with open(path, "r+b" if in_place else "rb") as src_file:
+        dst_file = None if in_place else open(out_path, "w+b")
+        try:
+            if dst_file is not None:
+                dst_file.truncate(size)
+            for start in range(0, size, block_bytes):
+                _convert_block(plan, dtype, src_file, dst_file, start, min(block_bytes, size - start))
+            # One writeback for the whole file instead of an msync per block
+            os.fsync((src_file if in_place else dst_file).fileno())
+        finally:
+            if dst_file is not None:
+                dst_file.close()
+
+    return size // dtype.itemsize
@@ -0,0 +1,346 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from registry import compile_conversion, find_category, use_config
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+CHUNK_SIZE = 10_000  # rows per chunk; memory use is bounded by this, not by the input size
+SHARD_BYTES = 32 * 1024 * 1024  # upper bound on one worker's byte range
+SHARDS_PER_WORKER = 4  # extra ranges per worker so uneven ranges still balance out
+
+
+# ------------------------------
+# 🔎 Helpers
+# ------------------------------
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def guess_format(path):
+    return "jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+class Stats:
+    __slots__ = ("rows", "skipped")
+
+    def __init__(self):
+        self.rows = 0
+        self.skipped = 0  # non-numeric cells left untouched
+
+
+# ------------------------------
+# 🔄 Chunk Converters
+# ------------------------------
+def convert_csv_rows(rows, indexes, plan, stats):
+    for row in rows:
+        for i in indexes:
+            if i < len(row) and row[i]:
+                try:
+                    row[i] = plan(float(row[i]))
+                except ValueError:
+                    stats.skipped += 1
+    stats.rows += len(rows)
+    return rows
+
+
+def convert_jsonl_lines(lines, columns, plan, stats):
+    out = []
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        for col in columns:
+            value = record.get(col)
+            if value is None:
+                continue
+            try:
+                record[col] = plan(float(value))
+            except (TypeError, ValueError):
+                stats.skipped += 1
+        out.append(json.dumps(record, ensure_ascii=False))
+        stats.rows += 1
+    return "\n".join(out) + "\n" if out else ""
+
+
+def csv_column_indexes(header, columns):
+    missing = [col for col in columns if col not in header]
+    if missing:
+        raise ValueError(f"Column(s) not found in header: {', '.join(missing)}")
+    return [header.index(col) for col in columns]
+
+
+def render_csv(rows):
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerows(rows)
+    return buf.getvalue()
+
+
+# ------------------------------
+# 🌊 Streaming Pipelines
+# ------------------------------
+def stream_csv(source, columns, plan, stats, chunk_size=CHUNK_SIZE):
+    reader = csv.reader(source)
+    header = next(reader, None)
+    if header is None:
+        return
+    indexes = csv_column_indexes(header, columns)
+    yield render_csv([header])
+    for chunk in batched(reader, chunk_size):
+        yield render_csv(convert_csv_rows(chunk, indexes, plan, stats))
+
+
+def stream_jsonl(source, columns, plan, stats, chunk_size=CHUNK_SIZE):
+    for chunk in batched(source, chunk_size):
+        yield convert_jsonl_lines(chunk, columns, plan, stats)
+
+
+STREAMERS = {"csv": stream_csv, "jsonl": stream_jsonl}
+
+
+def convert_stream(source, sink, fmt, columns, plan, chunk_size=CHUNK_SIZE):
+    stats = Stats()
+    for text in STREAMERS[fmt](source, columns, plan, stats, chunk_size):
+        sink.write(text)
+    return stats
+
+
+# ------------------------------
+# 🧵 Sharded (Multi-Process) Conversion
+# ------------------------------
+def split_ranges(path, workers, start=0):
+    # Newline-aligned [begin, end) byte ranges covering path from offset start
+    size = os.path.getsize(path)
+    if size <= start:
+        return []
+    target = max(1, min(SHARD_BYTES, (size - start) // (workers * SHARDS_PER_WORKER) or 1))
+    ranges = []
+    with open(path, "rb") as f:
+        begin = start
+        while begin < size:
+            end = begin + target
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()  # move to the start of the next line
+                end = min(f.tell(), size)
+            ranges.append((begin, end))
+            begin = end
+    return ranges
+
+
+def header_end(path):
+    with open(path, "rb") as f:
+        header = f.readline()
+    return len(header), header.decode("utf-8")
+
+
+def convert_range(path, begin, end, fmt, columns, plan):
+    # Runs in a worker process: convert one byte range and hand back the encoded output
+    with open(path, "rb") as f:
+        f.seek(begin)
+        text = f.read(end - begin).decode("utf-8")
+
+    stats = Stats()
+    lines = text.splitlines()
+    if fmt == "csv":
+        rows = convert_csv_rows(list(csv.reader(lines)), columns, plan, stats)
+        out = render_csv(rows)
+    else:
+        out = convert_jsonl_lines(lines, columns, plan, stats)
+    return out.encode("utf-8"), stats.rows, stats.skipped
+
+
+def convert_sharded(path, sink, fmt, columns, plan, workers):
+    # sink is a binary stream; output order matches input order
+    stats = Stats()
+    start = 0
+    if fmt == "csv":
+        start, header = header_end(path)
+        if not header:
+            return stats
+        columns = csv_column_indexes(next(csv.reader([header])), columns)
+        sink.write(header.rstrip("\r\n").encode("utf-8") + b"\n")
+
+    ranges = split_ranges(path, workers, start)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for begin, end in ranges:
+            pending.append(pool.submit(convert_range, path, begin, end, fmt, columns, plan))
+            # Keep a bounded window in flight so finished-but-unwritten output can't pile up
+            if len(pending) >= workers * 2:
+                write_result(pending.popleft().result(), sink, stats)
+        while pending:
+            write_result(pending.popleft().result(), sink, stats)
+    return stats
+
+
+def write_result(result, sink, stats):
+    data, rows, skipped = result
+    sink.write(data)
+    stats.rows += rows
+    stats.skipped += skipped
+
+
+# ------------------------------
+# 🖥️ Command Line
+# ------------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(prog="Converter.py", description="🧮 Engineering Unit Converter")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert columns of a CSV/JSONL file or stdin")
+    convert.add_argument("--in", dest="input", default="-", help="input file (default: stdin)")
+    convert.add_argument("--out", dest="output", default="-", help="output file (default: stdout)")
+    convert.add_argument("--col", dest="columns", action="append", required=True,
+                         help="column/field to convert (repeatable)")
+    convert.add_argument("--from", dest="from_unit", required=True)
+    convert.add_argument("--to", dest="to_unit", required=True)
+    convert.add_argument("--category", help="unit category (default: inferred from the units)")
+    convert.add_argument("--format", choices=sorted(STREAMERS), help="default: from the file extension, else csv")
+    convert.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    convert.add_argument("--workers", type=int, default=1,
+                         help="convert newline-aligned byte ranges of --in in N processes "
+                              "(needs a file; CSV fields must not contain embedded newlines)")
+
+    binary = commands.add_parser("convert-binary",
+                                 help="Convert a raw little-endian float32/float64 column file via mmap")
+    binary.add_argument("--in", dest="input", required=True, help="binary column file")
+    binary.add_argument("--out", dest="output", help="output file (default: convert --in in place)")
+    binary.add_argument("--dtype", choices=["float32", "float64"], default="float64")
+    binary.add_argument("--from", dest="from_unit", required=True)
+    binary.add_argument("--to", dest="to_unit", required=True)
+    binary.add_argument("--category", help="unit category (default: inferred from the units)")
+
+    follow = commands.add_parser("follow", help="Keep converting records appended to a growing CSV/JSONL file")
+    follow.add_argument("--in", dest="input", required=True, help="file to follow")
+    follow.add_argument("--out", dest="output", default="-", help="output file, appended to (default: stdout)")
+    follow.add_argument("--col", dest="columns", action="append", required=True,
+                        help="column/field to convert (repeatable)")
+    follow.add_argument("--from", dest="from_unit", required=True)
+    follow.add_argument("--to", dest="to_unit", required=True)
+    follow.add_argument("--category", help="unit category (default: inferred from the units)")
+    follow.add_argument("--format", choices=sorted(STREAMERS), help="default: from the file extension, else csv")
+    follow.add_argument("--checkpoint", help="byte-offset checkpoint file (default: <in>.ckpt)")
+    follow.add_argument("--poll", type=float, default=0.05, help="seconds between checks for new data")
+    follow.add_argument("--idle-exit", type=float, help="stop after this many seconds without new data")
+    return parser
+
+
+def open_text(path, mode):
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        stream.reconfigure(encoding="utf-8", newline="")
+        return stream
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def run_convert(args):
+    category = args.category.lower() if args.category else find_category(args.from_unit, args.to_unit)
+    plan = compile_conversion(category, args.from_unit, args.to_unit)
+    fmt = args.format or guess_format(args.input)
+
+    start = time.perf_counter()
+    if args.workers > 1:
+        if args.input == "-":
+            raise ValueError("--workers needs a seekable --in file, not stdin.")
+        sink = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        try:
+            stats = convert_sharded(args.input, sink, fmt, args.columns, plan, args.workers)
+        finally:
+            if sink is sys.stdout.buffer:
+                sink.flush()
+            else:
+                sink.close()
+        return stats, time.perf_counter() - start
+
+    source = open_text(args.input, "r")
+    sink = open_text(args.output, "w")
+    try:
+        stats = convert_stream(source, sink, fmt, args.columns, plan, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        else:
+            sink.flush()
+    return stats, time.perf_counter() - start
+
+
+def run_convert_binary(args):
+    from binary_convert import convert_binary
+
+    category = args.category.lower() if args.category else find_category(args.from_unit, args.to_unit)
+    start = time.perf_counter()
+    stats = Stats()
+    stats.rows = convert_binary(args.input, args.from_unit, args.to_unit, category,
+                                dtype=args.dtype, out_path=args.output)
+    return stats, time.perf_counter() - start
+
+
+def run_follow(args):
+    from follow_convert import follow
+
+    category = args.category.lower() if args.category else find_category(args.from_unit, args.to_unit)
+    plan = compile_conversion(category, args.from_unit, args.to_unit)
+    fmt = args.format or guess_format(args.input)
+
+    start = time.perf_counter()
+    sink = sys.stdout.buffer if args.output == "-" else open(args.output, "ab")
+    try:
+        stats = follow(args.input, sink, fmt, args.columns, plan, args.checkpoint,
+                       poll_interval=args.poll, idle_exit=args.idle_exit)
+    finally:
+        if sink is not sys.stdout.buffer:
+            sink.close()
+    print(f"📦 {stats.batch_summary()}", file=sys.stderr)
+    return stats, time.perf_counter() - start
+
+
+COMMANDS = {"convert": run_convert, "convert-binary": run_convert_binary, "follow": run_follow}
+
+
+def report(stats, elapsed):
+    rate = stats.rows / elapsed if elapsed > 0 else float("inf")
+    message = f"✅ Converted {stats.rows:,} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+    if stats.skipped:
+        message += f", {stats.skipped:,} non-numeric cells left unchanged"
+    print(message, file=sys.stderr)
+
+
+def cli(argv=None):
+    args = build_parser().parse_args(argv)
+    use_config()  # $UNIT_CONVERTER_REGISTRY, if set, replaces the built-in tables
+    try:
+        stats, elapsed = COMMANDS[args.command](args)
+    except (ValueError, OSError) as e:
+        print(f"⚠️ Error: {e}", file=sys.stderr)
+        return 1
+    report(stats, elapsed)
+    # Logging is loaded only now, so worker processes and imports of this module stay light
+    from log_setup import configure_logging, log_conversion_batch
+
+    configure_logging()
+    category = args.category or find_category(args.from_unit, args.to_unit)
+    log_conversion_batch(category.capitalize(), args.from_unit, args.to_unit, stats.rows, round(elapsed, 3))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,110 @@
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+from unit_core import UNIT_INDEX, _legacy_key
+
+# ------------------------------
+# 📏 Exact Defining Constants
+# ------------------------------
+# The same legal definitions as unit_core's constants, as rationals instead of binary floats
+INCH = Fraction("0.0254")
+FOOT = 12 * INCH
+POUND = Fraction("0.45359237")
+STANDARD_GRAVITY = Fraction("9.80665")
+POUND_FORCE = POUND * STANDARD_GRAVITY
+
+EXACT_FACTORS = {
+    "length": {"m": 1, "cm": Fraction(1, 100), "mm": Fraction(1, 1000), "km": 1000, "in": INCH, "ft": FOOT},
+    "mass": {"kg": 1, "g": Fraction(1, 1000), "lb": POUND, "tonne": 1000},
+    "force": {"n": 1, "kn": 1000, "lbf": POUND_FORCE},
+    "pressure": {"pa": 1, "kpa": 1000, "bar": 10 ** 5, "psi": POUND_FORCE / INCH ** 2},
+    "volume": {"m3": 1, "l": Fraction(1, 1000), "cm3": Fraction(1, 10 ** 6), "in3": INCH ** 3},
+    "energy": {"j": 1, "kj": 1000, "mj": 10 ** 6, "wh": 3600, "kwh": 3_600_000},
+    "power": {"w": 1, "kw": 1000, "mw": 10 ** 6, "hp": 550 * FOOT * POUND_FORCE},  # mechanical horsepower
+}
+# Temperature units as (scale, offset) to kelvin: kelvin = value * scale + offset
+EXACT_TEMPERATURE = {
+    "k": (Fraction(1), Fraction(0)),
+    "c": (Fraction(1), Fraction("273.15")),
+    "f": (Fraction(5, 9), Fraction("273.15") - Fraction(32 * 5, 9)),
+}
+
+
+# ------------------------------
+# 🧮 Exact Conversion Plans
+# ------------------------------
+def to_fraction(value):
+    # Strings and Decimals keep their written digits; floats convert to their exact binary value
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, (int, Decimal)):
+        return Fraction(value)
+    return Fraction(str(value)) if isinstance(value, str) else Fraction(value)
+
+
+class ExactPlan:
+    # value * scale + offset with rational scale/offset, kept as integer numerators/denominators
+    __slots__ = ("category", "from_unit", "to_unit", "scale", "offset", "_terms")
+
+    def __init__(self, category, from_unit, to_unit, scale, offset=Fraction(0)):
+        self.category = category
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.scale = Fraction(scale)
+        self.offset = Fraction(offset)
+        # Pre-split into integers: (n/d) * p/q + r/s = (n*p*s + r*q*d) / (d*q*s)
+        self._terms = (self.scale.numerator, self.scale.denominator,
+                       self.offset.numerator, self.offset.denominator)
+
+    def __call__(self, value):
+        return to_fraction(value) * self.scale + self.offset
+
+    def apply(self, values):
+        # Batch path: integer arithmetic per value and a single normalization when building each result
+        p, q, r, s = self._terms
+        ps, qs, rq = p * s, q * s, r * q
+        out = []
+        append = out.append
+        for value in values:
+            # int, float, Decimal and Fraction all expose their exact ratio without building a Fraction
+            n, d = Fraction(value).as_integer_ratio() if isinstance(value, str) else value.as_integer_ratio()
+            append(Fraction(n * ps + rq * d, d * qs))
+        return out
+
+    def apply_decimal(self, values, places=12):
+        # Like apply(), rounded half-even to `places` decimal places for reports
+        quantum = Decimal(1).scaleb(-places)
+        return [(Decimal(v.numerator) / Decimal(v.denominator)).quantize(quantum) for v in self.apply(values)]
+
+    def __repr__(self):
+        return (f"ExactPlan({self.category!r}, {self.from_unit!r} → {self.to_unit!r}, "
+                f"scale={self.scale}, offset={self.offset})")
+
+
+@lru_cache(maxsize=1024)
+def compile_exact(category, from_unit, to_unit):
+    # Same unit spellings as compile_conversion; the composite rational is computed once per pair
+    category = category.lower()
+    if category not in UNIT_INDEX:
+        raise ValueError(f"Unknown category: {category}")
+    index = UNIT_INDEX[category]
+    from_unit = _legacy_key(from_unit.lower(), index)
+    to_unit = _legacy_key(to_unit.lower(), index)
+    if from_unit not in index or to_unit not in index:
+        raise ValueError("Invalid unit entered.")
+
+    if category == "temperature":
+        from_scale, from_offset = EXACT_TEMPERATURE[from_unit]
+        to_scale, to_offset = EXACT_TEMPERATURE[to_unit]
+        return ExactPlan(category, from_unit, to_unit, from_scale / to_scale, (from_offset - to_offset) / to_scale)
+    units = EXACT_FACTORS[category]
+    return ExactPlan(category, from_unit, to_unit, Fraction(units[from_unit]) / Fraction(units[to_unit]))
+
+
+def convert_exact(value, from_unit, to_unit, category):
+    return compile_exact(category, from_unit, to_unit)(value)
+
+
+def convert_exact_many(values, from_unit, to_unit, category):
+    return compile_exact(category, from_unit, to_unit).apply(values)
@@ -0,0 +1,153 @@
+import csv
+import json
+import os
+import sys
+import time
+
+from bulk_convert import Stats, convert_csv_rows, convert_jsonl_lines, csv_column_indexes, render_csv
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+BATCH_BYTES = 4 * 1024 * 1024  # most appended bytes converted per batch
+POLL_INTERVAL = 0.05  # seconds between size checks while the file isn't growing
+CHECKPOINT_SUFFIX = ".ckpt"
+
+
+class FollowStats(Stats):
+    # Append → output latency needs per-record write times, which only the writer knows;
+    # benchmarks/bench_follow.py measures it from timestamps inside the records
+    __slots__ = ("batches", "largest_batch")
+
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+        self.largest_batch = 0  # lines
+
+    def observe(self, lines):
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, lines)
+
+    def batch_summary(self):
+        mean = self.rows / self.batches if self.batches else 0.0
+        return f"{self.batches:,} batches, mean {mean:,.0f} lines, largest {self.largest_batch:,} lines"
+
+
+# ------------------------------
+# 📍 Checkpoints
+# ------------------------------
+class Checkpoint:
+    # Byte offset of the first unconverted input byte, plus what's needed to resume exactly there
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.inode = None
+        self.output_bytes = None  # output file size matching `offset`; None when writing to a pipe
+        self.header = None  # CSV header row, so a resumed run knows the column positions
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            self.offset = state["offset"]
+            self.inode = state.get("inode")
+            self.output_bytes = state.get("output_bytes")
+            self.header = state.get("header")
+
+    def save(self):
+        # Write-then-rename: a crash leaves either the old or the new checkpoint, never half of one
+        state = {"offset": self.offset, "inode": self.inode, "output_bytes": self.output_bytes,
+                 "header": self.header}
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+# ------------------------------
+# 👀 Follow Loop
+# ------------------------------
+def convert_lines(lines, fmt, indexes, columns, plan, stats):
+    if fmt == "csv":
+        return render_csv(convert_csv_rows(list(csv.reader(lines)), indexes, plan, stats))
+    return convert_jsonl_lines(lines, columns, plan, stats)
+
+
+def follow(path, sink, fmt, columns, plan, checkpoint_path=None, batch_bytes=BATCH_BYTES,
+           poll_interval=POLL_INTERVAL, idle_exit=None, stop=None):
+    # Convert records appended to `path` as they arrive. `sink` is a binary stream; progress is
+    # checkpointed after every batch, so a restarted run continues at the first unconverted line.
+    # Stops after `idle_exit` seconds without growth, when stop() is true, or on Ctrl-C.
+    checkpoint = Checkpoint(checkpoint_path or path + CHECKPOINT_SUFFIX)
+    stats = FollowStats()
+    indexes = None
+    idle_since = time.monotonic()
+
+    with open(path, "rb") as source:
+        inode = os.fstat(source.fileno()).st_ino
+        if checkpoint.inode not in (None, inode) or checkpoint.offset > os.fstat(source.fileno()).st_size:
+            print(f"⚠️ {path} was replaced or truncated; starting from the beginning", file=sys.stderr)
+            checkpoint.offset, checkpoint.header, checkpoint.output_bytes = 0, None, None
+        checkpoint.inode = inode
+        # After the replacement check, so output from the old file is kept rather than rewound
+        resume_output(sink, checkpoint)
+        source.seek(checkpoint.offset)
+        try:
+            while not (stop and stop()):
+                info = os.fstat(source.fileno())
+                data = b""
+                if info.st_size > checkpoint.offset:
+                    data = source.read(min(batch_bytes, info.st_size - checkpoint.offset))
+                end = data.rfind(b"\n") + 1
+                if not end:
+                    # Nothing new, or only a partial line so far: wait for its newline
+                    source.seek(checkpoint.offset)
+                    if len(data) >= batch_bytes:
+                        batch_bytes *= 2  # one line longer than a whole batch
+                    if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                source.seek(checkpoint.offset + end)
+                lines = data[:end].decode("utf-8").splitlines()
+
+                out = []
+                if fmt == "csv" and checkpoint.header is None:
+                    checkpoint.header = next(csv.reader([lines.pop(0)]))
+                    out.append(render_csv([checkpoint.header]))
+                if fmt == "csv" and indexes is None:
+                    indexes = csv_column_indexes(checkpoint.header, columns)
+                out.append(convert_lines(lines, fmt, indexes, columns, plan, stats))
+                sink.write("".join(out).encode("utf-8"))
+                sink.flush()
+
+                checkpoint.offset += end
+                checkpoint.output_bytes = output_size(sink)
+                checkpoint.save()
+                stats.observe(len(lines))
+                idle_since = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+    return stats
+
+
+def output_size(sink):
+    try:
+        return sink.tell()
+    except (OSError, ValueError):
+        return None  # pipes and terminals can't be rewound
+
+
+def resume_output(sink, checkpoint):
+    # Drop output written after the last checkpoint (a crash between write and save) so no line repeats.
+    # A fresh start appends to whatever the output already holds.
+    size = output_size(sink)
+    if size is None:
+        return
+    keep = checkpoint.output_bytes if checkpoint.offset else None
+    if keep is None or keep > size:
+        sink.seek(0, os.SEEK_END)
+        return
+    if size > keep:
+        sink.truncate(keep)
+    sink.seek(keep)
@@ -0,0 +1,161 @@
+import argparse
+import sys
+import time
+import warnings
+
+from unit_core import CONVERSIONS, compile_conversion, find_category
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+UNIT_KEY = "unit"  # Arrow field metadata key, and the pandas df.attrs["units"] mapping, hold each column's unit
+BATCH_ROWS = 64 * 1024  # rows per Parquet record batch; memory use is bounded by this, not the file size
+
+# Target systems as {category: unit}; "si" is each category's factor-1 unit, and kelvin for temperature
+SYSTEMS = {
+    "si": {**{category: next(unit for unit, factor in units.items() if factor == 1)
+              for category, units in CONVERSIONS.items() if category != "temperature"},
+           "temperature": "k"},
+}
+
+
+# ------------------------------
+# 🧭 Planning
+# ------------------------------
+def target_unit(unit, target):
+    # `target` is a system name ("si"), a {category: unit} mapping or a single unit for every column
+    category = find_category(unit, unit)
+    if isinstance(target, str) and target.lower() in SYSTEMS:
+        return category, SYSTEMS[target.lower()][category]
+    if isinstance(target, dict):
+        return category, target.get(category, unit)
+    return category, target
+
+
+def unit_symbol(unit):
+    # Canonical spelling for metadata ("pa" → "Pa", "k" → "K"); spellings the alias index doesn't know stay as they are
+    from unit_aliases import INDEX
+
+    return INDEX.get(unit) or INDEX.get(unit.upper()) or unit
+
+
+def plan_columns(units, target, columns=None):
+    # {column: ConversionPlan} for annotated columns that actually change; identity columns are left out.
+    # Without `columns`, columns whose unit no category knows (e.g. "rpm") are skipped with a warning.
+    plans = {}
+    for column, unit in units.items():
+        if not unit or (columns is not None and column not in columns):
+            continue
+        try:
+            category, to_unit = target_unit(unit, target)
+        except ValueError:
+            if columns is not None:
+                raise
+            warnings.warn(f"Column {column!r}: no conversion table has unit {unit!r}; left unchanged.",
+                          stacklevel=2)
+            continue
+        plan = compile_conversion(category, unit, to_unit)
+        if plan.scale != 1 or plan.offset:
+            plans[column] = plan
+    return plans
+
+
+# ------------------------------
+# 🐼 pandas
+# ------------------------------
+def frame_units(df, units=None):
+    # Column units from df.attrs["units"], overridden by an explicit {column: unit}
+    return {**df.attrs.get("units", {}), **(units or {})}
+
+
+def convert_frame(df, target="si", units=None, columns=None):
+    # New DataFrame; converted columns get fresh buffers, every other column shares df's memory
+    known = frame_units(df, units)
+    plans = plan_columns(known, target, columns)
+    out = df.copy(deep=False)
+    for column, plan in plans.items():
+        # Nullable columns (Int64, Float64) hold pd.NA, which has no float64 value of its own
+        out[column] = plan.apply(df[column].to_numpy(dtype="float64", na_value=float("nan")))
+        known[column] = unit_symbol(plan.to_unit)
+    out.attrs = {**df.attrs, "units": known}
+    return out
+
+
+# ------------------------------
+# 🏹 Arrow and Parquet
+# ------------------------------
+def schema_units(schema):
+    return {field.name: (field.metadata or {}).get(UNIT_KEY.encode(), b"").decode() or None for field in schema}
+
+
+def converted_schema(schema, plans):
+    # Same schema with float64 values and the new unit recorded for converted columns
+    import pyarrow as pa
+
+    fields = []
+    for field in schema:
+        plan = plans.get(field.name)
+        if plan is not None:
+            field = field.with_type(pa.float64()).with_metadata(
+                {**(field.metadata or {}), UNIT_KEY.encode(): unit_symbol(plan.to_unit).encode()})
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def convert_arrow_column(array, plan):
+    # One null-aware vectorized kernel per step
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    result = pc.multiply(pc.cast(array, pa.float64()), plan.scale)
+    return pc.add(result, plan.offset) if plan.offset else result
+
+
+def convert_table(data, target="si", columns=None, plans=None):
+    # Works for Tables and RecordBatches; untouched columns are passed through without copying
+    plans = plan_columns(schema_units(data.schema), target, columns) if plans is None else plans
+    arrays = [convert_arrow_column(data.column(i), plans[field.name]) if field.name in plans else data.column(i)
+              for i, field in enumerate(data.schema)]
+    return type(data).from_arrays(arrays, schema=converted_schema(data.schema, plans))
+
+
+def convert_parquet(source, destination, target="si", columns=None, batch_rows=BATCH_ROWS):
+    # Streams record batches, so files larger than memory convert with bounded memory; returns rows
+    import pyarrow.parquet as pq
+
+    reader = pq.ParquetFile(source)
+    schema = reader.schema_arrow
+    plans = plan_columns(schema_units(schema), target, columns)
+    rows = 0
+    with pq.ParquetWriter(destination, converted_schema(schema, plans)) as writer:
+        for batch in reader.iter_batches(batch_size=batch_rows):
+            writer.write_batch(convert_table(batch, plans=plans))
+            rows += batch.num_rows
+    return rows
+
+
+# ------------------------------
+# 🖥️ Command Line
+# ------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🏹 Convert unit-annotated Parquet columns")
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument("--to", default="si", help="target system (si) or a single target unit (default: si)")
+    parser.add_argument("--col", action="append", dest="columns", help="only convert these columns (repeatable)")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        rows = convert_parquet(args.source, args.destination, args.to, args.columns, args.batch_rows)
+    except (ValueError, OSError) as e:
+        print(f"⚠️ Error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"✅ Converted {rows:,} rows in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import argparse
+import atexit
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from log_tail import LINE_PATTERN
+from unit_aliases import INDEX as UNIT_ALIASES
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+HISTORY_DB = "conversion_history.db"
+BATCH_SIZE = 500  # rows per commit
+FLUSH_INTERVAL = 2.0  # seconds a buffered row may wait before it is committed anyway
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions(
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    category TEXT NOT NULL,
+    from_unit TEXT NOT NULL,
+    to_unit TEXT NOT NULL,
+    value REAL,
+    result REAL,
+    user TEXT,
+    count INTEGER NOT NULL DEFAULT 1
+);
+-- Covering indexes: every report below is answered from an index, never a table scan
+CREATE INDEX IF NOT EXISTS conversions_pair ON conversions(category, from_unit, to_unit, count);
+CREATE INDEX IF NOT EXISTS conversions_user ON conversions(user, count);
+CREATE INDEX IF NOT EXISTS conversions_ts ON conversions(ts, count);
+CREATE TABLE IF NOT EXISTS imports(path TEXT PRIMARY KEY, size INTEGER, imported_at REAL);
+"""
+INSERT = ("INSERT INTO conversions(ts, category, from_unit, to_unit, value, result, user, count) "
+          "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+
+# "Pressure: 500.0 Pa → 0.500000 Kpa by admin" and "Mass: batch of 1000 values kg → lb by admin"
+CONVERSION_MESSAGE = re.compile(
+    r"^(?P<category>[A-Za-z ]+): (?:batch of (?P<count>\d+) values|(?P<value>\S+)) (?P<from_unit>\S+)"
+    r" → (?:(?P<result>\S+) )?(?P<to_unit>\S+)(?: by (?P<user>\S+))?$")
+
+
+def canonical_unit(unit):
+    # Store "kn", "Kn" and "kN" as one pair
+    return UNIT_ALIASES.get(unit, unit)
+
+
+def connect(path=HISTORY_DB):
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+# ------------------------------
+# 📝 Buffered Writer
+# ------------------------------
+class HistoryWriter:
+    # Collects conversion rows in memory and commits them BATCH_SIZE at a time
+    def __init__(self, path=HISTORY_DB, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.db = connect(path)
+        self.batch_size = batch_size
+        self.buffer = []
+        self.lock = threading.Lock()
+        # The flusher thread and every session thread share one connection, so writes take turns
+        self.db_lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.flusher = threading.Thread(target=self._flush_periodically, args=(flush_interval,), daemon=True)
+        self.flusher.start()
+        atexit.register(self.close)
+
+    def record(self, category, from_unit, to_unit, value=None, result=None, user=None, count=1, ts=None):
+        row = (ts or time.time(), category.lower(), canonical_unit(from_unit), canonical_unit(to_unit),
+               value, result, user, count)
+        with self.lock:
+            self.buffer.append(row)
+            if len(self.buffer) < self.batch_size:
+                return
+            rows, self.buffer = self.buffer, []
+        self._commit(rows)
+
+    def flush(self):
+        with self.lock:
+            rows, self.buffer = self.buffer, []
+        self._commit(rows)
+
+    def _commit(self, rows):
+        if rows:
+            with self.db_lock, self.db:
+                self.db.executemany(INSERT, rows)
+
+    def _flush_periodically(self, interval):
+        while not self.stopped.wait(interval):
+            self.flush()
+
+    def close(self):
+        if not self.stopped.is_set():
+            self.stopped.set()
+            self.flush()
+            with self.db_lock:
+                self.db.close()
+
+
+# ------------------------------
+# 📊 Aggregate Queries
+# ------------------------------
+def top_pairs(db, limit=10):
+    return db.execute(
+        "SELECT category, from_unit, to_unit, SUM(count) AS total FROM conversions "
+        "GROUP BY category, from_unit, to_unit ORDER BY total DESC LIMIT ?", (limit,)).fetchall()
+
+
+def user_counts(db):
+    return db.execute(
+        "SELECT user, SUM(count) AS total FROM conversions WHERE user IS NOT NULL "
+        "GROUP BY user ORDER BY total DESC").fetchall()
+
+
+def volume_by_bucket(db, bucket_seconds=3600, since=None, until=None):
+    # [(bucket start as epoch seconds, conversions)], oldest first
+    return db.execute(
+        "SELECT CAST(ts / ?1 AS INTEGER) * ?1 AS bucket, SUM(count) FROM conversions "
+        "WHERE ts >= ?2 AND ts < ?3 GROUP BY bucket ORDER BY bucket",
+        (bucket_seconds, since if since is not None else 0, until if until is not None else 1e18)).fetchall()
+
+
+# ------------------------------
+# 📥 One-Time Log Backfill
+# ------------------------------
+def parse_log_line(line):
+    # (ts, category, from_unit, to_unit, value, result, user, count) or None for non-conversion lines
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+            ts = datetime.strptime(entry["ts"][:19], "%Y-%m-%d %H:%M:%S").timestamp()
+        except (ValueError, KeyError, TypeError):
+            return None
+        if not entry.get("category") or not entry.get("from_unit"):
+            return None
+        return (ts, entry["category"].lower(), canonical_unit(entry["from_unit"]),
+                canonical_unit(entry["to_unit"]), entry.get("value"), entry.get("result"),
+                entry.get("user"), entry.get("count") or 1)
+
+    match = LINE_PATTERN.match(line)
+    conversion = match and CONVERSION_MESSAGE.match(match.group("message"))
+    if not conversion:
+        return None
+    ts = datetime.strptime(match.group("ts"), "%Y-%m-%d %H:%M:%S").timestamp()
+    fields = conversion.groupdict()
+    try:
+        value = float(fields["value"]) if fields["value"] else None
+        result = float(fields["result"]) if fields["result"] else None
+    except ValueError:
+        return None
+    return (ts, fields["category"].lower(), canonical_unit(fields["from_unit"]),
+            canonical_unit(fields["to_unit"]), value, result, fields["user"], int(fields["count"] or 1))
+
+
+def backfill(db, paths, batch_size=BATCH_SIZE):
+    # Import each log file once; returns {path: rows imported}
+    imported = {}
+    for path in paths:
+        key = os.path.abspath(path)
+        if db.execute("SELECT 1 FROM imports WHERE path = ?", (key,)).fetchone():
+            imported[path] = 0
+            continue
+        rows, total = [], 0
+        with open(path, encoding="utf-8", errors="replace") as f, db:
+            for line in f:
+                row = parse_log_line(line.rstrip("\r\n"))
+                if row:
+                    rows.append(row)
+                if len(rows) >= batch_size:
+                    db.executemany(INSERT, rows)
+                    total += len(rows)
+                    rows = []
+            db.executemany(INSERT, rows)
+            total += len(rows)
+            db.execute("INSERT INTO imports VALUES (?, ?, ?)", (key, os.path.getsize(path), time.time()))
+        imported[path] = total
+    return imported
+
+
+# ------------------------------
+# 🖥️ Command Line
+# ------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="📊 Conversion history store")
+    parser.add_argument("--db", default=HISTORY_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("backfill", help="import existing log files (each file only once)")
+    load.add_argument("logs", nargs="+")
+    commands.add_parser("report", help="most-used pairs, per-user counts and daily volume")
+    args = parser.parse_args(argv)
+
+    db = connect(args.db)
+    if args.command == "backfill":
+        for path, rows in backfill(db, args.logs).items():
+            print(f"✅ {path}: {rows:,} conversions imported" if rows else f"⏭️ {path}: already imported")
+        return
+
+    print("Most-used unit pairs:")
+    for category, from_unit, to_unit, total in top_pairs(db):
+        print(f"  {category:12s} {from_unit} → {to_unit}: {total:,}")
+    print("Conversions per user:")
+    for user, total in user_counts(db):
+        print(f"  {user}: {total:,}")
+    print("Daily volume:")
+    for bucket, total in volume_by_bucket(db, 86400):
+        print(f"  {datetime.fromtimestamp(bucket):%Y-%m-%d}: {total:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+LOG_FILE = "unit_converter.log"
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+MAX_BYTES = 50 * 1024 * 1024  # rotate after this many bytes
+BACKUP_COUNT = 5
+FLUSH_EVERY = 256  # records per flush
+FLUSH_INTERVAL = 1.0  # ...or seconds since the last flush, whichever comes first
+STRUCTURED = os.environ.get("UNIT_CONVERTER_LOG_FORMAT", "text").lower() == "jsonl"
+
+# Fields passed through `extra=` that the JSONL formatter copies into each record
+STRUCTURED_FIELDS = ("category", "from_unit", "to_unit", "value", "result", "user", "count", "seconds")
+
+_listener = None
+
+
+# ------------------------------
+# 🧾 Formatting and Output
+# ------------------------------
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            if hasattr(record, field):
+                entry[field] = getattr(record, field)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    # Writes every record but only flushes every FLUSH_EVERY records or FLUSH_INTERVAL seconds.
+    # The file size is counted here instead of RotatingFileHandler's seek per record, which would
+    # flush the stream each time and format every record twice.
+    def __init__(self, *args, flush_every=FLUSH_EVERY, flush_interval=FLUSH_INTERVAL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.pending = 0
+        self.last_flush = time.monotonic()
+        self.bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _encoded_size(self, msg):
+        return len(msg) if msg.isascii() else len(msg.encode(self.encoding or "utf-8"))
+
+    def _needs_rollover(self, size):
+        return self.maxBytes > 0 and self.bytes_written > 0 and self.bytes_written + size > self.maxBytes
+
+    def shouldRollover(self, record):
+        return self._needs_rollover(self._encoded_size(self.format(record) + self.terminator))
+
+    def doRollover(self):
+        super().doRollover()
+        self.bytes_written = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            if self._needs_rollover(size):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.bytes_written += size
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        now = time.monotonic()
+        self.pending += 1
+        if self.pending >= self.flush_every or now - self.last_flush >= self.flush_interval:
+            self.flush_now(now)
+
+    def flush_now(self, now=None):
+        super().flush()
+        self.pending = 0
+        self.last_flush = now or time.monotonic()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                self.flush_now()
+        finally:
+            self.release()
+        super().close()
+
+
+class DeferredQueueHandler(QueueHandler):
+    # Hand the record over untouched; %-style args are merged in the writer thread, not the caller's
+    def prepare(self, record):
+        return record
+
+
+class DrainingQueueListener(QueueListener):
+    # Flush as soon as the queue runs dry, so quiet periods never leave records buffered
+    def _monitor(self):
+        q = self.queue
+        while True:
+            record = self.dequeue(True)
+            if record is self._sentinel:
+                break
+            self.handle(record)
+            if q.empty():
+                for handler in self.handlers:
+                    if isinstance(handler, BatchedRotatingFileHandler):
+                        handler.acquire()
+                        try:
+                            handler.flush_now()
+                        finally:
+                            handler.release()
+
+
+# ------------------------------
+# 🔧 Setup
+# ------------------------------
+def configure_logging(filename=LOG_FILE, level=logging.INFO, structured=None, asynchronous=True,
+                      max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    # Idempotent: the first call wins, so every front end can call it on import/rerun
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None or any(getattr(h, "_unit_converter", False) for h in root.handlers):
+        return
+
+    structured = STRUCTURED if structured is None else structured
+    handler = BatchedRotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count,
+                                         encoding="utf-8")
+    handler.setFormatter(JsonFormatter() if structured else logging.Formatter(TEXT_FORMAT))
+
+    if asynchronous:
+        records = queue.SimpleQueue()
+        front = DeferredQueueHandler(records)
+        _listener = DrainingQueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+    else:
+        front = handler
+    front._unit_converter = True
+    root.addHandler(front)
+    root.setLevel(level)
+
+
+def shutdown_logging():
+    # Drain the queue and flush the file; registered with atexit
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# ------------------------------
+# 📝 Conversion Records
+# ------------------------------
+def log_conversion(category, value, from_unit, result, to_unit, user=None):
+    logger = logging.getLogger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    extra = {"category": category, "from_unit": from_unit, "to_unit": to_unit,
+             "value": value, "result": result, "user": user}
+    if user:
+        logger.info("%s: %s %s → %.6f %s by %s", category, value, from_unit, result, to_unit, user, extra=extra)
+    else:
+        logger.info("%s: %s %s → %.6f %s", category, value, from_unit, result, to_unit, extra=extra)
+
+
+def log_conversion_batch(category, from_unit, to_unit, count, seconds=None, user=None):
+    # One summary record for a whole batch instead of one per value
+    logger = logging.getLogger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    extra = {"category": category, "from_unit": from_unit, "to_unit": to_unit,
+             "count": count, "seconds": seconds, "user": user}
+    suffix = f" by {user}" if user else ""
+    logger.info("%s: batch of %d values %s → %s%s", category, count, from_unit, to_unit, suffix, extra=extra)
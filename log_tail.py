@@ -0,0 +1,157 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+BLOCK_SIZE = 64 * 1024  # bytes read per backwards step
+INDEX_SUFFIX = ".idx"
+
+# "2025-10-07 17:17:07,032 - INFO - Pressure: 500.0 Pa → 0.500000 Kpa by admin"
+LINE_PATTERN = re.compile(r"^(?P<ts>\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),\d+ - (?P<level>\w+) - (?P<message>.*)$")
+CONVERSION_PATTERN = re.compile(r"^(?P<category>[A-Za-z ]+): .* → .*?(?: by (?P<user>\S+))?$")
+
+
+# ------------------------------
+# ⏪ Tail From the End
+# ------------------------------
+def tail_lines(path, n=10, block_size=BLOCK_SIZE):
+    # Last n lines, reading backwards in blocks: cost depends on n, not on the file size
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= n:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = data.splitlines()
+    return [line.decode("utf-8", errors="replace") for line in lines[-n:]]
+
+
+# ------------------------------
+# 🗂️ Sidecar Offset Index
+# ------------------------------
+def parse_line(line):
+    # (timestamp, level, category, user) for one log line; None fields when they don't apply
+    if line.startswith("{"):
+        return parse_json_line(line)
+    match = LINE_PATTERN.match(line)
+    if not match:
+        return None
+    timestamp = datetime.strptime(match.group("ts"), "%Y-%m-%d %H:%M:%S").timestamp()
+    conversion = CONVERSION_PATTERN.match(match.group("message"))
+    category = conversion.group("category").lower() if conversion else None
+    user = conversion.group("user") if conversion else None
+    return timestamp, match.group("level"), category, user
+
+
+def parse_json_line(line):
+    # Structured records written by log_setup.JsonFormatter
+    try:
+        entry = json.loads(line)
+        timestamp = datetime.strptime(entry["ts"][:19], "%Y-%m-%d %H:%M:%S").timestamp()
+    except (ValueError, KeyError, TypeError):
+        return None
+    category = entry.get("category")
+    return timestamp, entry.get("level"), category.lower() if category else None, entry.get("user")
+
+
+class LogIndex:
+    # Byte offset of every log line plus the fields we filter on, kept in a SQLite file next to the log.
+    # One instance is shared by every Streamlit session thread, so the connection is used under a lock.
+    def __init__(self, log_path, index_path=None):
+        self.log_path = log_path
+        self.lock = threading.RLock()
+        self.db = sqlite3.connect(index_path or log_path + INDEX_SUFFIX, check_same_thread=False)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS entries(
+                offset INTEGER PRIMARY KEY, ts REAL, level TEXT, category TEXT, user TEXT);
+            CREATE INDEX IF NOT EXISTS entries_category ON entries(category, offset);
+            CREATE INDEX IF NOT EXISTS entries_user ON entries(user, offset);
+            CREATE INDEX IF NOT EXISTS entries_ts ON entries(ts);
+            CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value INTEGER);
+        """)
+
+    def _meta(self, key):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def update(self):
+        with self.lock:
+            return self._update()
+
+    def _update(self):
+        # Index only the bytes appended since the last call; start over if the log was truncated or
+        # rotated (log_setup renames it away, so a new inode can already be larger than the old offset)
+        info = os.stat(self.log_path)
+        start = self._meta("indexed_upto") or 0
+        if info.st_size < start or (start and self._meta("inode") != info.st_ino):
+            with self.db:
+                self.db.execute("DELETE FROM entries")
+                self.db.execute("DELETE FROM meta")
+            start = 0
+        if info.st_size == start:
+            return 0
+
+        rows = []
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partial line still being written; pick it up next time
+                fields = parse_line(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+                if fields:
+                    rows.append((offset, *fields))
+                offset += len(raw)
+
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('indexed_upto', ?)", (offset,))
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('inode', ?)", (info.st_ino,))
+        return len(rows)
+
+    def query(self, limit=10, page=0, category=None, user=None, since=None, until=None):
+        # Newest-first page of matching lines, read by seeking to their offsets
+        clauses, params = [], []
+        for column, value in (("category", category and category.lower()), ("user", user)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.lock:
+            # Held through the reads, so another thread can't re-index between the lookup and the seeks
+            self._update()
+            offsets = [row[0] for row in self.db.execute(
+                f"SELECT offset FROM entries {where} ORDER BY offset DESC LIMIT ? OFFSET ?",
+                (*params, limit, page * limit))]
+
+            lines = []
+            with open(self.log_path, "rb") as f:
+                for offset in offsets:
+                    f.seek(offset)
+                    lines.append(f.readline().decode("utf-8", errors="replace").rstrip("\r\n"))
+        return lines
+
+    def categories(self):
+        with self.lock:
+            return [row[0] for row in self.db.execute(
+                "SELECT DISTINCT category FROM entries WHERE category IS NOT NULL ORDER BY category")]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
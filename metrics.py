@@ -0,0 +1,183 @@
+import threading
+import time
+from bisect import bisect_left
+
+import unit_core
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 1e-4, 1e-3, 1e-2)
+
+
+# ------------------------------
+# 📈 Counters and Histograms
+# ------------------------------
+class PairStats:
+    __slots__ = ("calls", "values", "sampled", "seconds", "buckets", "lock")
+
+    def __init__(self, bucket_count):
+        self.calls = 0  # calls, sampled or not
+        self.values = 0  # values converted (an array call counts each element)
+        self.sampled = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (bucket_count + 1)  # last slot is +Inf
+        self.lock = threading.Lock()  # conversions run on many threads; += alone can lose counts
+
+    def record(self, values, seconds=None, bounds=()):
+        # Count one call; `seconds` (when the call was sampled) goes into the histogram
+        with self.lock:
+            self.calls += 1
+            self.values += values
+            if seconds is not None:
+                self.sampled += 1
+                self.seconds += seconds
+                self.buckets[bisect_left(bounds, seconds)] += 1
+
+
+class Metrics:
+    def __init__(self, sample_every=1, buckets=LATENCY_BUCKETS):
+        self.sample_every = max(1, int(sample_every))
+        self.bounds = tuple(buckets)
+        self.pairs = {}  # (category, from, to) -> PairStats; unit_engine plans use the dimension as category
+        self.lock = threading.Lock()  # only guards creating new pair entries
+
+    def pair(self, category, from_unit, to_unit):
+        key = (category, from_unit, to_unit)
+        stats = self.pairs.get(key)
+        if stats is None:
+            with self.lock:
+                stats = self.pairs.setdefault(key, PairStats(len(self.bounds)))
+        return stats
+
+    def snapshot(self):
+        result = {}
+        for (category, from_unit, to_unit), stats in list(self.pairs.items()):
+            with stats.lock:
+                buckets = list(stats.buckets)
+            result[f"{category}:{from_unit}->{to_unit}"] = {
+                "category": category, "from": from_unit, "to": to_unit,
+                "calls": stats.calls, "values": stats.values, "sampled": stats.sampled,
+                "seconds": stats.seconds,
+                "buckets": dict(zip([*map(str, self.bounds), "+Inf"], cumulative(buckets))),
+            }
+        return result
+
+    def prometheus(self):
+        # Prometheus text exposition format (version 0.0.4)
+        lines = [
+            "# HELP unit_conversion_calls_total Conversion calls per unit pair.",
+            "# TYPE unit_conversion_calls_total counter",
+        ]
+        items = sorted(self.pairs.items())
+        for key, stats in items:
+            lines.append(f"unit_conversion_calls_total{{{labels(*key)}}} {stats.calls}")
+        lines += [
+            "# HELP unit_conversion_values_total Values converted per unit pair.",
+            "# TYPE unit_conversion_values_total counter",
+        ]
+        for key, stats in items:
+            lines.append(f"unit_conversion_values_total{{{labels(*key)}}} {stats.values}")
+        lines += [
+            "# HELP unit_conversion_seconds Sampled conversion call latency.",
+            "# TYPE unit_conversion_seconds histogram",
+        ]
+        for key, stats in items:
+            base = labels(*key)
+            for bound, count in zip([*map(repr, self.bounds), "+Inf"], cumulative(stats.buckets)):
+                lines.append(f'unit_conversion_seconds_bucket{{{base},le="{bound}"}} {count}')
+            lines.append(f"unit_conversion_seconds_sum{{{base}}} {stats.seconds!r}")
+            lines.append(f"unit_conversion_seconds_count{{{base}}} {stats.sampled}")
+        return "\n".join(lines) + "\n"
+
+
+def cumulative(counts):
+    total = 0
+    out = []
+    for count in counts:
+        total += count
+        out.append(total)
+    return out
+
+
+def labels(category, from_unit, to_unit):
+    def escape(text):
+        return str(text).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'category="{escape(category)}",from="{escape(from_unit)}",to="{escape(to_unit)}"'
+
+
+# ------------------------------
+# ⏱️ Timed Plans
+# ------------------------------
+class TimedPlan:
+    # Stands in for a compiled plan while metrics are on: same attributes, every call counted and
+    # one call in `every` timed. Front ends get it from compile_conversion, registry snapshots,
+    # shared tables and unit_engine through unit_core's plan hook, whichever way they imported them.
+    __slots__ = ("plan", "stats", "every", "bounds", "category", "from_unit", "to_unit", "scale", "offset")
+
+    def __init__(self, plan, stats, every, bounds):
+        self.plan = plan
+        self.stats = stats
+        self.every = every
+        self.bounds = bounds
+        self.category = plan.category
+        self.from_unit = plan.from_unit
+        self.to_unit = plan.to_unit
+        self.scale = plan.scale
+        self.offset = plan.offset
+
+    def __call__(self, value):
+        stats = self.stats
+        if stats.calls % self.every:  # unlocked read: only picks which calls to time
+            stats.record(1)
+            return self.plan(value)
+        start = time.perf_counter()
+        result = self.plan(value)
+        stats.record(1, time.perf_counter() - start, self.bounds)
+        return result
+
+    def apply(self, values, out=None):
+        start = time.perf_counter()
+        result = self.plan.apply(values, out=out)
+        self.stats.record(result.size, time.perf_counter() - start, self.bounds)  # always timed
+        return result
+
+    def __repr__(self):
+        return f"TimedPlan({self.plan!r})"
+
+
+# ------------------------------
+# 🔌 Opt-In Instrumentation
+# ------------------------------
+# Disabled means no plan hook, so the off state costs one `is None` check per compiled plan.
+METRICS = None
+
+
+def enable(sample_every=1):
+    # Start counting every conversion and timing one call in `sample_every`; returns the Metrics
+    global METRICS
+    if METRICS is not None:
+        return METRICS
+    metrics = METRICS = Metrics(sample_every)
+
+    def hook(plan):
+        return TimedPlan(plan, metrics.pair(plan.category, plan.from_unit, plan.to_unit),
+                         metrics.sample_every, metrics.bounds)
+
+    unit_core.set_plan_hook(hook)
+    return metrics
+
+
+def disable():
+    global METRICS
+    unit_core.set_plan_hook(None)
+    METRICS = None
+
+
+def snapshot():
+    return METRICS.snapshot() if METRICS is not None else {}
+
+
+def prometheus():
+    return METRICS.prometheus() if METRICS is not None else ""
@@ -0,0 +1,94 @@
+from unit_core import FROM_CELSIUS, TO_CELSIUS, ConversionPlan, compile_conversion, find_category
+
+# ------------------------------
+# 🔗 Fused Affine Pipelines
+# ------------------------------
+# Every step is an affine map v → v * scale + offset. Composing two of them is another affine map,
+# so a chain of any length collapses into one (scale, offset) while it is built and runs as a
+# single ConversionPlan: the same multiply-add as one conversion, for scalars and arrays alike.
+#
+#   plan = Pipeline().convert("F", "K").scale(1.002).convert("K", "C").compile()
+#   plan(451.0), plan.apply(readings)
+#
+# Each step must start in the unit the previous one ended in, and a temperature that has gone
+# through convert() (absolute) can't continue with delta() (a difference), or the other way round.
+
+
+def temperature_delta_scale(from_unit, to_unit):
+    # A temperature difference only scales: 1 degree F of change is 5/9 K of change, with no offset
+    from_unit, to_unit = from_unit.lower(), to_unit.lower()
+    if from_unit not in TO_CELSIUS or to_unit not in FROM_CELSIUS:
+        raise ValueError("Invalid unit entered.")
+    return TO_CELSIUS[from_unit][0] * FROM_CELSIUS[to_unit][0]
+
+
+class Pipeline:
+    __slots__ = ("scale_factor", "offset_term", "steps", "from_unit", "to_unit", "temperature")
+
+    def __init__(self):
+        self.scale_factor = 1.0
+        self.offset_term = 0.0
+        self.steps = []  # (description, scale, offset) for __repr__ and debugging
+        self.from_unit = None
+        self.to_unit = None
+        self.temperature = None  # "absolute" after convert(), "delta" after delta(), None otherwise
+
+    def affine(self, scale, offset=0.0, description=None):
+        # Apply v * scale + offset after everything so far
+        self.scale_factor *= scale
+        self.offset_term = self.offset_term * scale + offset
+        self.steps.append((description or f"affine({scale!r}, {offset!r})", scale, offset))
+        return self
+
+    def convert(self, from_unit, to_unit, category=None):
+        # Absolute conversion between two units of one category (temperatures include their offset)
+        plan = compile_conversion(category or find_category(from_unit, to_unit), from_unit, to_unit)
+        self._track(plan.from_unit, plan.to_unit, "absolute" if plan.category == "temperature" else None)
+        return self.affine(plan.scale, plan.offset, f"{plan.category}: {plan.from_unit} → {plan.to_unit}")
+
+    def delta(self, from_unit, to_unit):
+        # Temperature difference between two scales: °F → K of change multiplies by 5/9 and adds nothing
+        scale = temperature_delta_scale(from_unit, to_unit)
+        self._track(from_unit.lower(), to_unit.lower(), "delta")
+        return self.affine(scale, 0.0, f"delta: {from_unit} → {to_unit}")
+
+    def scale(self, gain):
+        return self.affine(gain, 0.0, f"scale({gain!r})")
+
+    def shift(self, bias):
+        return self.affine(1.0, bias, f"shift({bias!r})")
+
+    def then(self, other):
+        # Append another pipeline (or any plan with scale/offset)
+        if isinstance(other, Pipeline):
+            self._track(other.from_unit, other.to_unit, other.temperature)
+            self.steps.extend(other.steps)
+            scale, offset = other.scale_factor, other.offset_term
+            self.scale_factor *= scale
+            self.offset_term = self.offset_term * scale + offset
+            return self
+        self._track(other.from_unit, other.to_unit,
+                    "absolute" if getattr(other, "category", None) == "temperature" else None)
+        return self.affine(other.scale, other.offset, repr(other))
+
+    def _track(self, from_unit, to_unit, temperature=None):
+        # Validate before anything changes, so a rejected step leaves the pipeline as it was
+        if from_unit is not None and self.to_unit is not None and from_unit != self.to_unit:
+            raise ValueError(f"Step from '{from_unit}' does not follow the pipeline's current unit "
+                             f"'{self.to_unit}'.")
+        if temperature and self.temperature and temperature != self.temperature:
+            raise ValueError(f"Cannot apply a temperature {temperature} step to a temperature {self.temperature}.")
+        if self.from_unit is None:
+            self.from_unit = from_unit
+        self.to_unit = to_unit or self.to_unit
+        self.temperature = temperature or self.temperature
+
+    def compile(self):
+        return ConversionPlan("pipeline", self.from_unit, self.to_unit, self.scale_factor, self.offset_term)
+
+    def __call__(self, value):
+        return value * self.scale_factor + self.offset_term
+
+    def __repr__(self):
+        chain = " | ".join(description for description, _, _ in self.steps) or "identity"
+        return f"Pipeline({chain}; scale={self.scale_factor!r}, offset={self.offset_term!r})"
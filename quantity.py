@@ -0,0 +1,299 @@
+import re
+import threading
+from functools import lru_cache
+
+from unit_engine import parse_unit
+
+# ------------------------------
+# 🏷️ Interned Units
+# ------------------------------
+# Each spelling is parsed once and given a small integer ID; quantities carry the ID, so a million
+# values in one unit share a single parsed Unit instead of a million strings. A spelling the caller
+# gives keeps its own ID ("N·m" stays torque, "J" stays energy); only derived products and quotients
+# fall back to an existing unit with the same (factor, dimensions), so m·s/s comes back as "m".
+UNIT_NAMES = []
+UNIT_OBJECTS = []
+UNIT_IDS = {}  # spelling -> ID
+UNIT_KEYS = {}  # (factor, dims) -> first ID with that unit
+_INTERN_LOCK = threading.Lock()
+_SIMPLE_NAME = re.compile(r"^[A-Za-zµμ°Ω]+\d*$")
+
+
+def unit_key(unit):
+    # Rounded so that km·ft/ft lands on the same key as km despite float noise
+    return float(f"{unit.factor:.12g}"), unit.dims
+
+
+def _register(unit, name):
+    # Caller holds _INTERN_LOCK
+    unit_id = UNIT_IDS.get(name)
+    if unit_id is None:
+        unit_id = UNIT_IDS[name] = len(UNIT_NAMES)
+        UNIT_NAMES.append(name)
+        UNIT_OBJECTS.append(unit)
+        UNIT_KEYS.setdefault(unit_key(unit), unit_id)
+    return unit_id
+
+
+def intern_unit(name):
+    unit_id = UNIT_IDS.get(name)
+    if unit_id is None:
+        unit = parse_unit(name)  # raises ValueError for unknown units before anything is registered
+        with _INTERN_LOCK:
+            unit_id = _register(unit, name)
+    return unit_id
+
+
+@lru_cache(maxsize=4096)
+def unit_factor(from_id, to_id):
+    # Multiplier taking a value in `from_id` to `to_id`; dimension mismatches raise ValueError
+    source, target = UNIT_OBJECTS[from_id], UNIT_OBJECTS[to_id]
+    if source.dims != target.dims:
+        raise ValueError(f"Incompatible units: {UNIT_NAMES[from_id]} ({source.canonical}) "
+                         f"→ {UNIT_NAMES[to_id]} ({target.canonical})")
+    return source.factor / target.factor
+
+
+def _derived_unit(a, b, unit, symbol):
+    # "N·m" or "m/s" when both sides are plain names; otherwise an existing unit with the same
+    # factor and dimensions, or the flat SI form ("0.3048 m·s^-1"), so names never nest however
+    # long a chain of products gets
+    with _INTERN_LOCK:
+        name_a, name_b = UNIT_NAMES[a], UNIT_NAMES[b]
+        if _SIMPLE_NAME.match(name_a) and _SIMPLE_NAME.match(name_b):
+            return _register(unit, f"{name_a}{symbol}{name_b}")
+        unit_id = UNIT_KEYS.get(unit_key(unit))
+        if unit_id is not None:
+            return unit_id
+        if unit_key(unit)[0] == 1.0:
+            name = unit.canonical
+        else:
+            name = f"{unit.factor:.12g} {unit.canonical}"
+        return _register(unit, name)
+
+
+@lru_cache(maxsize=1024)
+def product_unit(a, b):
+    return _derived_unit(a, b, UNIT_OBJECTS[a] * UNIT_OBJECTS[b], "·")
+
+
+@lru_cache(maxsize=1024)
+def quotient_unit(a, b):
+    return _derived_unit(a, b, UNIT_OBJECTS[a] / UNIT_OBJECTS[b], "/")
+
+
+def _unit_id(unit):
+    return unit if isinstance(unit, int) else intern_unit(unit)
+
+
+# ------------------------------
+# 🔢 Scalar Quantity
+# ------------------------------
+# Dimensional units from unit_engine only; offset scales (°C, °F) stay with convert_temperature
+class Quantity:
+    __slots__ = ("magnitude", "unit_id")
+
+    def __init__(self, magnitude, unit):
+        self.magnitude = magnitude
+        self.unit_id = _unit_id(unit)
+
+    @property
+    def unit(self):
+        return UNIT_NAMES[self.unit_id]
+
+    def to(self, unit):
+        # A scalar conversion is one multiply by a cached factor, so it is done right away
+        unit_id = _unit_id(unit)
+        if unit_id == self.unit_id:
+            return self
+        return Quantity(self.magnitude * unit_factor(self.unit_id, unit_id), unit_id)
+
+    def _magnitude_in(self, other):
+        # `other` (Quantity) expressed in this quantity's unit
+        if other.unit_id == self.unit_id:
+            return other.magnitude
+        return other.magnitude * unit_factor(other.unit_id, self.unit_id)
+
+    def __add__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return Quantity(self.magnitude + self._magnitude_in(other), self.unit_id)
+
+    def __sub__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return Quantity(self.magnitude - self._magnitude_in(other), self.unit_id)
+
+    def __mul__(self, other):
+        if isinstance(other, Quantity):
+            return Quantity(self.magnitude * other.magnitude, product_unit(self.unit_id, other.unit_id))
+        if isinstance(other, (int, float)):
+            return Quantity(self.magnitude * other, self.unit_id)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Quantity):
+            return Quantity(self.magnitude / other.magnitude, quotient_unit(self.unit_id, other.unit_id))
+        if isinstance(other, (int, float)):
+            return Quantity(self.magnitude / other, self.unit_id)
+        return NotImplemented
+
+    def __neg__(self):
+        return Quantity(-self.magnitude, self.unit_id)
+
+    def __abs__(self):
+        return Quantity(abs(self.magnitude), self.unit_id)
+
+    def __eq__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        try:
+            return self.magnitude == self._magnitude_in(other)
+        except ValueError:
+            return False  # different dimensions are simply unequal
+
+    def __lt__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.magnitude < self._magnitude_in(other)
+
+    def __le__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.magnitude <= self._magnitude_in(other)
+
+    def __gt__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.magnitude > self._magnitude_in(other)
+
+    def __ge__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return self.magnitude >= self._magnitude_in(other)
+
+    __hash__ = None  # equal quantities can have different magnitudes, so they can't hash consistently
+
+    def __repr__(self):
+        return f"Quantity({self.magnitude!r}, {self.unit!r})"
+
+
+# ------------------------------
+# 📦 Array Quantity
+# ------------------------------
+class QuantityArray:
+    # One unit and one float64 buffer. .to() and scalar multiplication/division only update a
+    # pending scale, so any chain of them costs a single pass when .values is finally read.
+    __slots__ = ("_data", "_scale", "unit_id")
+
+    def __init__(self, values, unit, _scale=1.0):
+        import numpy as np
+
+        self._data = np.asarray(values, dtype=np.float64)  # no copy for float64 arrays
+        self._scale = _scale
+        self.unit_id = _unit_id(unit)
+
+    @property
+    def unit(self):
+        return UNIT_NAMES[self.unit_id]
+
+    @property
+    def values(self):
+        # Materialize pending conversions once; the original buffer is never written to
+        if self._scale != 1.0:
+            self._data = self._data * self._scale
+            self._scale = 1.0
+        return self._data
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def to(self, unit):
+        unit_id = _unit_id(unit)
+        if unit_id == self.unit_id:
+            return self
+        return QuantityArray(self._data, unit_id, self._scale * unit_factor(self.unit_id, unit_id))
+
+    def _values_in(self, other):
+        # `other` (Quantity or QuantityArray) as magnitudes in this array's unit, in one pass
+        factor = 1.0 if other.unit_id == self.unit_id else unit_factor(other.unit_id, self.unit_id)
+        if isinstance(other, Quantity):
+            return other.magnitude * factor
+        return other._data * (other._scale * factor) if other._scale * factor != 1.0 else other._data
+
+    def _combine(self, other, operation):
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        return QuantityArray(operation(self.values, self._values_in(other)), self.unit_id)
+
+    def __add__(self, other):
+        return self._combine(other, lambda a, b: a + b)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a - b)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return QuantityArray(self._data, self.unit_id, self._scale * other)
+        if isinstance(other, Quantity):
+            return QuantityArray(self._data, product_unit(self.unit_id, other.unit_id),
+                                 self._scale * other.magnitude)
+        if isinstance(other, QuantityArray):
+            return QuantityArray(self._data * other._data, product_unit(self.unit_id, other.unit_id),
+                                 self._scale * other._scale)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)):
+            return QuantityArray(self._data, self.unit_id, self._scale / other)
+        if isinstance(other, Quantity):
+            return QuantityArray(self._data, quotient_unit(self.unit_id, other.unit_id),
+                                 self._scale / other.magnitude)
+        if isinstance(other, QuantityArray):
+            return QuantityArray(self._data / other._data, quotient_unit(self.unit_id, other.unit_id),
+                                 self._scale / other._scale)
+        return NotImplemented
+
+    def __neg__(self):
+        return QuantityArray(self._data, self.unit_id, -self._scale)
+
+    # Comparisons return boolean arrays, like NumPy
+    def __eq__(self, other):
+        return self.values == self._values_in(other)
+
+    def __ne__(self, other):
+        return self.values != self._values_in(other)
+
+    def __lt__(self, other):
+        return self.values < self._values_in(other)
+
+    def __le__(self, other):
+        return self.values <= self._values_in(other)
+
+    def __gt__(self, other):
+        return self.values > self._values_in(other)
+
+    def __ge__(self, other):
+        return self.values >= self._values_in(other)
+
+    __hash__ = None
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return QuantityArray(self._data[index], self.unit_id, self._scale)  # view, no copy
+        return Quantity(float(self._data[index]) * self._scale, self.unit_id)
+
+    def __iter__(self):
+        unit_id, scale = self.unit_id, self._scale
+        return (Quantity(value * scale, unit_id) for value in self._data.tolist())
+
+    def __repr__(self):
+        return f"QuantityArray({self.values!r}, {self.unit!r})"
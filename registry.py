@@ -0,0 +1,241 @@
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+from types import MappingProxyType
+
+from unit_core import (CONVERSIONS, TO_CELSIUS, ConversionPlan, TemperaturePlan, _legacy_key,
+                       observe, temperature_affine)
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+POLL_INTERVAL = 1.0  # seconds between config file checks
+CONFIG_ENV = "UNIT_CONVERTER_REGISTRY"  # config path every front end picks up through use_config()
+
+
+# ------------------------------
+# 📸 Immutable Snapshots
+# ------------------------------
+class RegistrySnapshot:
+    # One version of the unit tables with every plan precomputed. Snapshots are never modified
+    # after publication, so readers use them without locks; a reload publishes a new one.
+    __slots__ = ("version", "conversions", "unit_index", "plans", "categories_by_unit")
+
+    def __init__(self, conversions, version=0):
+        self.version = version
+        self.conversions = MappingProxyType({category: MappingProxyType(dict(units))
+                                             for category, units in conversions.items()})
+        self.unit_index = MappingProxyType({category: MappingProxyType({unit: i for i, unit in enumerate(units)})
+                                            for category, units in conversions.items()})
+        # Every canonical pair compiled up front, so the first request after a swap is as fast as any other
+        self.plans = {(category, a, b): (TemperaturePlan if category == "temperature" else ConversionPlan)(
+                          category, a, b, *self._affine(category, a, b))
+                      for category, units in conversions.items() for a in units for b in units}
+        by_unit = {}
+        for category, units in conversions.items():
+            for unit in units:
+                by_unit.setdefault(unit, []).append(category)
+        self.categories_by_unit = MappingProxyType({unit: tuple(cats) for unit, cats in by_unit.items()})
+
+    def _affine(self, category, from_unit, to_unit):
+        if category == "temperature":
+            return temperature_affine(from_unit, to_unit)
+        units = self.conversions[category]
+        return units[from_unit] / units[to_unit], 0.0
+
+    def compile(self, category, from_unit, to_unit):
+        # Same spellings and errors as unit_core.compile_conversion
+        plan = self.plans.get((category, from_unit, to_unit))
+        if plan is not None:
+            return observe(plan)
+        category = category.lower()
+        index = self.unit_index.get(category)
+        if index is None:
+            raise ValueError(f"Unknown category: {category}")
+        from_unit = _legacy_key(from_unit.lower(), index)
+        to_unit = _legacy_key(to_unit.lower(), index)
+        plan = self.plans.get((category, from_unit, to_unit))
+        if plan is None:
+            raise ValueError("Invalid unit entered.")
+        return observe(plan)
+
+    def find_category(self, from_unit, to_unit):
+        for category, index in self.unit_index.items():
+            if (_legacy_key(from_unit.lower(), index) in index
+                    and _legacy_key(to_unit.lower(), index) in index):
+                return category
+        raise ValueError(f"No category has both '{from_unit}' and '{to_unit}'.")
+
+    def plan_for(self, category, from_unit, to_unit):
+        return self.compile(category or self.find_category(from_unit, to_unit), from_unit, to_unit)
+
+
+def validate(conversions):
+    # Raises ValueError for a config that would build a broken snapshot
+    if not isinstance(conversions, dict) or not conversions:
+        raise ValueError("Registry config must be a non-empty {category: {unit: factor}} object.")
+    for category, units in conversions.items():
+        if not isinstance(units, dict) or not units:
+            raise ValueError(f"Category {category!r} has no units.")
+        for unit, factor in units.items():
+            if category == "temperature":
+                if unit not in TO_CELSIUS:
+                    raise ValueError(f"Unsupported temperature unit {unit!r}; expected one of {sorted(TO_CELSIUS)}.")
+            elif (isinstance(factor, bool) or not isinstance(factor, (int, float))
+                  or not math.isfinite(factor) or factor <= 0):  # json.load accepts NaN and Infinity
+                raise ValueError(f"{category}.{unit}: factor must be a positive finite number, got {factor!r}.")
+
+
+def normalize(conversions):
+    # Lower-case keys like CONVERSIONS, so lookups behave the same as the built-in tables; keys that
+    # only differ by case ("mW"/"MW") would overwrite each other, so they are rejected instead
+    if not isinstance(conversions, dict):
+        return conversions
+    normalized = {}
+    for category, units in conversions.items():
+        key = str(category).lower()
+        if key in normalized:
+            raise ValueError(f"Category {category!r} appears more than once (categories ignore case).")
+        if isinstance(units, dict):
+            folded = {}
+            for unit, factor in units.items():
+                if str(unit).lower() in folded:
+                    raise ValueError(f"{key}.{unit}: unit appears more than once (units ignore case).")
+                folded[str(unit).lower()] = factor
+            units = folded
+        normalized[key] = units
+    return normalized
+
+
+def load_config(path):
+    with open(path, encoding="utf-8") as f:
+        conversions = normalize(json.load(f))
+    validate(conversions)
+    return conversions
+
+
+# ------------------------------
+# 🔁 Atomic Swaps
+# ------------------------------
+# Publishing is a single reference assignment; a reader that already holds a snapshot finishes
+# its conversion on that snapshot even if a newer one is published meanwhile.
+_current = RegistrySnapshot(CONVERSIONS)
+
+
+def current():
+    return _current
+
+
+def publish(snapshot):
+    global _current
+    _current = snapshot
+
+
+def reload(path):
+    # Build the new snapshot completely, then swap; a bad config leaves the old snapshot in place
+    snapshot = RegistrySnapshot(load_config(path), _current.version + 1)
+    publish(snapshot)
+    return snapshot
+
+
+def compile_conversion(category, from_unit, to_unit):
+    return _current.compile(category, from_unit, to_unit)
+
+
+def find_category(from_unit, to_unit):
+    return _current.find_category(from_unit, to_unit)
+
+
+def convert_value(value, from_unit, to_unit, category):
+    return _current.compile(category, from_unit, to_unit)(value)
+
+
+class RegistryWatcher:
+    # Background thread: polls the config file and rebuilds + publishes a snapshot when it changes
+    def __init__(self, path, interval=POLL_INTERVAL, on_error=None):
+        self.path = path
+        self.interval = interval
+        self.on_error = on_error or (lambda e: print(f"⚠️ Registry reload failed: {e}", file=sys.stderr))
+        self.stopped = threading.Event()
+        self.signature = None
+        self.check()  # load synchronously once, so callers start on the configured tables
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _stat(self):
+        info = os.stat(self.path)
+        return info.st_mtime_ns, info.st_size, info.st_ino
+
+    def check(self):
+        # Returns True when a new snapshot was published
+        try:
+            signature = self._stat()
+            if signature == self.signature:
+                return False
+            self.signature = signature
+            reload(self.path)
+            return True
+        except (OSError, ValueError) as e:
+            self.on_error(e)
+            return False
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+def watch(path, interval=POLL_INTERVAL):
+    return RegistryWatcher(path, interval)
+
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def use_config(path=None):
+    # Load and watch `path` (default: $UNIT_CONVERTER_REGISTRY) once per process; returns True when
+    # a config is in use. Without one, the built-in CONVERSIONS tables stay current.
+    global _watcher
+    path = path or os.environ.get(CONFIG_ENV)
+    with _watcher_lock:
+        if path and _watcher is None:
+            _watcher = watch(path)
+        return _watcher is not None
+
+
+# ------------------------------
+# 🖥️ Command Line
+# ------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="📚 Unit registry config")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="write the built-in tables as a registry config")
+    export.add_argument("path")
+    check = commands.add_parser("check", help="validate a registry config")
+    check.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        with open(args.path, "w", encoding="utf-8") as f:
+            json.dump(CONVERSIONS, f, indent=2)
+            f.write("\n")
+        print(f"✅ Wrote {args.path}")
+        return 0
+    try:
+        snapshot = RegistrySnapshot(load_config(args.path))
+    except (OSError, ValueError) as e:
+        print(f"⚠️ {args.path}: {e}", file=sys.stderr)
+        return 1
+    print(f"✅ {args.path}: {len(snapshot.conversions)} categories, {len(snapshot.plans):,} unit pairs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+import json
+import logging
+import math
+from http import HTTPStatus
+
+import metrics
+from unit_core import compile_conversion, find_category
+
+# ------------------------------
+# ⚙️ Limits
+# ------------------------------
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 4 * 1024 * 1024
+MAX_BATCH_ITEMS = 10_000
+MAX_CONNECTIONS = 1024
+READ_TIMEOUT = 10.0  # seconds to receive a full request on an open connection
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# Errors raised while reading a request leave the connection mid-message
+UNRECOVERABLE = {
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.LENGTH_REQUIRED,
+    HTTPStatus.NOT_IMPLEMENTED,
+    HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+    HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+}
+
+
+# ------------------------------
+# 🔄 Handlers
+# ------------------------------
+REGISTRY = None  # the registry module when started with a registry config, else the built-in tables
+
+
+def convert_item(item):
+    try:
+        value = float(item["value"])
+        from_unit = item["from"]
+        to_unit = item["to"]
+        category = item.get("category")
+    except (KeyError, TypeError, ValueError, AttributeError):
+        raise ValueError("Each item needs a numeric 'value' plus 'from' and 'to' units.") from None
+    except OverflowError:
+        raise ValueError("'value' must be a finite number.") from None  # a JSON integer past float range
+    if not isinstance(from_unit, str) or not isinstance(to_unit, str):
+        raise ValueError("'from' and 'to' must be strings.")
+    if category is not None and not isinstance(category, str):
+        raise ValueError("'category' must be a string.")
+    if not math.isfinite(value):
+        raise ValueError("'value' must be a finite number.")
+    if REGISTRY is not None:
+        # One snapshot per item: a reload mid-request can't mix old and new tables
+        result = REGISTRY.current().plan_for(category, from_unit, to_unit)(value)
+    else:
+        category = category or find_category(from_unit, to_unit)
+        result = compile_conversion(category.lower(), from_unit, to_unit)(value)
+    if not math.isfinite(result):
+        raise ValueError("Result is out of range.")  # JSON has no NaN/Infinity
+    return result
+
+
+def handle_convert(payload):
+    if not isinstance(payload, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a JSON object.")
+    try:
+        return {"result": convert_item(payload)}
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, str(e)) from None
+
+
+def handle_batch(payload):
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected {\"items\": [...]}.")
+    if len(items) > MAX_BATCH_ITEMS:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"At most {MAX_BATCH_ITEMS} items per batch.")
+
+    results = []
+    errors = []
+    for i, item in enumerate(items):
+        try:
+            results.append(convert_item(item))
+        except ValueError as e:
+            results.append(None)
+            errors.append({"index": i, "error": str(e) or "Invalid item."})
+    return {"results": results, "errors": errors}
+
+
+ROUTES = {
+    ("POST", "/convert"): handle_convert,
+    ("POST", "/convert/batch"): handle_batch,
+    ("GET", "/health"): lambda payload: {"status": "ok"},
+    ("GET", "/metrics"): lambda payload: metrics.prometheus(),  # empty unless started with --metrics
+}
+
+
+# ------------------------------
+# 🌐 HTTP/1.1 Plumbing
+# ------------------------------
+async def read_request(reader):
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request headers too large.") from None
+
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, path, version = request_line.split(" ", 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line.") from None
+
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    transfer_encoding = headers.get("transfer-encoding", "").lower()
+    if transfer_encoding:
+        # Bodies are read by Content-Length only; ignoring the header would misread the stream
+        if "chunked" in transfer_encoding:
+            raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Chunked bodies are not supported; send Content-Length.")
+        raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, f"Unsupported Transfer-Encoding: {transfer_encoding}.")
+
+    # Digits only: int() would also take "-1", "+5" or "1_000"
+    raw_length = headers.get("content-length", "0")
+    if not (raw_length.isascii() and raw_length.isdigit()):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+    length = int(raw_length)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {MAX_BODY_BYTES} bytes.")
+    body = await reader.readexactly(length) if length else b""
+
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    return method, path.split("?", 1)[0], body, keep_alive
+
+
+def render_response(status, payload, keep_alive):
+    if isinstance(payload, str):
+        body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+    else:
+        body, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def dispatch(method, path, body):
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        known_path = any(route_path == path for _, route_path in ROUTES)
+        status = HTTPStatus.METHOD_NOT_ALLOWED if known_path else HTTPStatus.NOT_FOUND
+        raise HTTPError(status, f"No route for {method} {path}.")
+    try:
+        payload = json.loads(body) if body else None
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON.") from None
+    try:
+        return handler(payload)
+    except HTTPError:
+        raise
+    except Exception:
+        # Answer instead of dropping the connection; the traceback goes to the log
+        logging.exception("Unexpected error handling %s %s", method, path)
+        raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error.") from None
+
+
+class ConversionServer:
+    def __init__(self, max_connections=MAX_CONNECTIONS):
+        self.slots = asyncio.Semaphore(max_connections)
+
+    async def handle_connection(self, reader, writer):
+        async with self.slots:
+            try:
+                keep_alive = True
+                while keep_alive:
+                    try:
+                        method, path, body, keep_alive = await asyncio.wait_for(
+                            read_request(reader), READ_TIMEOUT)
+                        status, payload = HTTPStatus.OK, dispatch(method, path, body)
+                    except HTTPError as e:
+                        status, payload = e.status, {"error": str(e)}
+                        if e.status in UNRECOVERABLE:
+                            keep_alive = False  # the rest of the stream can't be trusted
+                    writer.write(render_response(status, payload, keep_alive))
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                pass  # client went away or idled out
+            except Exception as e:
+                logging.error("Unexpected server error: %s", e)
+            finally:
+                writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        print(f"🌐 Serving unit conversions on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🧮 Engineering Unit Converter HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS)
+    parser.add_argument("--metrics", action="store_true", help="collect per-unit-pair metrics at GET /metrics")
+    parser.add_argument("--sample-every", type=int, default=1, help="time one conversion in N (default: all)")
+    parser.add_argument("--registry", help="unit registry JSON; reloaded without a restart when it changes "
+                                           "(default: $UNIT_CONVERTER_REGISTRY)")
+    args = parser.parse_args(argv)
+    from log_setup import configure_logging
+
+    configure_logging()
+    if args.metrics:
+        metrics.enable(args.sample_every)
+    import registry
+
+    if registry.use_config(args.registry):
+        global REGISTRY
+        REGISTRY = registry
+    try:
+        asyncio.run(ConversionServer(args.max_connections).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("👋 Goodbye!")
+
+
+if __name__ == "__main__":
+    main()
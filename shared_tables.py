@@ -0,0 +1,259 @@
+import mmap
+import os
+import struct
+from zlib import crc32
+
+from unit_core import CONVERSIONS, ConversionPlan, TemperaturePlan, observe, temperature_affine
+
+# ------------------------------
+# ⚙️ Settings
+# ------------------------------
+ENV_VAR = "UNIT_CONVERTER_TABLES"  # segment name handed to worker processes
+MAGIC = b"UCT1"
+EMPTY = 0xFFFFFFFF
+
+# Layout (little-endian, all offsets from the start of the segment):
+#   header      magic, categories, category table, key slots + table, alias slots + table
+#   categories  (name offset, name length, unit count, matrix offset) per category
+#   key table   open-addressing hash of b"category\0unit" → (category, unit position)
+#   alias table open-addressing hash of spelling → canonical unit ID
+#   strings     UTF-8 blob every offset above points into
+#   matrices    per category, N×N (scale, offset) float64 pairs, row = from unit, column = to unit
+HEADER = struct.Struct("<4sIIIIII")
+CATEGORY = struct.Struct("<IIII")
+SLOT = struct.Struct("<IIII")
+PAIR = struct.Struct("<dd")
+
+
+# ------------------------------
+# 🏗️ Building the Segment (parent)
+# ------------------------------
+def _slot_count(entries):
+    # Power of two at most half full, so probe chains stay short
+    slots = 8
+    while slots < entries * 2:
+        slots *= 2
+    return slots
+
+
+def _affine(category, units, from_unit, to_unit):
+    if category == "temperature":
+        return temperature_affine(from_unit, to_unit)
+    return units[from_unit] / units[to_unit], 0.0
+
+
+def build_tables(conversions=None, aliases=None):
+    # Serialize the registry, its factor matrices and the alias index into one immutable buffer
+    conversions = CONVERSIONS if conversions is None else conversions
+    if aliases is None:
+        from unit_aliases import INDEX
+
+        INDEX.expand_prefixes()
+        aliases = INDEX.items()
+
+    strings = bytearray()
+    interned = {}
+
+    def string(text):
+        data = text.encode("utf-8")
+        if data not in interned:
+            interned[data] = len(strings)
+            strings.extend(data)
+        return interned[data], len(data)
+
+    categories = list(conversions.items())
+    keys = [(f"{category}\0{unit}".encode("utf-8"), c, i)
+            for c, (category, units) in enumerate(categories) for i, unit in enumerate(units)]
+    alias_pairs = [(spelling.encode("utf-8"), unit_id) for spelling, unit_id in aliases]
+    key_slots, alias_slots = _slot_count(len(keys)), _slot_count(len(alias_pairs))
+
+    category_table = HEADER.size
+    key_table = category_table + CATEGORY.size * len(categories)
+    alias_table = key_table + SLOT.size * key_slots
+    strings_base = alias_table + SLOT.size * alias_slots
+
+    # Strings first (their offsets are needed by every table), then the matrices after them
+    category_rows = [string(category) + (len(units),) for category, units in categories]
+    key_rows = [(string(key.decode("utf-8")), c, i) for key, c, i in keys]
+    alias_rows = [(string(spelling.decode("utf-8")), string(unit_id)) for spelling, unit_id in alias_pairs]
+    matrix_base = (strings_base + len(strings) + 7) // 8 * 8
+    buffer = bytearray(matrix_base + sum(PAIR.size * n * n for _, _, n in category_rows))
+
+    matrix = matrix_base
+    for c, ((category, units), (name_off, name_len, n)) in enumerate(zip(categories, category_rows)):
+        CATEGORY.pack_into(buffer, category_table + CATEGORY.size * c, strings_base + name_off, name_len, n, matrix)
+        for a in units:
+            for b in units:
+                PAIR.pack_into(buffer, matrix, *_affine(category, units, a, b))
+                matrix += PAIR.size
+
+    _fill(buffer, key_table, key_slots, [(keys[k][0], (strings_base + off, length, c, i))
+                                         for k, ((off, length), c, i) in enumerate(key_rows)])
+    _fill(buffer, alias_table, alias_slots, [(alias_pairs[k][0], (strings_base + s_off, s_len, strings_base + v_off, v_len))
+                                             for k, ((s_off, s_len), (v_off, v_len)) in enumerate(alias_rows)])
+    buffer[strings_base:strings_base + len(strings)] = strings
+    HEADER.pack_into(buffer, 0, MAGIC, len(categories), category_table, key_slots, key_table, alias_slots, alias_table)
+    return bytes(buffer)
+
+
+def _fill(buffer, table, slots, entries):
+    for offset in range(table, table + SLOT.size * slots, SLOT.size):
+        SLOT.pack_into(buffer, offset, EMPTY, 0, 0, 0)
+    mask = slots - 1
+    for key, row in entries:
+        slot = crc32(key) & mask
+        while SLOT.unpack_from(buffer, table + SLOT.size * slot)[0] != EMPTY:
+            slot = (slot + 1) & mask
+        SLOT.pack_into(buffer, table + SLOT.size * slot, *row)
+
+
+class PublishedTables:
+    # Owner of the shared-memory segment; workers find it by name (also exported in ENV_VAR)
+    def __init__(self, conversions=None, aliases=None):
+        from multiprocessing import shared_memory
+
+        data = build_tables(conversions, aliases)
+        self.segment = shared_memory.SharedMemory(create=True, size=len(data))
+        self.segment.buf[:len(data)] = data
+        self.name = self.segment.name
+        self.size = len(data)
+        os.environ[ENV_VAR] = self.name  # inherited by workers started after this point
+
+    def close(self):
+        # Unlink once every worker is done; attached workers keep their mapping until they exit
+        if self.segment is not None:
+            os.environ.pop(ENV_VAR, None)
+            self.segment.close()
+            self.segment.unlink()
+            self.segment = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def publish(conversions=None, aliases=None):
+    return PublishedTables(conversions, aliases)
+
+
+# ------------------------------
+# 🔗 Attaching (workers)
+# ------------------------------
+def _map_readonly(name):
+    # Map the segment read-only where POSIX shm is visible as a file; otherwise attach normally
+    path = os.path.join("/dev/shm", name.lstrip("/"))
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), None
+    from multiprocessing import resource_tracker, shared_memory
+
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        # Attaching registers the segment with this process's tracker, which would unlink it on exit
+        resource_tracker.unregister(segment._name, "shared_memory")
+    except Exception:
+        pass
+    return segment.buf, segment
+
+
+class SharedTables:
+    # Zero-copy view of a published segment: lookups read straight from the shared pages
+    def __init__(self, name):
+        self.name = name
+        self.buf, self._segment = _map_readonly(name)
+        magic, count, category_table, self.key_slots, self.key_table, self.alias_slots, self.alias_table = \
+            HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{name} is not a unit table segment.")
+        self.categories = {}
+        for c in range(count):
+            name_off, name_len, n, matrix = CATEGORY.unpack_from(self.buf, category_table + CATEGORY.size * c)
+            self.categories[bytes(self.buf[name_off:name_off + name_len]).decode("utf-8")] = (c, n, matrix)
+        self.plans = {}  # per-process memo of plans built from the shared matrices
+
+    def _probe(self, table, slots, key):
+        buf = self.buf
+        mask = slots - 1
+        slot = crc32(key) & mask
+        while True:
+            key_off, key_len, a, b = SLOT.unpack_from(buf, table + SLOT.size * slot)
+            if key_off == EMPTY:
+                return None
+            if key_len == len(key) and buf[key_off:key_off + key_len] == key:
+                return key_off, key_len, a, b
+            slot = (slot + 1) & mask
+
+    def resolve_alias(self, name):
+        # Canonical unit ID for a spelling, or None
+        found = self._probe(self.alias_table, self.alias_slots, name.encode("utf-8"))
+        if found is None:
+            return None
+        _, _, value_off, value_len = found
+        return bytes(self.buf[value_off:value_off + value_len]).decode("utf-8")
+
+    def unit_position(self, category, unit):
+        # (position, canonical unit) within the category, or None
+        found = self._probe(self.key_table, self.key_slots, f"{category}\0{unit}".encode("utf-8"))
+        if found is None:
+            # Other spellings go through the shared alias index, like unit_core's _legacy_key
+            unit_id = self.resolve_alias(unit)
+            if unit_id is not None:
+                found = self._probe(self.key_table, self.key_slots, f"{category}\0{unit_id.lower()}".encode("utf-8"))
+        if found is None:
+            return None
+        key_off, key_len, _, position = found
+        return position, bytes(self.buf[key_off:key_off + key_len]).decode("utf-8").split("\0", 1)[1]
+
+    def compile_conversion(self, category, from_unit, to_unit):
+        # Same spellings, errors and result type as unit_core.compile_conversion
+        key = (category, from_unit, to_unit)
+        plan = self.plans.get(key)
+        if plan is not None:
+            return observe(plan)
+        if category not in self.categories:
+            raise ValueError(f"Unknown category: {category}")
+        _, n, matrix = self.categories[category]
+        source = self.unit_position(category, from_unit.lower())
+        target = self.unit_position(category, to_unit.lower())
+        if source is None or target is None:
+            raise ValueError("Invalid unit entered.")
+        (i, from_id), (j, to_id) = source, target
+        scale, offset = PAIR.unpack_from(self.buf, matrix + PAIR.size * (i * n + j))
+        plan_type = TemperaturePlan if category == "temperature" else ConversionPlan
+        plan = self.plans[key] = plan_type(category, from_id, to_id, scale, offset)
+        return observe(plan)
+
+    def find_category(self, from_unit, to_unit):
+        for category in self.categories:
+            if (self.unit_position(category, from_unit.lower()) is not None
+                    and self.unit_position(category, to_unit.lower()) is not None):
+                return category
+        raise ValueError(f"No category has both '{from_unit}' and '{to_unit}'.")
+
+    def convert_value(self, value, from_unit, to_unit, category):
+        return self.compile_conversion(category, from_unit, to_unit)(value)
+
+    def close(self):
+        self.plans.clear()
+        if self._segment is not None:
+            self._segment.close()
+        else:
+            self.buf.close()
+
+
+TABLES = None
+
+
+def attach(name=None):
+    # In a worker: attach to the parent's segment (default: the name in ENV_VAR) once per process
+    global TABLES
+    if TABLES is None:
+        TABLES = SharedTables(name or os.environ[ENV_VAR])
+    return TABLES
+
+
+def worker_initializer(name):
+    # For ProcessPoolExecutor(initializer=worker_initializer, initargs=(published.name,))
+    attach(name)
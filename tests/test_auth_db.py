@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Unit Converter 2"))
+
+import auth_db  # noqa: E402
+
+
+def test_unknown_user_costs_one_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth_db, "work_factor", lambda: 1000)
+    store = auth_db.UserStore(str(tmp_path / "users.db"), pool_size=2)
+    assert store.add_user("alice", "secret")
+
+    calls = []
+    real_hash = auth_db.hash_password
+    monkeypatch.setattr(auth_db, "hash_password", lambda *args: calls.append(args) or real_hash(*args))
+    assert store.login("alice", "secret") == ("alice",)
+    assert store.login("alice", "wrong") is None
+    assert store.login("mallory", "secret") is None
+    assert len(calls) == 3
+    store.close()
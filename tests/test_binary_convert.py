@@ -0,0 +1,30 @@
+import array
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from binary_convert import convert_binary  # noqa: E402
+
+
+def write_column(path, values):
+    path.write_bytes(array.array("d", values).tobytes())
+
+
+def read_column(path):
+    return array.array("d", path.read_bytes()).tolist()
+
+
+def test_converts_into_a_separate_file(tmp_path):
+    source, out = tmp_path / "in.f8", tmp_path / "out.f8"
+    write_column(source, [1.0, 2.0, 3.0])
+    assert convert_binary(str(source), "kpa", "pa", "pressure", out_path=str(out), block_bytes=4096) == 3
+    assert read_column(out) == [1000.0, 2000.0, 3000.0]
+    assert read_column(source) == [1.0, 2.0, 3.0]
+
+
+def test_output_path_equal_to_input_converts_in_place(tmp_path):
+    source = tmp_path / "in.f8"
+    write_column(source, [1.0, 2.0])
+    convert_binary(str(source), "kpa", "pa", "pressure", out_path=str(tmp_path / "." / "in.f8"))
+    assert read_column(source) == [1000.0, 2000.0]
@@ -0,0 +1,116 @@
+import io
+import json
+
+import pytest
+
+import bulk_convert
+import log_setup
+from bulk_convert import convert_stream
+from unit_core import compile_conversion
+
+PLAN = compile_conversion("pressure", "kpa", "pa")
+
+
+@pytest.fixture
+def no_logging(monkeypatch):
+    # cli() logs each successful batch; keep that out of the working directory during tests
+    monkeypatch.setattr(log_setup, "configure_logging", lambda *args, **kwargs: None)
+    monkeypatch.setattr(log_setup, "log_conversion_batch", lambda *args, **kwargs: None)
+
+
+def test_csv_stream_converts_columns_and_counts_skipped_cells():
+    source = io.StringIO("t,p,q\n1,2,x\n3,n/a,4\n5,,6\n")
+    sink = io.StringIO()
+    stats = convert_stream(source, sink, "csv", ["p", "q"], PLAN, chunk_size=2)
+    assert sink.getvalue() == "t,p,q\n1,2000.0,x\n3,n/a,4000.0\n5,,6000.0\n"
+    assert (stats.rows, stats.skipped) == (3, 2)  # "x" and "n/a"; empty cells are left alone
+
+
+def test_jsonl_stream_keeps_other_fields():
+    source = io.StringIO('{"p": 1, "id": "a"}\n\n{"p": "high", "id": "b"}\n{"id": "c"}\n')
+    sink = io.StringIO()
+    stats = convert_stream(source, sink, "jsonl", ["p"], PLAN, chunk_size=1)
+    assert [json.loads(line) for line in sink.getvalue().splitlines()] == [
+        {"p": 1000.0, "id": "a"}, {"p": "high", "id": "b"}, {"id": "c"}]
+    assert (stats.rows, stats.skipped) == (3, 1)
+
+
+def test_empty_csv_writes_nothing():
+    sink = io.StringIO()
+    assert convert_stream(io.StringIO(""), sink, "csv", ["p"], PLAN).rows == 0
+    assert sink.getvalue() == ""
+
+
+def test_cli_converts_a_file(tmp_path, no_logging):
+    source, out = tmp_path / "in.csv", tmp_path / "out.csv"
+    source.write_text("p\n1.5\n")
+    assert bulk_convert.cli(["convert", "--in", str(source), "--out", str(out),
+                             "--col", "p", "--from", "psi", "--to", "kpa"]) == 0
+    assert out.read_text().splitlines() == ["p", str(compile_conversion("pressure", "psi", "kpa")(1.5))]
+
+
+def test_cli_reports_a_missing_column(tmp_path, capsys):
+    source = tmp_path / "in.csv"
+    source.write_text("pressure\n1\n")
+    assert bulk_convert.cli(["convert", "--in", str(source), "--out", str(tmp_path / "out.csv"),
+                             "--col", "p", "--from", "kpa", "--to", "pa"]) == 1
+    assert "Column(s) not found in header: p" in capsys.readouterr().err
+
+
+def test_cli_reports_unknown_units_and_missing_files(tmp_path, capsys):
+    source = tmp_path / "in.csv"
+    source.write_text("p\n1\n")
+    assert bulk_convert.cli(["convert", "--in", str(source), "--col", "p", "--from", "kpa", "--to", "furlong"]) == 1
+    assert bulk_convert.cli(["convert", "--in", str(tmp_path / "missing.csv"),
+                             "--col", "p", "--from", "kpa", "--to", "pa"]) == 1
+    assert capsys.readouterr().err.count("⚠️ Error") == 2
+
+
+# ------------------------------
+# 🧵 Sharded conversion
+# ------------------------------
+def test_split_ranges_are_newline_aligned_and_cover_the_file(tmp_path, monkeypatch):
+    path = tmp_path / "in.csv"
+    data = b"".join(b"%d,%s\n" % (i, b"x" * (i % 7)) for i in range(500))
+    path.write_bytes(data)
+    monkeypatch.setattr(bulk_convert, "SHARD_BYTES", 100)
+    ranges = bulk_convert.split_ranges(str(path), workers=3, start=4)
+    assert ranges[0][0] == 4 and ranges[-1][1] == len(data)
+    assert all(end == next_begin for (_, end), (next_begin, _) in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+    assert len(ranges) > 10
+    assert bulk_convert.split_ranges(str(path), 3, start=len(data)) == []
+
+
+@pytest.mark.parametrize("fmt, suffix", [("csv", ".csv"), ("jsonl", ".jsonl")])
+def test_sharded_output_matches_the_stream(tmp_path, monkeypatch, no_logging, fmt, suffix):
+    source = tmp_path / f"in{suffix}"
+    if fmt == "csv":
+        source.write_text("i,p\n" + "".join(f"{i},{i / 4 if i % 9 else 'bad'}\n" for i in range(2000)))
+    else:
+        source.write_text("".join(json.dumps({"i": i, "p": i / 4 if i % 9 else "bad"}) + "\n" for i in range(2000)))
+    monkeypatch.setattr(bulk_convert, "SHARD_BYTES", 512)  # dozens of ranges, finishing out of order
+    streamed, sharded = tmp_path / f"streamed{suffix}", tmp_path / f"sharded{suffix}"
+    common = ["--col", "p", "--from", "kpa", "--to", "pa"]
+    assert bulk_convert.cli(["convert", "--in", str(source), "--out", str(streamed), *common]) == 0
+    assert bulk_convert.cli(["convert", "--in", str(source), "--out", str(sharded), "--workers", "3", *common]) == 0
+    assert sharded.read_bytes() == streamed.read_bytes()
+
+
+def test_sharded_stats_and_header_only_file(tmp_path):
+    source = tmp_path / "in.csv"
+    source.write_text("p\n1\nx\n2\n")
+    sink = io.BytesIO()
+    stats = bulk_convert.convert_sharded(str(source), sink, "csv", ["p"], PLAN, workers=2)
+    assert sink.getvalue() == b"p\n1000.0\nx\n2000.0\n"
+    assert (stats.rows, stats.skipped) == (3, 1)
+
+    source.write_text("p\n")
+    sink = io.BytesIO()
+    assert bulk_convert.convert_sharded(str(source), sink, "csv", ["p"], PLAN, workers=2).rows == 0
+    assert sink.getvalue() == b"p\n"
+
+
+def test_workers_need_a_file(capsys):
+    assert bulk_convert.cli(["convert", "--col", "p", "--from", "kpa", "--to", "pa", "--workers", "2"]) == 1
+    assert "--workers needs a seekable --in file" in capsys.readouterr().err
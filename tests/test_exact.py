@@ -0,0 +1,44 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from exact import compile_exact, convert_exact, convert_exact_many
+
+
+def test_scale_is_the_legal_ratio():
+    assert compile_exact("length", "in", "m").scale == Fraction(127, 5000)
+    assert compile_exact("Length", "inch", "ft").scale == Fraction(1, 12)
+    assert compile_exact("pressure", "psi", "pa").scale == Fraction("0.45359237") * Fraction("9.80665") / Fraction("0.0254") ** 2
+
+
+def test_temperatures_are_exact():
+    assert convert_exact("212", "F", "C", "temperature") == 100
+    assert convert_exact("-40", "c", "f", "temperature") == -40
+    assert convert_exact(Decimal("0"), "c", "k", "temperature") == Fraction("273.15")
+
+
+@pytest.mark.parametrize("value", [7, "0.1", Decimal("0.1"), 0.1, Fraction(1, 3)])
+@pytest.mark.parametrize("category, from_unit, to_unit", [
+    ("length", "ft", "cm"), ("temperature", "f", "k"), ("energy", "kwh", "j"),
+])
+def test_apply_matches_call(value, category, from_unit, to_unit):
+    plan = compile_exact(category, from_unit, to_unit)
+    assert plan.apply([value]) == [plan(value)]
+
+
+def test_float_inputs_keep_their_binary_value():
+    assert convert_exact(0.1, "m", "m", "length") == Fraction(0.1) != Fraction("0.1")
+
+
+def test_many_and_decimal_reports():
+    plan = compile_exact("length", "in", "mm")
+    assert convert_exact_many(["1", 2], "in", "mm", "length") == [Fraction("25.4"), Fraction("50.8")]
+    assert plan.apply_decimal([Fraction(1, 3)], places=3) == [Decimal("8.467")]
+
+
+def test_unknown_units_raise():
+    with pytest.raises(ValueError, match="Unknown category"):
+        compile_exact("speed", "m", "ft")
+    with pytest.raises(ValueError, match="Invalid unit"):
+        compile_exact("length", "m", "furlong")
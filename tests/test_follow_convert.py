@@ -0,0 +1,41 @@
+from follow_convert import follow
+from unit_core import compile_conversion
+
+PLAN = compile_conversion("pressure", "kpa", "pa")
+
+
+def run(source, out, checkpoint):
+    with open(out, "ab") as sink:
+        return follow(str(source), sink, "csv", ["p"], PLAN, str(checkpoint), poll_interval=0.001, idle_exit=0)
+
+
+def test_fresh_start_appends_to_existing_output(tmp_path):
+    source, out, checkpoint = tmp_path / "in.csv", tmp_path / "out.csv", tmp_path / "in.ckpt"
+    source.write_text("p\n1\n2\n")
+    out.write_text("previous run\n")
+    stats = run(source, out, checkpoint)
+    assert stats.rows == 2
+    assert out.read_text().splitlines() == ["previous run", "p", "1000.0", "2000.0"]
+
+
+def test_resume_continues_after_checkpoint(tmp_path):
+    source, out, checkpoint = tmp_path / "in.csv", tmp_path / "out.csv", tmp_path / "in.ckpt"
+    source.write_text("p\n1\n")
+    run(source, out, checkpoint)
+    with open(out, "a") as f:
+        f.write("half-written")  # output after the last checkpoint is dropped on resume
+    with open(source, "a") as f:
+        f.write("3\n")
+    run(source, out, checkpoint)
+    assert out.read_text().splitlines() == ["p", "1000.0", "3000.0"]
+
+
+def test_replaced_input_keeps_earlier_output(tmp_path):
+    source, out, checkpoint = tmp_path / "in.csv", tmp_path / "out.csv", tmp_path / "in.ckpt"
+    source.write_text("p\n1\n2\n")
+    run(source, out, checkpoint)
+    replacement = tmp_path / "new.csv"
+    replacement.write_text("p\n5\n")
+    replacement.replace(source)
+    run(source, out, checkpoint)
+    assert out.read_text().splitlines() == ["p", "1000.0", "2000.0", "p", "5000.0"]
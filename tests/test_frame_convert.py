@@ -0,0 +1,40 @@
+import warnings
+
+import pytest
+
+from frame_convert import plan_columns
+
+
+def test_unknown_units_are_skipped_unless_requested():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        plans = plan_columns({"p": "psi", "speed": "rpm", "t": "s"}, "si")
+    assert list(plans) == ["p"]
+    assert ["'rpm'" in str(w.message) for w in caught] == [True, False]
+    with pytest.raises(ValueError):
+        plan_columns({"speed": "rpm"}, "si", columns=["speed"])
+
+
+def test_pandas_nullable_columns_and_unit_symbols():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"p": pd.array([1, None, 3], dtype="Int64"), "speed": [10.0, 20.0, 30.0]})
+    df.attrs["units"] = {"p": "kpa", "speed": "rpm"}
+    from frame_convert import convert_frame
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        out = convert_frame(df, "si")
+    assert out["p"].tolist()[0] == 1000.0
+    assert out["p"].isna().tolist() == [False, True, False]
+    assert out.attrs["units"] == {"p": "Pa", "speed": "rpm"}
+
+
+def test_arrow_metadata_gets_canonical_symbol():
+    pa = pytest.importorskip("pyarrow")
+    from frame_convert import UNIT_KEY, convert_table
+
+    field = pa.field("f", pa.float64(), metadata={UNIT_KEY: "kn"})
+    table = pa.table({"f": [1.0, None]}, schema=pa.schema([field]))
+    out = convert_table(table, "si")
+    assert out.column("f").to_pylist() == [1000.0, None]
+    assert out.schema.field("f").metadata[UNIT_KEY.encode()] == b"N"
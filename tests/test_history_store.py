@@ -0,0 +1,22 @@
+import threading
+
+from history_store import HistoryWriter, connect, top_pairs
+
+
+def test_concurrent_records_are_all_committed(tmp_path):
+    path = str(tmp_path / "history.db")
+    writer = HistoryWriter(path, batch_size=7, flush_interval=0.001)
+
+    def worker():
+        for _ in range(200):
+            writer.record("Pressure", "Kpa", "psi", 1.0, 0.145)
+            writer.flush()
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    assert top_pairs(connect(path)) == [("pressure", "kPa", "psi", 1200)]
@@ -0,0 +1,36 @@
+# ------------------------------
+# 🚦 Import-time budget: cold imports of the core must stay fast and free of heavy dependencies
+# ------------------------------
+# Uses `python -X importtime`, best of several fresh interpreters, so one slow start doesn't fail the run.
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGETS_MS = {"unit_core": 30.0, "Converter": 30.0}
+FORBIDDEN = ("logging", "sqlite3", "streamlit", "pandas", "numpy", "log_setup")
+REPEAT = 5
+
+
+def import_profile(module):
+    # {imported module: cumulative microseconds} for one cold import of `module`
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                         cwd=ROOT, capture_output=True, text=True, check=True)
+    profile = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.mark.parametrize("module, budget_ms", sorted(BUDGETS_MS.items()))
+def test_cold_import_stays_within_budget(module, budget_ms):
+    profiles = [import_profile(module) for _ in range(REPEAT)]
+    best_ms = min(profile[module] for profile in profiles) / 1000
+    assert best_ms <= budget_ms, f"{module} took {best_ms:.1f} ms to import (budget {budget_ms:.0f} ms)"
+    forbidden = sorted(name for name in profiles[0] if name in FORBIDDEN)
+    assert not forbidden, f"importing {module} pulls in {', '.join(forbidden)}"
@@ -0,0 +1,31 @@
+import logging
+import os
+
+from log_setup import BatchedRotatingFileHandler
+
+
+def make_record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_records_stay_buffered_with_rotation_enabled(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(str(path), maxBytes=1_000_000, backupCount=1,
+                                         encoding="utf-8", flush_every=1000, flush_interval=3600)
+    for i in range(10):
+        handler.handle(make_record(f"record {i}"))
+    assert os.path.getsize(path) == 0
+    handler.close()
+    assert path.read_text(encoding="utf-8").count("\n") == 10
+
+
+def test_rolls_over_on_counted_bytes(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BatchedRotatingFileHandler(str(path), maxBytes=100, backupCount=2,
+                                         encoding="utf-8", flush_every=1000, flush_interval=3600)
+    for i in range(12):
+        handler.handle(make_record(f"record {i:02d} ±"))  # 13 bytes per line
+    handler.close()
+    assert os.path.getsize(path) <= 100
+    assert os.path.getsize(f"{path}.1") <= 100
+    assert path.read_text(encoding="utf-8").splitlines()[-1] == "record 11 ±"
@@ -0,0 +1,51 @@
+import os
+
+from log_tail import LogIndex, tail_lines
+
+
+def conversion(second, category, user="admin"):
+    return f"2025-10-07 17:17:{second:02d},032 - INFO - {category}: 1.0 a → 2.000000 b by {user}\n"
+
+
+def test_tail_lines_across_blocks(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("".join(f"line {i}\n" for i in range(1000)))
+    assert tail_lines(str(log), 3, block_size=7) == ["line 997", "line 998", "line 999"]
+    assert tail_lines(str(log), 2000, block_size=64) == [f"line {i}" for i in range(1000)]
+    assert tail_lines(str(log), 0) == []
+
+
+def test_tail_lines_without_trailing_newline(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("a\nb\nc")
+    assert tail_lines(str(log), 2, block_size=1) == ["b", "c"]
+
+
+def test_index_filters_and_picks_up_appends(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text(conversion(1, "Pressure") + conversion(2, "Mass", "bob") + "not a log line\n")
+    index = LogIndex(str(log))
+    try:
+        assert index.query(category="pressure") == [conversion(1, "Pressure").rstrip("\n")]
+        with open(log, "a") as f:
+            f.write(conversion(3, "Pressure", "bob") + "2025-10-07 17:17:04,0")  # last line half-written
+        assert index.query(user="bob") == [conversion(3, "Pressure", "bob").rstrip("\n"),
+                                          conversion(2, "Mass", "bob").rstrip("\n")]
+        assert index.query(limit=1, page=1, category="Pressure") == [conversion(1, "Pressure").rstrip("\n")]
+        assert index.categories() == ["mass", "pressure"]
+    finally:
+        index.close()
+
+
+def test_index_starts_over_after_rotation(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text(conversion(1, "Pressure") * 3)
+    index = LogIndex(str(log))
+    try:
+        assert len(index.query(category="pressure")) == 3
+        os.replace(log, tmp_path / "app.log.1")  # what a rotating handler does
+        log.write_text(conversion(2, "Mass") * 5)  # already past the old indexed offset
+        assert index.query(category="pressure") == []
+        assert index.query(category="mass") == [conversion(2, "Mass").rstrip("\n")] * 5
+    finally:
+        index.close()
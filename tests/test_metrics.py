@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+import metrics
+import unit_core
+import unit_engine
+
+
+def test_counts_survive_concurrent_calls():
+    collected = metrics.enable(sample_every=1)
+    try:
+        plan = unit_core.compile_conversion("pressure", "psi", "kpa")
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            for _ in range(2000):
+                plan(1.0)
+                unit_core.convert_value(1.0, "psi", "kpa", "pressure")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = collected.snapshot()["pressure:psi->kpa"]
+        assert stats["calls"] == stats["values"] == stats["sampled"] == 32000
+    finally:
+        metrics.disable()
+    assert unit_core.convert_value(1.0, "bar", "pa", "pressure") == 1e5
+
+
+def test_pairs_are_keyed_by_units_not_plan_objects():
+    collected = metrics.enable()
+    try:
+        for _ in range(3):
+            unit_core.compile_conversion("length", "M", "ft")(1.0)
+        unit_engine.convert_units(1.0, "kN·m", "N·m")
+        assert collected.snapshot()["length:m->ft"]["calls"] == 3
+        assert len(collected.pairs) == 2
+    finally:
+        metrics.disable()
+
+
+def test_temperature_plans_are_counted_once_and_stay_exact():
+    collected = metrics.enable()
+    try:
+        assert unit_core.convert_value(451, "C", "F", "temperature") == 843.8
+        unit_core.compile_conversion("temperature", "c", "f")(451)
+        assert collected.snapshot()["temperature:c->f"]["calls"] == 2
+    finally:
+        metrics.disable()
+    assert type(unit_core.compile_conversion("temperature", "c", "f")) is unit_core.TemperaturePlan
+
+
+def test_sampling_times_one_call_in_n():
+    collected = metrics.enable(sample_every=10)
+    try:
+        for _ in range(100):
+            unit_core.convert_value(1.0, "bar", "kpa", "pressure")
+        stats = collected.snapshot()["pressure:bar->kpa"]
+        assert (stats["calls"], stats["sampled"]) == (100, 10)
+    finally:
+        metrics.disable()
+
+
+def test_server_requests_are_timed():
+    import registry
+    import server
+
+    collected = metrics.enable()
+    try:
+        for _ in range(5):
+            assert server.handle_convert({"value": 100, "from": "psi", "to": "kpa"})["result"] == pytest.approx(689.4757)
+        server.REGISTRY = registry  # the --registry path hands out snapshot plans
+        server.handle_convert({"value": 1, "from": "ft", "to": "m"})
+        stats = collected.snapshot()
+        assert stats["pressure:psi->kpa"]["sampled"] == 5
+        assert stats["pressure:psi->kpa"]["seconds"] > 0
+        assert stats["length:ft->m"]["sampled"] == 1
+        assert "unit_conversion_seconds_count" in metrics.prometheus()
+    finally:
+        server.REGISTRY = None
+        metrics.disable()
@@ -0,0 +1,27 @@
+import pytest
+
+from pipeline import Pipeline
+from unit_core import convert_temperature
+
+
+def test_chained_conversions_fuse_into_one_plan():
+    plan = Pipeline().convert("psi", "kpa").convert("kpa", "bar").compile()
+    assert (plan.from_unit, plan.to_unit) == ("psi", "bar")
+    assert plan(100.0) == pytest.approx(6.89476)
+
+
+def test_units_must_chain():
+    pipeline = Pipeline().convert("psi", "kpa")
+    with pytest.raises(ValueError, match="does not follow"):
+        pipeline.convert("ft", "m")
+    assert pipeline.to_unit == "kpa"
+
+
+def test_absolute_and_delta_temperatures_do_not_mix():
+    plan = Pipeline().convert("F", "K").scale(1.0).convert("K", "C").compile()
+    assert plan(451.0) == pytest.approx(convert_temperature(451.0, "f", "c"))
+    with pytest.raises(ValueError, match="delta"):
+        Pipeline().convert("F", "K").delta("K", "C")
+    with pytest.raises(ValueError, match="absolute"):
+        Pipeline().delta("F", "K").convert("K", "C")
+    assert Pipeline().delta("F", "K").delta("K", "C")(9.0) == pytest.approx(5.0)
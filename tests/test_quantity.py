@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+import quantity
+from quantity import Quantity, intern_unit
+
+
+def test_product_and_quotient_reduce_to_known_units():
+    x, s = Quantity(2.0, "m"), Quantity(1.0, "s")
+    for _ in range(500):
+        x = x * s / s
+    assert x.unit == "m"
+    assert x.unit_id == intern_unit("m")
+    assert (Quantity(3.0, "N") * Quantity(2.0, "m")).to("J").magnitude == 6.0
+
+
+def test_units_keep_the_spelling_they_were_given():
+    assert intern_unit("meter") == intern_unit("meter") != intern_unit("m")
+    assert Quantity(1.0, "meter").to("m").magnitude == 1.0
+    assert Quantity(5.0, "N·m").unit == "N·m"
+    assert Quantity(2.0, "kN") * Quantity(1.0, "m") == Quantity(2.0, "kJ")
+    assert Quantity(1.0, "kJ").unit == "kJ"
+    assert (Quantity(1.0, "1 m") * Quantity(1.0, "s")).to("m·s").magnitude == 1.0
+
+
+def test_concurrent_interning_gives_consistent_ids():
+    names = [f"{n} m" for n in range(2, 60)]
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for name in names:
+            intern_unit(name)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for name in names:
+        unit_id = quantity.UNIT_IDS[name]
+        assert quantity.UNIT_OBJECTS[unit_id].factor == float(name.split()[0])
+
+
+def test_comparisons_with_other_types():
+    assert (Quantity(1.0, "m") == 1) is False
+    with pytest.raises(TypeError):
+        Quantity(1.0, "m") < 1
+    assert Quantity(1.0, "km") > Quantity(999.0, "m")
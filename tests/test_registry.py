@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+import registry
+
+
+def write(tmp_path, config):
+    path = tmp_path / "units.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return str(path)
+
+
+def test_mixed_case_keys_are_accepted(tmp_path):
+    path = write(tmp_path, {"Temperature": {"C": "Celsius", "K": "Kelvin"}, "Power": {"W": 1, "kW": 1000}})
+    snapshot = registry.RegistrySnapshot(registry.load_config(path))
+    assert snapshot.compile("power", "kW", "W")(2.0) == 2000.0
+    assert snapshot.compile("temperature", "c", "k")(0.0) == pytest.approx(273.15)
+
+
+def test_keys_differing_only_by_case_are_rejected(tmp_path):
+    path = write(tmp_path, {"power": {"mW": 0.001, "MW": 1e6}})
+    with pytest.raises(ValueError, match="more than once"):
+        registry.load_config(path)
+    path = write(tmp_path, {"Power": {"W": 1}, "power": {"W": 1}})
+    with pytest.raises(ValueError, match="more than once"):
+        registry.load_config(path)
+
+
+def test_non_finite_factors_keep_the_old_snapshot(tmp_path):
+    path = tmp_path / "units.json"
+    path.write_text('{"length": {"m": 1, "ft": NaN, "yd": Infinity}}', encoding="utf-8")
+    assert registry.main(["check", str(path)]) == 1
+    before = registry.current()
+    with pytest.raises(ValueError, match="finite"):
+        registry.reload(str(path))
+    assert registry.current() is before
+
+
+def test_front_ends_follow_the_published_snapshot():
+    import bulk_convert
+
+    original = registry.current()
+    try:
+        registry.publish(registry.RegistrySnapshot({"length": {"m": 1, "furlong": 201.168}}, 99))
+        assert bulk_convert.compile_conversion("length", "furlong", "m")(1.0) == 201.168
+        assert bulk_convert.find_category("furlong", "m") == "length"
+    finally:
+        registry.publish(original)
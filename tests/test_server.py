@@ -0,0 +1,59 @@
+import asyncio
+import json
+
+import pytest
+
+import server
+
+
+async def exchange(request):
+    # Serve one connection on an ephemeral port and return the raw response
+    conversion_server = server.ConversionServer()
+    listener = await asyncio.start_server(conversion_server.handle_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+    return response
+
+
+def status_of(response):
+    return int(response.split(b" ", 2)[1])
+
+
+def post(headers, body=b""):
+    return (b"POST /convert HTTP/1.1\r\nHost: x\r\n" + headers + b"\r\n" + body)
+
+
+def test_convert_round_trip():
+    body = json.dumps({"value": 1, "from": "kpa", "to": "pa"}).encode()
+    response = asyncio.run(exchange(post(b"Connection: close\r\nContent-Length: %d\r\n" % len(body), body)))
+    assert status_of(response) == 200
+    assert json.loads(response.split(b"\r\n\r\n", 1)[1]) == {"result": 1000.0}
+
+
+def test_bad_content_length_is_rejected():
+    for value in (b"-1", b"+5", b"1_0", b"abc"):
+        response = asyncio.run(exchange(post(b"Content-Length: " + value + b"\r\n")))
+        assert status_of(response) == 400, value
+
+
+def test_transfer_encoding_is_rejected():
+    response = asyncio.run(exchange(post(b"Transfer-Encoding: chunked\r\n", b"5\r\nhello\r\n0\r\n\r\n")))
+    assert status_of(response) == 411
+    response = asyncio.run(exchange(post(b"Transfer-Encoding: gzip\r\n")))
+    assert status_of(response) == 501
+
+
+def test_integer_past_float_range_is_an_item_error():
+    huge = 10 ** 400
+    with pytest.raises(server.HTTPError) as raised:
+        server.handle_convert({"value": huge, "from": "kpa", "to": "pa"})
+    assert raised.value.status == 422
+    batch = server.dispatch("POST", "/convert/batch", json.dumps(
+        {"items": [{"value": huge, "from": "kpa", "to": "pa"}, {"value": 1, "from": "kpa", "to": "pa"}]}))
+    assert batch["results"] == [None, 1000.0]
+    assert batch["errors"] == [{"index": 0, "error": "'value' must be a finite number."}]
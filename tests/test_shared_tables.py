@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+import shared_tables
+import unit_core
+from unit_core import CONVERSIONS, compile_conversion, find_category
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+
+@pytest.fixture(scope="module")
+def tables():
+    with shared_tables.publish() as published:
+        attached = shared_tables.SharedTables(published.name)
+        try:
+            yield attached
+        finally:
+            attached.close()
+
+
+def same_plan(shared, core):
+    return (type(shared), shared.category, shared.from_unit, shared.to_unit, shared.scale, shared.offset) == \
+        (type(core), core.category, core.from_unit, core.to_unit, core.scale, core.offset)
+
+
+def test_every_pair_matches_unit_core(tables):
+    for category, units in CONVERSIONS.items():
+        for a in units:
+            for b in units:
+                assert same_plan(tables.compile_conversion(category, a, b), compile_conversion(category, a, b))
+
+
+@pytest.mark.parametrize("category, from_unit, to_unit", [
+    ("pressure", "PSI", "kPa"), ("temperature", "°F", "C"), ("length", "inch", "ft"), ("force", "Newton", "lbf"),
+])
+def test_aliases_match_unit_core(tables, category, from_unit, to_unit):
+    assert same_plan(tables.compile_conversion(category, from_unit, to_unit),
+                     compile_conversion(category, from_unit, to_unit))
+    assert tables.find_category(from_unit, to_unit) == find_category(from_unit, to_unit) == category
+    assert tables.convert_value(212, from_unit, to_unit, category) == unit_core.convert_value(
+        212, from_unit, to_unit, category)
+
+
+def test_errors_match_unit_core(tables):
+    for call in (tables.compile_conversion, compile_conversion):
+        with pytest.raises(ValueError, match="Unknown category"):
+            call("speed", "m", "ft")
+        with pytest.raises(ValueError, match="Invalid unit entered"):
+            call("length", "m", "furlong")
+    with pytest.raises(ValueError, match="No category"):
+        tables.find_category("m", "kg")
+
+
+def test_published_name_is_exported_for_workers():
+    with shared_tables.publish() as published:
+        assert os.environ[shared_tables.ENV_VAR] == published.name
+    assert shared_tables.ENV_VAR not in os.environ
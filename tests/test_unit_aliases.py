@@ -0,0 +1,31 @@
+import pytest
+
+import unit_engine
+from unit_aliases import INDEX, resolve_unit
+
+
+def test_prefix_case_is_not_folded():
+    assert resolve_unit("Mm") == "Mm"
+    assert unit_engine.convert_units(1, "Mm", "m") == 1e6
+    assert unit_engine.convert_units(1, "mm", "m") == 0.001
+    assert INDEX.get("MM") is None
+
+
+def test_alias_names_are_case_folded():
+    assert resolve_unit("Meter") == "m"
+    assert resolve_unit("PSI") == "psi"
+    assert resolve_unit("Kpa") == "kPa"
+    assert resolve_unit("mW") == "mW"
+    assert resolve_unit("mw") == "MW"
+
+
+def test_misses_are_cached_without_suggestions(monkeypatch):
+    calls = []
+    monkeypatch.setattr(INDEX, "suggest", lambda name, n=3: calls.append(name) or [])
+    assert INDEX.get("not-a-unit") is None
+    assert INDEX.get("not-a-unit", "x") == "x"
+    assert calls == []
+    assert "not-a-unit" in INDEX._misses
+    with pytest.raises(ValueError, match="Unknown unit"):
+        resolve_unit("not-a-unit")
+    assert calls == ["not-a-unit"]
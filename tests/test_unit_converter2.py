@@ -0,0 +1,50 @@
+import io
+import sys
+
+import pytest
+
+import UnitConverter2
+from UnitConverter2 import expr_main, run_expressions
+
+
+def run(text):
+    out = io.StringIO()
+    failed = run_expressions(text, out)
+    return out.getvalue().splitlines(), failed
+
+
+def test_semicolons_and_newlines_both_split():
+    lines, failed = run("12 ft to m; 1 kN in N\n\n 2 kg -> g;")
+    assert failed == 0
+    assert lines == ["12 ft = 3.657600 m", "1 kN = 1000.000000 N", "2 kg = 2000.000000 g"]
+
+
+def test_bad_expressions_leave_an_empty_line(capsys):
+    lines, failed = run("x ft to m; 1 ft to kg; 1 ft m; 32 F → C")
+    assert failed == 3
+    assert lines == ["", "", "", "32 F = 0.000000 C"]
+    err = capsys.readouterr().err
+    assert "⚠️ x ft to m" in err and "Can't convert ft to kg." in err
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("100 psi in kPa", "100 psi = 689.475729 kPa"),
+    ("1 N·m to lbf·ft", "1 N·m = 0.737562 lbf·ft"),
+])
+def test_category_is_inferred_from_the_units(expression, expected):
+    assert run(expression) == ([expected], 0)
+
+
+def test_exit_code_from_arguments(capsys):
+    assert expr_main(["1", "m", "to", "cm"]) == 0
+    assert capsys.readouterr().out == "1 m = 100.000000 cm\n"
+    assert expr_main(["1", "m", "to", "kg"]) == 1
+
+
+def test_stdin_blocks(monkeypatch, capsys):
+    monkeypatch.setattr(UnitConverter2, "BATCH_BYTES", 16)  # several blocks
+    stdin = io.TextIOWrapper(io.BytesIO(b"1 m to cm\n2 m to cm\nbad\n3 m to mm\n"), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert expr_main([]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "1 m = 100.000000 cm", "2 m = 200.000000 cm", "", "3 m = 3000.000000 mm"]
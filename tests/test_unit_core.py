@@ -0,0 +1,54 @@
+import pytest
+
+import registry
+from unit_core import compile_conversion, convert_temperature, convert_value
+
+
+@pytest.mark.parametrize("value, from_unit, to_unit", [
+    (451, "c", "f"), (32, "k", "f"), (98.6, "f", "c"), (-40, "f", "k"), (300, "k", "c"), (25, "c", "k"),
+])
+def test_temperature_matches_the_baseline_formulas(value, from_unit, to_unit):
+    expected = convert_temperature(value, from_unit, to_unit)
+    assert convert_value(value, from_unit.upper(), to_unit.upper(), "temperature") == expected
+    assert registry.convert_value(value, from_unit, to_unit, "temperature") == expected
+
+
+def test_known_baseline_values():
+    assert convert_value(451, "C", "F", "temperature") == 843.8
+    assert convert_value(32, "K", "F", "temperature") == -402.07
+
+
+def test_temperature_arrays_use_the_same_formula():
+    np = pytest.importorskip("numpy")
+    plan = compile_conversion("temperature", "c", "f")
+    values = np.array([451.0, 0.0, -40.0])
+    assert plan.apply(values).tolist() == [843.8, 32.0, -40.0]
+    plan.apply(values, out=values)
+    assert values.tolist() == [843.8, 32.0, -40.0]
+
+
+@pytest.mark.parametrize("category, from_unit, to_unit, engine_from, engine_to", [
+    ("pressure", "psi", "kpa", "psi", "kPa"),
+    ("mass", "lb", "kg", "lb", "kg"),
+    ("force", "lbf", "n", "lbf", "N"),
+    ("volume", "in3", "l", "in3", "L"),
+    ("length", "ft", "in", "ft", "in"),
+])
+def test_units_have_one_factor_everywhere(category, from_unit, to_unit, engine_from, engine_to):
+    import unit_engine
+
+    expected = convert_value(100, from_unit, to_unit, category)
+    assert unit_engine.convert_units(100, engine_from, engine_to) == expected
+
+
+def test_cli_tables_match_the_core():
+    import UnitConverter
+    import UnitConverter2
+    import unit_engine
+
+    assert UnitConverter2.convert_pressure(100, "psi", "kPa") == convert_value(100, "psi", "kpa", "pressure")
+    assert UnitConverter2.convert_mass(100, "lb", "kg") == convert_value(100, "lb", "kg", "mass")
+    assert UnitConverter.convert_force(100, "lbf", "N") == convert_value(100, "lbf", "n", "force")
+    assert unit_engine.convert_units(1, "lbf/in^2", "psi") == 1.0
+    assert UnitConverter.convert_torque(1, "lbf·ft", "N·m") == pytest.approx(
+        convert_value(1, "lbf", "n", "force") * convert_value(1, "ft", "m", "length"))
@@ -0,0 +1,158 @@
+import sys
+import time
+from difflib import get_close_matches
+
+import unit_engine
+from unit_engine import UNITS
+
+# ------------------------------
+# 🏷️ Accepted Spellings
+# ------------------------------
+# Canonical IDs are the unit_engine symbols, plus C/F for offset temperatures (see convert_temperature)
+ALIASES = {
+    "m": ["meter", "meters", "metre", "metres"],
+    "in": ["inch", "inches", '"'],
+    "ft": ["foot", "feet", "'"],
+    "kg": ["kilogram", "kilograms"],
+    "g": ["gram", "grams"],
+    "lb": ["lbs", "lbm", "pound", "pounds"],
+    "tonne": ["t", "tonnes", "metric ton"],
+    "s": ["sec", "second", "seconds"],
+    "min": ["minute", "minutes"],
+    "h": ["hr", "hour", "hours"],
+    "K": ["kelvin", "degK"],
+    "C": ["°C", "degC", "celsius"],
+    "F": ["°F", "degF", "fahrenheit"],
+    "N": ["newton", "newtons", "n"],
+    "kN": ["kn"],
+    "lbf": ["pound-force"],
+    "Pa": ["pascal", "pascals", "pa"],
+    "kPa": ["kpa"],
+    "psi": ["PSI"],
+    "L": ["liter", "liters", "litre", "litres", "l"],
+    "J": ["joule", "joules", "j"],
+    "kJ": ["kj"],
+    "Wh": ["wh"],
+    "kWh": ["kwh"],
+    "cal": ["calorie", "calories"],
+    "W": ["watt", "watts", "w"],
+    "kW": ["kw"],
+    "MW": ["mw"],  # Converter.py spells megawatt "mw"; milliwatt is still reachable as "mW"
+    "MJ": ["mj"],
+    "hp": ["horsepower"],
+}
+# Lower-case entries above are the CONVERSIONS keys of Converter.py, so "Kpa" or "KN" from old logs
+# still resolve. Symbols themselves are case-sensitive: "Mm" is a megametre, never a millimetre.
+TEMPERATURE_IDS = ("C", "F")
+
+# SI prefixes that may be put in front of any PREFIXABLE unit; expanded lazily on first lookup
+PREFIXES = {"µ": 1e-6, "μ": 1e-6, "u": 1e-6, "m": 1e-3, "k": 1e3, "M": 1e6, "G": 1e9}
+PREFIX_SPELLING = {"μ": "µ", "u": "µ"}
+PREFIXABLE = ("m", "g", "s", "A", "N", "Pa", "J", "W", "Wh", "L", "bar")
+MISS_CACHE_SIZE = 4096
+
+
+def case_variants(name):
+    return {name, name.lower(), name.upper(), name.capitalize()}
+
+
+# ------------------------------
+# 📇 Alias Index
+# ------------------------------
+class AliasIndex:
+    def __init__(self, canonical_ids, aliases):
+        start = time.perf_counter()
+        self._index = {}
+        self._spellings = {}  # explicit spellings, used by the suggestion path
+        self._misses = set()  # names known not to resolve, so repeated misses stay one lookup
+
+        for unit_id in canonical_ids:
+            self._claim(sys.intern(unit_id), [unit_id] + aliases.get(unit_id, []))
+
+        # Case variants of alias names only fill gaps, and are dropped when two units would share one
+        owners = {}
+        for unit_id in canonical_ids:
+            for spelling in aliases.get(unit_id, []):
+                for variant in case_variants(spelling):
+                    owners.setdefault(variant, set()).add(unit_id)
+        for variant, units in owners.items():
+            if variant not in self._index and len(units) == 1:
+                self._index[variant] = next(iter(units))
+
+        self.prebuilt = len(self._index)
+        self.build_seconds = time.perf_counter() - start
+
+    def _claim(self, unit_id, spellings):
+        for spelling in spellings:
+            self._index[spelling] = unit_id
+            self._spellings[spelling] = unit_id
+
+    def resolve(self, name):
+        # One hash lookup for every prebuilt or previously expanded spelling
+        unit_id = self._lookup(name)
+        if unit_id is None:
+            suggestions = self.suggest(name)
+            hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+            raise ValueError(f"Unknown unit: {name}.{hint}")
+        return unit_id
+
+    def get(self, name, default=None):
+        unit_id = self._lookup(name)
+        return default if unit_id is None else unit_id
+
+    def _lookup(self, name):
+        unit_id = self._index.get(name)
+        if unit_id is None and name not in self._misses:
+            unit_id = self._expand(name)
+            if unit_id is None:
+                if len(self._misses) >= MISS_CACHE_SIZE:
+                    self._misses.clear()
+                self._misses.add(name)
+        return unit_id
+
+    def _expand(self, name):
+        stripped = name.strip()
+        if stripped != name and stripped in self._index:
+            return self._index[stripped]
+        for prefix, scale in PREFIXES.items():
+            base = stripped[len(prefix):]
+            if stripped.startswith(prefix) and base in PREFIXABLE:
+                unit_id = sys.intern(PREFIX_SPELLING.get(prefix, prefix) + base)
+                if unit_id not in UNITS:
+                    UNITS[unit_id] = unit_engine.Unit(scale * UNITS[base].factor, UNITS[base].dims)
+                self._index[name] = self._index[unit_id] = unit_id
+                return unit_id
+        return None
+
+    def suggest(self, name, n=3):
+        # Near-miss spellings, compared case-insensitively; returns canonical IDs
+        folded = {spelling.casefold(): unit_id for spelling, unit_id in self._spellings.items()}
+        matches = get_close_matches(name.casefold(), list(folded), n=n * 2, cutoff=0.6)
+        return list(dict.fromkeys(folded[match] for match in matches))[:n]
+
+    def expand_prefixes(self):
+        # Materialize every SI-prefixed spelling now instead of on first use (e.g. before exporting)
+        for prefix in PREFIXES:
+            for base in PREFIXABLE:
+                self.resolve(prefix + base)
+
+    def items(self):
+        # (spelling, canonical ID) for every prebuilt or expanded spelling
+        return list(self._index.items())
+
+    def stats(self):
+        index_bytes = sys.getsizeof(self._index) + sum(sys.getsizeof(key) for key in self._index)
+        return {
+            "entries": len(self._index),
+            "prebuilt": self.prebuilt,
+            "expanded": len(self._index) - self.prebuilt,
+            "build_seconds": self.build_seconds,
+            "bytes": index_bytes,
+        }
+
+
+INDEX = AliasIndex(list(UNITS) + list(TEMPERATURE_IDS), ALIASES)
+
+
+def resolve_unit(name):
+    return INDEX.resolve(name)
@@ -0,0 +1,198 @@
+from functools import lru_cache
+
+# ------------------------------
+# 🧩 Conversion Core
+# ------------------------------
+# Registry, compiled plans and conversion functions only: importing this module opens no files,
+# configures no logging and pulls in nothing beyond functools. Front ends (Converter.py, the
+# Streamlit apps, bulk_convert, server) add logging, storage and UI on top.
+
+# ------------------------------
+# ⚙️ Conversion Dictionaries
+# ------------------------------
+# Imperial units from their legal definitions. unit_engine and the CLI tables use these same
+# constants, so a unit has one factor whichever front end converts it (and psi is exactly lbf/in^2).
+INCH = 0.0254  # m
+FOOT = 0.3048  # m
+POUND = 0.45359237  # kg
+STANDARD_GRAVITY = 9.80665  # m/s^2
+LBF = STANDARD_GRAVITY * POUND  # N
+PSI = LBF / INCH ** 2  # Pa
+CUBIC_INCH = INCH ** 3  # m^3
+
+CONVERSIONS = {
+    "length": {"m": 1, "cm": 0.01, "mm": 0.001, "km": 1000, "in": INCH, "ft": FOOT},
+    "mass": {"kg": 1, "g": 0.001, "lb": POUND, "tonne": 1000},
+    "force": {"n": 1, "kn": 1000, "lbf": LBF},
+    "pressure": {"pa": 1, "kpa": 1000, "bar": 1e5, "psi": PSI},
+    "volume": {"m3": 1, "l": 0.001, "cm3": 1e-6, "in3": CUBIC_INCH},
+    "energy": {"j": 1, "kj": 1000, "mj": 1e6, "wh": 3600, "kwh": 3.6e6},
+    "power": {"w": 1, "kw": 1000, "mw": 1e6, "hp": 745.7},
+    "temperature": {"c": "Celsius", "f": "Fahrenheit", "k": "Kelvin"}
+}
+
+# ------------------------------
+# 🔄 Conversion Functions
+# ------------------------------
+def convert_value(value, from_unit, to_unit, category):
+    # Case-insensitive units; validation happens once per pair in compile_conversion
+    return compile_conversion(category, from_unit, to_unit)(value)
+
+def convert_temperature(value, from_unit, to_unit):
+    if from_unit == to_unit:
+        return value
+
+    # Convert to Celsius first
+    if from_unit == "f":
+        value = (value - 32) * 5 / 9
+    elif from_unit == "k":
+        value = value - 273.15
+
+    # Convert from Celsius to target
+    if to_unit == "f":
+        return (value * 9 / 5) + 32
+    elif to_unit == "k":
+        return value + 273.15
+    else:
+        return value
+
+# ------------------------------
+# 📦 Batch Conversion
+# ------------------------------
+# Each temperature unit as (scale, offset) affine maps to and from Celsius
+TO_CELSIUS = {"c": (1.0, 0.0), "f": (5 / 9, -32 * 5 / 9), "k": (1.0, -273.15)}
+FROM_CELSIUS = {"c": (1.0, 0.0), "f": (9 / 5, 32.0), "k": (1.0, 273.15)}
+
+def temperature_affine(from_unit, to_unit):
+    # (scale, offset) such that convert_temperature(v) == v * scale + offset
+    if from_unit == to_unit:
+        return 1.0, 0.0
+    to_scale, to_offset = TO_CELSIUS[from_unit]
+    from_scale, from_offset = FROM_CELSIUS[to_unit]
+    return to_scale * from_scale, to_offset * from_scale + from_offset
+
+def convert_array(values, from_unit, to_unit, category, out=None):
+    # One vectorized pass over a NumPy array (or any buffer) for a single unit pair
+    return compile_conversion(category, from_unit, to_unit).apply(values, out=out)
+
+def convert_many(values, from_unit, to_unit, category):
+    # Plain-iterable front end: returns a list and doesn't need NumPy
+    plan = compile_conversion(category, from_unit, to_unit)
+    return [plan(value) for value in values]
+
+# ------------------------------
+# 🧮 Compiled Conversion Plans
+# ------------------------------
+def _pair_affine(category, from_unit, to_unit):
+    if category == "temperature":
+        return temperature_affine(from_unit, to_unit)
+    units = CONVERSIONS[category]
+    return units[from_unit] / units[to_unit], 0.0
+
+# Per-category N×N (scale, offset) matrix, built once at import
+UNIT_INDEX = {
+    category: {unit: i for i, unit in enumerate(units)}
+    for category, units in CONVERSIONS.items()
+}
+FACTOR_MATRIX = {
+    category: [[_pair_affine(category, a, b) for b in index] for a in index]
+    for category, index in UNIT_INDEX.items()
+}
+
+class ConversionPlan:
+    # A validated unit pair reduced to value * scale + offset
+    __slots__ = ("category", "from_unit", "to_unit", "scale", "offset")
+
+    def __init__(self, category, from_unit, to_unit, scale, offset=0.0):
+        self.category = category
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.scale = scale
+        self.offset = offset
+
+    def __call__(self, value):
+        return value * self.scale + self.offset
+
+    def apply(self, values, out=None):
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64) if out is None else np.asarray(values)
+        result = np.multiply(values, self.scale, out=out)
+        if self.offset:
+            np.add(result, self.offset, out=result)
+        return result
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self.category!r}, {self.from_unit!r} → {self.to_unit!r}, "
+                f"scale={self.scale!r}, offset={self.offset!r})")
+
+class TemperaturePlan(ConversionPlan):
+    # Keeps scale/offset for fused pipelines, but evaluates convert_temperature's own steps, so
+    # results match it to the last digit (451 C → 843.8 F, where v * 1.8 + 32 gives 843.8000000000001)
+    __slots__ = ()
+
+    def __call__(self, value):
+        return convert_temperature(value, self.from_unit, self.to_unit)
+
+    def apply(self, values, out=None):
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64) if out is None else np.asarray(values)
+        result = convert_temperature(values, self.from_unit, self.to_unit)
+        if out is None:
+            return np.array(result, dtype=np.float64)  # a copy even when the units are equal
+        np.copyto(out, result)
+        return out
+
+def _legacy_key(unit, index):
+    # Other spellings ("inch", "Newton", "°C") resolve through the alias index on a cache miss
+    if unit in index:
+        return unit
+    from unit_aliases import INDEX
+
+    unit_id = INDEX.get(unit)
+    return unit_id.lower() if unit_id else unit
+
+# ------------------------------
+# 🔌 Plan Hook
+# ------------------------------
+# metrics.enable() installs a function that wraps every plan handed out (here, by registry snapshots,
+# shared tables and unit_engine); with no hook, plans go out as compiled and cost nothing extra.
+_plan_hook = None
+
+def set_plan_hook(hook):
+    global _plan_hook
+    _plan_hook = hook
+
+def observe(plan):
+    return plan if _plan_hook is None else _plan_hook(plan)
+
+def compile_conversion(category, from_unit, to_unit):
+    plan = _compile_plan(category, from_unit, to_unit)
+    return plan if _plan_hook is None else _plan_hook(plan)
+
+@lru_cache(maxsize=1024)
+def _compile_plan(category, from_unit, to_unit):
+    from_unit = from_unit.lower()
+    to_unit = to_unit.lower()
+
+    if category not in UNIT_INDEX:
+        raise ValueError(f"Unknown category: {category}")
+    index = UNIT_INDEX[category]
+    from_unit = _legacy_key(from_unit, index)
+    to_unit = _legacy_key(to_unit, index)
+    if from_unit not in index or to_unit not in index:
+        raise ValueError("Invalid unit entered.")
+
+    scale, offset = FACTOR_MATRIX[category][index[from_unit]][index[to_unit]]
+    plan_type = TemperaturePlan if category == "temperature" else ConversionPlan
+    return plan_type(category, from_unit, to_unit, scale, offset)
+
+@lru_cache(maxsize=1024)
+def find_category(from_unit, to_unit):
+    # First category that knows both units (any spelling the alias index accepts)
+    for category, index in UNIT_INDEX.items():
+        if (_legacy_key(from_unit.lower(), index) in index
+                and _legacy_key(to_unit.lower(), index) in index):
+            return category
+    raise ValueError(f"No category has both '{from_unit}' and '{to_unit}'.")
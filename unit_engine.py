@@ -0,0 +1,237 @@
+import re
+from functools import lru_cache
+
+from unit_core import FOOT, INCH, POUND, STANDARD_GRAVITY, ConversionPlan, observe
+
+# ------------------------------
+# 📐 Dimensions
+# ------------------------------
+# Every unit is a factor to SI base units plus an exponent per base dimension
+BASE_DIMENSIONS = ("m", "kg", "s", "K", "A")
+DIMENSIONLESS = (0,) * len(BASE_DIMENSIONS)
+
+
+class Unit:
+    __slots__ = ("factor", "dims")
+
+    def __init__(self, factor, dims):
+        self.factor = factor
+        self.dims = dims
+
+    def __mul__(self, other):
+        return Unit(self.factor * other.factor, tuple(a + b for a, b in zip(self.dims, other.dims)))
+
+    def __truediv__(self, other):
+        return Unit(self.factor / other.factor, tuple(a - b for a, b in zip(self.dims, other.dims)))
+
+    def __pow__(self, power):
+        return Unit(self.factor ** power, tuple(a * power for a in self.dims))
+
+    def __eq__(self, other):
+        return isinstance(other, Unit) and self.factor == other.factor and self.dims == other.dims
+
+    def __hash__(self):
+        return hash((self.factor, self.dims))
+
+    @property
+    def canonical(self):
+        # SI base form, e.g. kg·m^-1·s^-2 for any pressure unit
+        parts = []
+        for symbol, power in zip(BASE_DIMENSIONS, self.dims):
+            if power == 1:
+                parts.append(symbol)
+            elif power:
+                parts.append(f"{symbol}^{power}")
+        return "·".join(parts) or "1"
+
+    def __repr__(self):
+        return f"Unit({self.factor!r}, {self.canonical})"
+
+
+def _base(index):
+    dims = [0] * len(BASE_DIMENSIONS)
+    dims[index] = 1
+    return Unit(1.0, tuple(dims))
+
+
+# ------------------------------
+# 📚 Unit Definitions
+# ------------------------------
+# Defined in terms of base units or earlier entries, so derived units are never typed in twice;
+# imperial constants come from unit_core, so CONVERSIONS uses the very same factors
+DEFINITIONS = [
+    # Length
+    ("m", None), ("cm", "0.01 m"), ("mm", "0.001 m"), ("km", "1000 m"),
+    ("in", f"{INCH!r} m"), ("ft", f"{FOOT!r} m"),
+    # Mass
+    ("kg", None), ("g", "0.001 kg"), ("lb", f"{POUND!r} kg"), ("tonne", "1000 kg"),
+    # Time
+    ("s", None), ("min", "60 s"), ("h", "3600 s"),
+    # Temperature (absolute kelvin / temperature differences only; offsets live in convert_temperature)
+    ("K", None),
+    # Current
+    ("A", None),
+    # Force
+    ("N", "kg·m/s^2"), ("kN", "1000 N"), ("kgf", f"{STANDARD_GRAVITY!r} N"), ("lbf", f"{STANDARD_GRAVITY!r} lb·m/s^2"),
+    # Pressure
+    ("Pa", "N/m^2"), ("kPa", "1000 Pa"), ("MPa", "1e6 Pa"), ("bar", "1e5 Pa"),
+    ("psi", "lbf/in^2"),
+    # Volume
+    ("L", "0.001 m^3"),
+    # Energy
+    ("J", "N·m"), ("kJ", "1000 J"), ("MJ", "1e6 J"), ("cal", "4.184 J"),
+    ("Wh", "3600 J"), ("kWh", "1000 Wh"),
+    # Power
+    ("W", "J/s"), ("kW", "1000 W"), ("MW", "1e6 W"), ("hp", "745.7 W"),
+]
+
+UNITS = {}
+
+# ------------------------------
+# 🧩 Parser
+# ------------------------------
+_TOKEN = re.compile(r"\s*(?:(?P<number>\d+(?:\.\d*)?(?:e[+-]?\d+)?(?=\s))"
+                    r"|(?P<name>[A-Za-zµμ°Ω]+)(?P<power>[⁰¹²³⁴⁵⁶⁷⁸⁹]+|-?\d+)?"
+                    r"|(?P<op>[*·×/^()])|(?P<int>-?\d+))")
+_SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Cannot parse unit '{text}' at position {pos}.")
+        pos = match.end()
+        if match.group("number"):
+            tokens.append(("number", float(match.group("number"))))
+        elif match.group("name"):
+            tokens.append(("name", match.group("name")))
+            if match.group("power"):
+                tokens.append(("op", "^"))
+                tokens.append(("int", int(match.group("power").translate(_SUPERSCRIPTS))))
+        elif match.group("op"):
+            tokens.append(("op", match.group("op")))
+        else:
+            tokens.append(("int", int(match.group("int"))))
+    return tokens
+
+
+class _Parser:
+    # expr := factor (('*' | '·' | '/') factor)* ; factor := atom ('^' int)? ; atom := name | '(' expr ')'
+    def __init__(self, text, tokens):
+        self.text = text
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def error(self, message):
+        return ValueError(f"Invalid unit '{self.text}': {message}")
+
+    def parse(self):
+        scale = 1.0
+        if self.peek()[0] == "number":
+            scale = self.take()[1]
+        unit = self.expr()
+        if self.pos != len(self.tokens):
+            raise self.error(f"unexpected '{self.peek()[1]}'")
+        return Unit(scale * unit.factor, unit.dims)
+
+    def expr(self):
+        unit = self.factor()
+        while self.peek() in (("op", "*"), ("op", "·"), ("op", "×"), ("op", "/")):
+            op = self.take()[1]
+            other = self.factor()
+            unit = unit / other if op == "/" else unit * other
+        return unit
+
+    def factor(self):
+        unit = self.atom()
+        if self.peek() == ("op", "^"):
+            self.take()
+            kind, power = self.take()
+            if kind != "int":
+                raise self.error("expected an integer exponent")
+            unit = unit ** power
+        return unit
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "name":
+            return lookup_unit(value)
+        if (kind, value) == ("op", "("):
+            unit = self.expr()
+            if self.take() != ("op", ")"):
+                raise self.error("missing ')'")
+            return unit
+        raise self.error("expected a unit name")
+
+
+def lookup_unit(name):
+    unit = UNITS.get(name)
+    if unit is None:
+        # Spellings, case variants and SI prefixes go through the alias index
+        from unit_aliases import resolve_unit
+
+        unit_id = resolve_unit(name)
+        if unit_id not in UNITS:
+            raise ValueError(f"{name} is an offset temperature scale; use convert_temperature.")
+        unit = UNITS[unit_id]
+    return unit
+
+
+@lru_cache(maxsize=4096)
+def parse_unit(text):
+    # Compound expressions like kN·m, lbf/in^2 or kWh/m3; memoized so hot paths parse once
+    return _Parser(text, _tokenize(text)).parse()
+
+
+for _name, _definition in DEFINITIONS:
+    UNITS[_name] = _base(BASE_DIMENSIONS.index(_name)) if _definition is None else parse_unit(_definition)
+
+# ------------------------------
+# 🔄 Dimension-Checked Conversion
+# ------------------------------
+def compile_units(from_unit, to_unit):
+    return observe(_compile_units(from_unit, to_unit))
+
+
+@lru_cache(maxsize=1024)
+def _compile_units(from_unit, to_unit):
+    source = parse_unit(from_unit)
+    target = parse_unit(to_unit)
+    if source.dims != target.dims:
+        raise ValueError(f"Incompatible units: {from_unit} ({source.canonical}) "
+                         f"→ {to_unit} ({target.canonical})")
+    return ConversionPlan(source.canonical, from_unit, to_unit, source.factor / target.factor)
+
+
+def convert_units(value, from_unit, to_unit):
+    return compile_units(from_unit, to_unit)(value)
+
+
+def derive_category(units):
+    # Build a CONVERSIONS-style {unit: factor} table from unit expressions of one dimension
+    parsed = {name: parse_unit(name) for name in units}
+    dims = {unit.dims for unit in parsed.values()}
+    if len(dims) > 1:
+        raise ValueError(f"Units do not share one dimension: {', '.join(units)}")
+    return {name: unit.factor for name, unit in parsed.items()}
+
+
+# Categories derived from the definitions above instead of hand-typed factor tables;
+# the torque and pressure tables of UnitConverter.py and UnitConverter2.py read these
+DERIVED_CATEGORIES = {
+    "torque": derive_category(["N·m", "kN·m", "kgf·m", "lbf·ft", "lbf·in"]),
+    "pressure": derive_category(["Pa", "kPa", "MPa", "bar", "psi", "N/mm^2"]),
+    "energy density": derive_category(["J/m^3", "kJ/L", "kWh/m3"]),
+}